@@ -6,6 +6,51 @@ from abc import ABC, abstractmethod
 class Action(ABC):
     """Class to manage an action."""
 
+    __slots__ = ()
+
+    @abstractmethod
+    def get_name(self):
+        """Get name of the action.
+
+        :returns: name of the action
+        :rtype: str
+        """
+
+    @abstractmethod
+    def get_depiction(self):
+        """Get depiction of the action.
+
+        :returns: depiction of the action
+        :rtype: :class:`Depiction <sunlessadventure.abstract.depiction.Depiction>`
+        """
+
+    @abstractmethod
+    def perform(self, context):
+        """Perform an action.
+
+        :param context: state of the session, e.g. the progress of a player
+        :type: object
+        :returns: outcome of the action
+        :rtype: :class:`Outcome <sunlessadventure.abstract.outcome.Outcome>`
+        """
+
+    def get_outcome(self):
+        """Get outcome of the action without performing it.
+
+        :returns: outcome of the action or None, if it is known only after the action is performed
+        :rtype: :class:`Outcome <sunlessadventure.abstract.outcome.Outcome>`
+        """
+        return None
+
+
+class AsyncAction(ABC):
+    """Class to manage an action, which is performed asynchronously.
+
+    The methods have the semantics of the methods of :class:`Action`.
+    """
+
+    __slots__ = ()
+
     @abstractmethod
     def get_name(self):
         """Get name of the action.
@@ -23,9 +68,19 @@ class Action(ABC):
         """
 
     @abstractmethod
-    def perform(self):
+    async def perform(self, context):
         """Perform an action.
 
+        :param context: state of the session, e.g. the progress of a player
+        :type: object
         :returns: outcome of the action
         :rtype: :class:`Outcome <sunlessadventure.abstract.outcome.Outcome>`
         """
+
+    def get_outcome(self):
+        """Get outcome of the action without performing it.
+
+        :returns: outcome of the action or None, if it is known only after the action is performed
+        :rtype: :class:`Outcome <sunlessadventure.abstract.outcome.Outcome>`
+        """
+        return None
@@ -0,0 +1,31 @@
+"""Module with abstract classes to work with the context of an adventure."""
+
+from abc import ABC, abstractmethod
+
+
+class TrackedContext(ABC):
+    """Class for a context, that reports its changes.
+
+    Steps of an adventure report the changes of such a context, see :meth:`step()
+    <sunlessadventure.core.adventure.Adventure.step>`.
+    """
+
+    __slots__ = ()
+
+    @abstractmethod
+    def get_checkpoint(self):
+        """Get a checkpoint of the current state.
+
+        :returns: a cheap immutable value to compare later states with
+        :rtype: hashable
+        """
+
+    @abstractmethod
+    def get_changes(self, checkpoint):
+        """Get changes of the state since a checkpoint.
+
+        :param checkpoint: checkpoint from :meth:`get_checkpoint`
+        :type: hashable
+        :returns: JSON serializable changes by their names, empty if nothing changed
+        :rtype: dict
+        """
@@ -6,6 +6,8 @@ from abc import ABC, abstractmethod
 class Depiction(ABC):
     """Class to describe an entity."""
 
+    __slots__ = ()
+
     @abstractmethod
     def get_title(self):
         """Get title.
@@ -10,6 +10,8 @@ class LocationError(Exception):
 class Exit(ABC):
     """Class to manage an exit from a location."""
 
+    __slots__ = ()
+
     @abstractmethod
     def get_name(self):
         """Get name of the exit.
@@ -30,6 +32,8 @@ class Exit(ABC):
 class Location(ABC):
     """Class to manage a location."""
 
+    __slots__ = ()
+
     @abstractmethod
     def get_id(self):
         """Get identifier of the location.
@@ -39,21 +43,29 @@ class Location(ABC):
         """
 
     @abstractmethod
-    def visit(self):
-        """Visit the location."""
+    def visit(self, context):
+        """Visit the location.
+
+        :param context: state of the session, e.g. the progress of a player
+        :type: object
+        """
 
     @abstractmethod
-    def get_depiction(self):
+    def get_depiction(self, context):
         """Get depiction of the location.
 
+        :param context: state of the session, e.g. the progress of a player
+        :type: object
         :returns: depiction of the location
         :rtype: :class:`Depiction <sunlessadventure.abstract.depiction.Depiction>`
         """
 
     @abstractmethod
-    def get_actions(self):
+    def get_actions(self, context):
         """Get actions available in the location.
 
+        :param context: state of the session, e.g. the progress of a player
+        :type: object
         :returns: list of available actions
         :rtype: iterable with instances of :class:`Action <sunlessadventure.abstract.action.Action>`
         """
@@ -66,6 +78,30 @@ class Location(ABC):
         :rtype: :class:`Exit` or None, if there is no exit
         """
 
+    def get_state_key(self, context):
+        """Get a key of the session state the content of the location depends on.
+
+        The content of the location is its depiction, actions and exit. Equal keys must
+        correspond to equal content.
+
+        :param context: state of the session, e.g. the progress of a player
+        :type: object
+        :returns: hashable key or None, if the content must not be cached
+        :rtype: hashable
+        """
+        # pylint: disable=unused-argument
+        return None
+
+    def get_all_actions(self):
+        """Get all actions the location may offer in any session.
+
+        The order must not depend on the session, so an action can be addressed by its position.
+
+        :returns: all actions of the location or an empty tuple, if they can't be listed
+        :rtype: tuple with instances of :class:`Action <sunlessadventure.abstract.action.Action>`
+        """
+        return ()
+
 
 class LocationFactory(ABC):
     """Class to manage locations of an adventure."""
@@ -89,6 +125,14 @@ class LocationFactory(ABC):
         :rtype: str
         """
 
+    def get_location_ids(self):
+        """Get identifiers of all locations the factory can build.
+
+        :returns: identifiers of the locations or an empty tuple, if they can't be listed
+        :rtype: tuple with str
+        """
+        return ()
+
     def get_default_location(self):
         """Get the default location.
 
@@ -96,3 +140,117 @@ class LocationFactory(ABC):
         :rtype: :class:`Location`
         """
         return self.get_location(location_id=self.get_default_location_id())
+
+
+class AsyncLocation(ABC):
+    """Class to manage a location, which content is loaded asynchronously.
+
+    The methods have the semantics of the methods of :class:`Location`. The methods, that may
+    load content, are coroutines.
+    """
+
+    __slots__ = ()
+
+    @abstractmethod
+    def get_id(self):
+        """Get identifier of the location.
+
+        :returns: identifier of the location
+        :rtype: str
+        """
+
+    @abstractmethod
+    async def visit(self, context):
+        """Visit the location.
+
+        :param context: state of the session, e.g. the progress of a player
+        :type: object
+        """
+
+    @abstractmethod
+    async def get_depiction(self, context):
+        """Get depiction of the location.
+
+        :param context: state of the session, e.g. the progress of a player
+        :type: object
+        :returns: depiction of the location
+        :rtype: :class:`Depiction <sunlessadventure.abstract.depiction.Depiction>`
+        """
+
+    @abstractmethod
+    async def get_actions(self, context):
+        """Get actions available in the location.
+
+        :param context: state of the session, e.g. the progress of a player
+        :type: object
+        :returns: list of available actions
+        :rtype: iterable with instances of
+            :class:`AsyncAction <sunlessadventure.abstract.action.AsyncAction>`
+        """
+
+    @abstractmethod
+    def get_exit(self):
+        """Get exit.
+
+        :returns: information about the exit from the location
+        :rtype: :class:`Exit` or None, if there is no exit
+        """
+
+    def get_state_key(self, context):
+        """Get a key of the session state the content of the location depends on.
+
+        :param context: state of the session, e.g. the progress of a player
+        :type: object
+        :returns: hashable key or None, if the content must not be cached
+        :rtype: hashable
+        """
+        # pylint: disable=unused-argument
+        return None
+
+    def get_all_actions(self):
+        """Get all actions the location may offer in any session.
+
+        :returns: all actions of the location or an empty tuple, if they can't be listed
+        :rtype: tuple with instances of
+            :class:`AsyncAction <sunlessadventure.abstract.action.AsyncAction>`
+        """
+        return ()
+
+
+class AsyncLocationFactory(ABC):
+    """Class to manage locations of an adventure, which are loaded asynchronously."""
+
+    @abstractmethod
+    async def get_location(self, location_id):
+        """Get a location by its identifier.
+
+        :param location_id: identifier of the location
+        :type: str
+        :returns: location
+        :rtype: :class:`AsyncLocation`
+        :raises: :exc:`LocationError`
+        """
+
+    @abstractmethod
+    def get_default_location_id(self):
+        """Get the identifier of the default location.
+
+        :returns: identifier of the location
+        :rtype: str
+        """
+
+    def get_location_ids(self):
+        """Get identifiers of all locations the factory can build.
+
+        :returns: identifiers of the locations or an empty tuple, if they can't be listed
+        :rtype: tuple with str
+        """
+        return ()
+
+    async def get_default_location(self):
+        """Get the default location.
+
+        :returns: location
+        :rtype: :class:`AsyncLocation`
+        """
+        return await self.get_location(location_id=self.get_default_location_id())
@@ -6,6 +6,8 @@ from abc import ABC, abstractmethod
 class Detail(ABC):
     """Class to manage a single detail of a consequence."""
 
+    __slots__ = ()
+
     @abstractmethod
     def get_description(self):
         """Get description of the detail.
@@ -26,6 +28,8 @@ class Detail(ABC):
 class Consequence(ABC):
     """Class to manage a consequence of an action."""
 
+    __slots__ = ()
+
     @abstractmethod
     def get_depiction(self):
         """Get depiction of the consequence.
@@ -50,10 +54,22 @@ class Consequence(ABC):
         :rtype: str
         """
 
+    def get_state_key(self):
+        """Get a key of the state the content of the consequence depends on.
+
+        Equal keys must correspond to equal content.
+
+        :returns: hashable key or None, if the content must not be cached
+        :rtype: hashable
+        """
+        return None
+
 
 class Outcome(ABC):
     """Class to manage a outcome of an action."""
 
+    __slots__ = ()
+
     @abstractmethod
     def get_consequences(self):
         """Get consequences.
@@ -0,0 +1,66 @@
+"""Module with classes to use synchronous actions as asynchronous ones."""
+
+from sunlessadventure.abstract.action import AsyncAction
+
+
+class SyncActionAdapter(AsyncAction):
+    """Class to use an :class:`Action <sunlessadventure.abstract.action.Action>` as
+    an :class:`AsyncAction <sunlessadventure.abstract.action.AsyncAction>`.
+
+    The adapter delegates every call to the adapted ``action`` and never suspends.
+    """
+
+    __slots__ = ("_action",)
+
+    def __init__(self, action):
+        self._action = action
+
+    def get_name(self):
+        """Get name of the action.
+
+        :returns: name of the action
+        :rtype: str
+        """
+        return self._action.get_name()
+
+    def get_depiction(self):
+        """Get depiction of the action.
+
+        :returns: depiction of the action
+        :rtype: :class:`Depiction <sunlessadventure.abstract.depiction.Depiction>`
+        """
+        return self._action.get_depiction()
+
+    async def perform(self, context):
+        """Perform an action.
+
+        :param context: state of the session, e.g. the progress of a player
+        :type: object
+        :returns: outcome of the action
+        :rtype: :class:`Outcome <sunlessadventure.abstract.outcome.Outcome>`
+        """
+        return self._action.perform(context)
+
+    def get_outcome(self):
+        """Get outcome of the action without performing it.
+
+        :returns: outcome of the action or None, if it is known only after the action is performed
+        :rtype: :class:`Outcome <sunlessadventure.abstract.outcome.Outcome>`
+        """
+        return self._action.get_outcome()
+
+    @property
+    def action(self):
+        """Adapted action."""
+        return self._action
+
+
+def adapt_actions(actions):
+    """Adapt synchronous actions.
+
+    :param actions: actions to adapt
+    :type: iterable with instances of :class:`Action <sunlessadventure.abstract.action.Action>`
+    :returns: adapted actions
+    :rtype: tuple with instances of :class:`SyncActionAdapter`
+    """
+    return tuple(SyncActionAdapter(action) for action in actions)
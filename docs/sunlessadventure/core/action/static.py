@@ -1,13 +1,16 @@
 """Module with classes to work with static actions."""
 
 from sunlessadventure.abstract.action import Action
+from sunlessadventure.core.flyweight import intern_string
 
 
 class StaticAction(Action):
     """Class to manage a static action."""
 
+    __slots__ = ("_name", "_depiction", "_outcome")
+
     def __init__(self, name, depiction, outcome):
-        self._name = str(name)
+        self._name = intern_string(name)
         self._depiction = depiction
         self._outcome = outcome
 
@@ -27,10 +30,21 @@ class StaticAction(Action):
         """
         return self._depiction
 
-    def perform(self):
+    def get_outcome(self):
+        """Get outcome of the action without performing it.
+
+        :returns: outcome of the action
+        :rtype: :class:`Outcome <sunlessadventure.abstract.outcome.Outcome>`
+        """
+        return self._outcome
+
+    def perform(self, context):
         """Perform an action.
 
+        :param context: state of the session, e.g. the progress of a player
+        :type: object
         :returns: outcome of the action
         :rtype: :class:`Outcome <sunlessadventure.abstract.outcome.Outcome>`
         """
+        # pylint: disable=unused-argument
         return self._outcome
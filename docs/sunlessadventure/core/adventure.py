@@ -1,6 +1,43 @@
 """Module to manage the status of an adventure."""
 
+import json
+from types import MappingProxyType
+
+from sunlessadventure.abstract.context import TrackedContext
 from sunlessadventure.abstract.location import LocationError
+from sunlessadventure.core.cache import DESCRIPTION_CACHE
+from sunlessadventure.core.graph import (
+    get_actions,
+    get_consequence_images,
+    get_location_images,
+    get_moves,
+)
+from sunlessadventure.core.linker import LinkedStory
+
+
+LEAVE = -1
+"""Command to leave the current location."""
+
+RESOLVE = -2
+"""Command to resolve the active consequence."""
+
+RESOLVE_ALL = -3
+"""Command to resolve the active consequence and all consequences after it."""
+
+MOVED = "moved"
+"""Event of moving to a location, its value is the identifier of the location."""
+
+CONSEQUENCE = "consequence"
+"""Event of showing a consequence, its value is the index of the consequence in the outcome.
+
+It's also the screen of a consequence, see :attr:`Step.screen`.
+"""
+
+LOCATION = "location"
+"""Screen of a location, see :attr:`Step.screen`."""
+
+_NO_CHANGES = MappingProxyType({})
+_STEPS = {}
 
 
 class AdventureError(Exception):
@@ -12,69 +49,78 @@ class AdventureStateError(Exception):
 
 
 class Adventure:
-    """Class to manage an adventure."""
-
-    def __init__(self, location_factory, start_location_id):
+    """Class to manage an adventure.
+
+    Commands and moves are recorded by an optional journal, see
+    :class:`Journal <sunlessadventure.core.journal.Journal>`. If the location factory is
+    a :class:`LinkedStory <sunlessadventure.core.linker.LinkedStory>`, the adventure moves along
+    its resolved links.
+    """
+
+    __slots__ = (
+        "_location_factory",
+        "_links",
+        "_context",
+        "_tracked_context",
+        "__location",
+        "_outcome",
+        "_consequence_index",
+        "_journal",
+    )
+
+    def __init__(self, location_factory, start_location_id, context=None, journal=None):
         self._location_factory = location_factory
+        self._links = location_factory.links if isinstance(location_factory, LinkedStory) else None
+        self._context = context
+        self._tracked_context = context if isinstance(context, TrackedContext) else None
+        self._journal = journal
 
         try:
             location = location_factory.get_location(start_location_id)
         except LocationError:
             location = location_factory.get_default_location()
-        location.visit()
+        location.visit(context)
         self.__location = location
 
         self._outcome = None
         self._consequence_index = 0
 
+        if journal is not None:
+            journal.start(self)
+
     def describe_location(self):
         """Describe the current location.
 
-        :returns: a structured description of the current location
-        :rtype: dict
+        :returns: a structured immutable description of the current location, shared between
+            sessions
+        :rtype: :class:`types.MappingProxyType`
         :raises: :exc:`AdventureStateError` if the location can't be described at the moment. For
             instance, if there is an unresolved consequence
         """
         if self._consequence is not None:
             raise AdventureStateError("There is an unresolved consequence")
 
-        location = self._location
-        location_depiction = location.get_depiction()
-
-        actions = location.get_actions()
-        described_actions = []
-        for action in actions:
-            action_depiction = action.get_depiction()
-            described_actions.append({
-                "depiction": {
-                    "image": action_depiction.get_image(),
-                    "title": action_depiction.get_title(),
-                    "description": action_depiction.get_description(),
-                },
-                "name": action.get_name(),
-            })
-
-        exit_ = location.get_exit()
-        described_exit = None
-        if exit_ is not None:
-            described_exit = exit_.get_name()
-
-        return {
-            "id": location.get_id(),
-            "depiction": {
-                "image": location_depiction.get_image(),
-                "title": location_depiction.get_title(),
-                "description": location_depiction.get_description(),
-            },
-            "actions": described_actions,
-            "exit": described_exit,
-        }
+        return DESCRIPTION_CACHE.describe_location(self._location, self._context)
+
+    def describe_location_json(self):
+        """Describe the current location in JSON.
+
+        :returns: UTF-8 encoded JSON description of the current location
+        :rtype: bytes
+        :raises: :exc:`AdventureStateError` if the location can't be described at the moment. For
+            instance, if there is an unresolved consequence
+        """
+        if self._consequence is not None:
+            raise AdventureStateError("There is an unresolved consequence")
+
+        return DESCRIPTION_CACHE.encode_location(self._location, self._context)
 
     def describe_consequence(self):
         """Describe the current consequence.
 
-        :returns: a structured description of the current consequence
-        :rtype: dict
+        :returns: a structured immutable description of the current consequence, shared between
+            sessions
+        :rtype: :class:`types.MappingProxyType`
         :raises: :exc:`AdventureStateError` if the consequence can't be described at the moment. For
             instance, if there is no consequence
         """
@@ -82,25 +128,21 @@ class Adventure:
         if consequence is None:
             raise AdventureStateError("There is no consequence")
 
-        consequence_depiction = consequence.get_depiction()
-
-        details = consequence.get_details()
-        described_details = []
-        for detail in details:
-            described_details.append({
-                "image": detail.get_image(),
-                "description": detail.get_description(),
-            })
-
-        return {
-            "depiction": {
-                "image": consequence_depiction.get_image(),
-                "title": consequence_depiction.get_title(),
-                "description": consequence_depiction.get_description(),
-            },
-            "details": described_details,
-            "resolution": consequence.get_resolution(),
-        }
+        return DESCRIPTION_CACHE.describe_consequence(consequence)
+
+    def describe_consequence_json(self):
+        """Describe the current consequence in JSON.
+
+        :returns: UTF-8 encoded JSON description of the current consequence
+        :rtype: bytes
+        :raises: :exc:`AdventureStateError` if the consequence can't be described at the moment. For
+            instance, if there is no consequence
+        """
+        consequence = self._consequence
+        if consequence is None:
+            raise AdventureStateError("There is no consequence")
+
+        return DESCRIPTION_CACHE.encode_consequence(consequence)
 
     def leave_location(self):
         """Leave the current location.
@@ -115,12 +157,14 @@ class Adventure:
         if exit_ is None:
             raise AdventureStateError("There is no exit")
 
-        self._change_location(location_id=exit_.get_target())
+        if self._journal is not None:
+            self._journal.record(self, LEAVE)
+        self._move(exit_)
 
     def perform_action(self, action_index):
         """Perform an action.
 
-        :param action_index: index of the action
+        :param action_index: index of the action, negative indices don't address actions
         :type: int
         :raises: :exc:`AdventureStateError` if the action can't be performed. For instance, if
             there is an unresolved consequence.
@@ -128,19 +172,23 @@ class Adventure:
         if self._consequence is not None:
             raise AdventureStateError("There is an unresolved consequence")
 
+        if action_index < 0:
+            raise AdventureStateError(f"There is no action at the position '{action_index}'")
         try:
-            action = self._location.get_actions()[action_index]
+            action = self._location.get_actions(self._context)[action_index]
         except IndexError as error:
             raise AdventureStateError(
                 f"There is no action at the position '{action_index}'",
             ) from error
 
-        outcome = action.perform()
+        if self._journal is not None:
+            self._journal.record(self, action_index)
+        outcome = action.perform(self._context)
         if outcome.get_consequences():
             self._outcome = outcome
             self._consequence_index = 0
         else:
-            self._change_location(location_id=outcome.get_target())
+            self._move(outcome)
 
     def resolve_consequence(self):
         """Resolve the active consequence.
@@ -152,11 +200,194 @@ class Adventure:
         if consequence is None:
             raise AdventureStateError("There is no consequence")
 
+        if self._journal is not None:
+            self._journal.record(self, RESOLVE)
         self._consequence_index += 1
 
         outcome = self._outcome
         if outcome is not None and self._consequence_index >= len(outcome.get_consequences()):
-            self._change_location(location_id=outcome.get_target())
+            self._move(outcome)
+
+    def resolve_all(self):
+        """Resolve the active consequence and all consequences after it.
+
+        :raises: :exc:`AdventureStateError` if there is no consequence
+        """
+        if self._consequence is None:
+            raise AdventureStateError("There is no consequence")
+
+        if self._journal is not None:
+            self._journal.record(self, RESOLVE_ALL)
+        self._move(self._outcome)
+
+    def apply(self, commands):
+        """Apply commands one after another.
+
+        A command is the index of an action to perform, :data:`LEAVE`, :data:`RESOLVE` or
+        :data:`RESOLVE_ALL`. Commands applied before a failed command stay applied.
+
+        :param commands: commands to apply
+        :type: iterable with int
+        :returns: description of the final screen, as :meth:`describe_location` or
+            :meth:`describe_consequence` returns it, and events in the order they happened, pairs
+            of :data:`MOVED` or :data:`CONSEQUENCE` and its value
+        :rtype: tuple with :class:`types.MappingProxyType` and list
+        :raises: :exc:`AdventureStateError` if a command can't be applied
+        """
+        events = []
+        append_event = events.append
+        apply_command = self._apply_command
+
+        for position, command in enumerate(commands):
+            try:
+                apply_command(command)
+            except AdventureStateError as error:
+                raise AdventureStateError(
+                    f"The command '{command}' at the position '{position}' can't be applied: "
+                    f"{error}",
+                ) from error
+
+            # Every command, that doesn't leave a consequence active, moves to a location
+            if self._outcome is None:
+                append_event((MOVED, self.__location.get_id()))
+            else:
+                append_event((CONSEQUENCE, self._consequence_index))
+
+        if self._consequence is not None:
+            return self.describe_consequence(), events
+        return self.describe_location(), events
+
+    def step(self, command):
+        """Apply a command and report what changed.
+
+        The step holds no descriptions, so it is cheap to send to a client, that describes
+        a screen only if it isn't shown yet. Steps without changes of the context are shared.
+
+        :param command: index of an action to perform, :data:`LEAVE`, :data:`RESOLVE` or
+            :data:`RESOLVE_ALL`
+        :type: int
+        :returns: changes of the adventure. Changes of the context are reported, if it is
+            a :class:`TrackedContext <sunlessadventure.abstract.context.TrackedContext>`
+        :rtype: :class:`Step`
+        :raises: :exc:`AdventureStateError` if the command can't be applied
+        """
+        context = self._tracked_context
+        checkpoint = context.get_checkpoint() if context is not None else None
+
+        outcome = self._outcome
+        self._apply_command(command)
+
+        # Every command, that doesn't leave a consequence active, moves to a location
+        if self._outcome is None:
+            key = (LOCATION, self.__location.get_id(), None, None)
+        elif self._outcome is outcome:
+            key = (CONSEQUENCE, None, self._consequence_index, None)
+        else:
+            key = (
+                CONSEQUENCE,
+                None,
+                self._consequence_index,
+                len(self._outcome.get_consequences()),
+            )
+
+        changes = context.get_changes(checkpoint) if context is not None else None
+        if changes:
+            return Step(*key, changes=changes)
+
+        step = _STEPS.get(key)
+        if step is None:
+            step = _STEPS[key] = Step(*key)
+        return step
+
+    def restore_consequence(self, outcome, consequence_index=0):
+        """Restore an unresolved consequence of the current location.
+
+        The action leading to the outcome is not performed again.
+
+        :param outcome: outcome with the consequence
+        :type: :class:`Outcome <sunlessadventure.abstract.outcome.Outcome>`
+        :param consequence_index: index of the unresolved consequence
+        :type: int
+        :raises: :exc:`AdventureStateError` if there is an unresolved consequence already.
+            :exc:`AdventureError` if the outcome has no consequence at the position
+        """
+        if self._consequence is not None:
+            raise AdventureStateError("There is an unresolved consequence")
+
+        if not 0 <= consequence_index < len(outcome.get_consequences()):
+            raise AdventureError(f"There is no consequence at the position '{consequence_index}'")
+
+        self._outcome = outcome
+        self._consequence_index = consequence_index
+
+    def prefetch(self, steps=1):
+        """Get the locations, that may be reached next, ready.
+
+        The locations reachable from the current location in a number of steps are built by
+        the location factory, so moving to them doesn't wait for their content. A step is leaving
+        a location or performing an action. The actions are not performed, their outcomes are
+        taken from :meth:`get_outcome() <sunlessadventure.abstract.action.Action.get_outcome>` and
+        the content of the locations is predicted by the current state of the session.
+
+        :param steps: number of steps
+        :type: int
+        :returns: identifiers of the reachable locations and names of the images of those
+            locations and of the consequences on the way
+        :rtype: tuple with frozenset of str and frozenset of str
+        """
+        location_ids = set()
+        images = set()
+        built_location_ids = {self.__location.get_id()}
+        frontier = [self.__location]
+        for _ in range(steps):
+            reached_locations = []
+            for location in frontier:
+                for target, outcome in get_moves(location, get_actions(location, self._context)):
+                    if outcome is not None:
+                        images.update(get_consequence_images(outcome))
+
+                    if target not in built_location_ids:
+                        try:
+                            reached_location = self._location_factory.get_location(target)
+                        except LocationError:
+                            continue
+                        built_location_ids.add(target)
+                        images.update(get_location_images(
+                            reached_location.get_depiction(self._context),
+                            get_actions(reached_location, self._context),
+                        ))
+                        reached_locations.append(reached_location)
+                    location_ids.add(target)
+            frontier = reached_locations
+
+        return frozenset(location_ids), frozenset(images)
+
+    @property
+    def context(self):
+        """State of the session passed to locations and actions."""
+        return self._context
+
+    @property
+    def location(self):
+        """Current location."""
+        return self.__location
+
+    @property
+    def outcome(self):
+        """Outcome with the unresolved consequence or None, if there is no such consequence."""
+        if self._consequence is None:
+            return None
+        return self._outcome
+
+    @property
+    def journal(self):
+        """Journal of the adventure or None, if the adventure isn't journaled."""
+        return self._journal
+
+    @property
+    def consequence_index(self):
+        """Index of the unresolved consequence in the outcome."""
+        return self._consequence_index
 
     @property
     def _location(self):
@@ -175,18 +406,124 @@ class Adventure:
 
         return consequences[self._consequence_index]
 
-    def _change_location(self, location_id):
-        """Change the current location.
+    def _apply_command(self, command):
+        """Apply a command.
 
-        :param location_id: identifier of the new location
-        :type location_id: str
+        :raises: :exc:`AdventureStateError` if the command can't be applied
         """
-        try:
-            location = self._location_factory.get_location(location_id)
-        except LocationError:
-            location = self._location_factory.get_default_location()
-        location.visit()
+        if command == RESOLVE:
+            self.resolve_consequence()
+        elif command == LEAVE:
+            self.leave_location()
+        elif command == RESOLVE_ALL:
+            self.resolve_all()
+        else:
+            self.perform_action(command)
+
+    def _move(self, link):
+        """Move along an exit or an outcome.
+
+        The location is taken from the resolved links of a linked story. Otherwise it's requested
+        from the location factory by the target of the link, and the default location replaces
+        an unknown target.
+
+        :param link: exit or outcome leading to the new location
+        :type: :class:`Exit <sunlessadventure.abstract.location.Exit>` or
+            :class:`Outcome <sunlessadventure.abstract.outcome.Outcome>`
+        """
+        location = self._links.get(link) if self._links is not None else None
+        if location is None:
+            try:
+                location = self._location_factory.get_location(link.get_target())
+            except LocationError:
+                location = self._location_factory.get_default_location()
+        location.visit(self._context)
 
         self.__location = location
         self._outcome = None
         self._consequence_index = 0
+
+        if self._journal is not None:
+            self._journal.record_move(location.get_id())
+
+
+class Step:
+    """Class with the changes of an adventure after a command.
+
+    ``screen`` is :data:`LOCATION` or :data:`CONSEQUENCE`. A step to a location has the identifier
+    of the location, a step to a consequence has the index of the consequence and the number of
+    consequences, if the step started a new outcome. ``changes`` are the changes of the context.
+    """
+
+    __slots__ = (
+        "_screen",
+        "_location_id",
+        "_consequence_index",
+        "_consequence_count",
+        "_changes",
+        "_json",
+    )
+
+    def __init__(
+        self,
+        screen,
+        location_id=None,
+        consequence_index=None,
+        consequence_count=None,
+        changes=None,
+    ):
+        self._screen = screen
+        self._location_id = location_id
+        self._consequence_index = consequence_index
+        self._consequence_count = consequence_count
+        self._changes = changes if changes is not None else _NO_CHANGES
+        self._json = None
+
+    @property
+    def screen(self):
+        """Screen after the step, :data:`LOCATION` or :data:`CONSEQUENCE`."""
+        return self._screen
+
+    @property
+    def location_id(self):
+        """Identifier of the location moved to or None, if a consequence is shown."""
+        return self._location_id
+
+    @property
+    def consequence_index(self):
+        """Index of the shown consequence or None, if a location is shown."""
+        return self._consequence_index
+
+    @property
+    def consequence_count(self):
+        """Number of consequences of a new outcome or None, if no outcome started."""
+        return self._consequence_count
+
+    @property
+    def changes(self):
+        """Changes of the context by their names, a read-only mapping if there are none."""
+        return self._changes
+
+    def to_json(self):
+        """Encode the step in JSON.
+
+        Values, that are None or empty, are left out. The encoding is computed once.
+
+        :returns: UTF-8 encoded JSON object
+        :rtype: bytes
+        """
+        if self._json is not None:
+            return self._json
+
+        step = {"screen": self._screen}
+        if self._location_id is not None:
+            step["location"] = self._location_id
+        if self._consequence_index is not None:
+            step["consequence"] = self._consequence_index
+        if self._consequence_count is not None:
+            step["consequences"] = self._consequence_count
+        if self._changes:
+            step["changes"] = self._changes
+        self._json = json.dumps(step, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        return self._json
+
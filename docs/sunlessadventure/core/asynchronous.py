@@ -0,0 +1,282 @@
+"""Module to manage the status of an adventure, which locations are loaded asynchronously.
+
+The adventure has the semantics of :class:`Adventure <sunlessadventure.core.adventure.Adventure>`.
+Synchronous stories are played through the adapters of
+:mod:`sunlessadventure.core.location.adapter`.
+"""
+
+import asyncio
+
+from sunlessadventure.abstract.location import LocationError
+from sunlessadventure.core.adventure import AdventureError, AdventureStateError
+from sunlessadventure.core.cache import DESCRIPTION_CACHE
+from sunlessadventure.core.graph import (
+    get_async_actions,
+    get_consequence_images,
+    get_location_images,
+    get_moves,
+)
+
+
+class AsyncAdventure:
+    """Class to manage an adventure with asynchronous locations.
+
+    The start location is visited, when the adventure is created, so adventures are created by
+    :meth:`create`.
+    """
+
+    __slots__ = ("_location_factory", "_context", "_location", "_outcome", "_consequence_index")
+
+    def __init__(self, location_factory, location, context=None):
+        self._location_factory = location_factory
+        self._context = context
+        self._location = location
+        self._outcome = None
+        self._consequence_index = 0
+
+    @classmethod
+    async def create(cls, location_factory, start_location_id, context=None):
+        """Create an adventure and visit its start location.
+
+        :param location_factory: factory of the story
+        :type: :class:`AsyncLocationFactory
+            <sunlessadventure.abstract.location.AsyncLocationFactory>`
+        :param start_location_id: identifier of the start location. The default location is
+            visited, if the location is unknown
+        :type: str
+        :param context: state of the session passed to locations and actions
+        :type: object
+        :returns: adventure
+        :rtype: :class:`AsyncAdventure`
+        """
+        try:
+            location = await location_factory.get_location(start_location_id)
+        except LocationError:
+            location = await location_factory.get_default_location()
+        await location.visit(context)
+        return cls(location_factory=location_factory, location=location, context=context)
+
+    async def describe_location(self):
+        """Describe the current location.
+
+        :returns: a structured immutable description of the current location, shared between
+            sessions
+        :rtype: :class:`types.MappingProxyType`
+        :raises: :exc:`AdventureStateError
+            <sunlessadventure.core.adventure.AdventureStateError>` if there is an unresolved
+            consequence
+        """
+        if self._consequence is not None:
+            raise AdventureStateError("There is an unresolved consequence")
+
+        return await DESCRIPTION_CACHE.describe_async_location(self._location, self._context)
+
+    def describe_consequence(self):
+        """Describe the current consequence.
+
+        :returns: a structured immutable description of the current consequence, shared between
+            sessions
+        :rtype: :class:`types.MappingProxyType`
+        :raises: :exc:`AdventureStateError
+            <sunlessadventure.core.adventure.AdventureStateError>` if there is no consequence
+        """
+        consequence = self._consequence
+        if consequence is None:
+            raise AdventureStateError("There is no consequence")
+
+        return DESCRIPTION_CACHE.describe_consequence(consequence)
+
+    async def leave_location(self):
+        """Leave the current location.
+
+        :raises: :exc:`AdventureStateError
+            <sunlessadventure.core.adventure.AdventureStateError>` if there is an unresolved
+            consequence or there is no exit
+        """
+        if self._consequence is not None:
+            raise AdventureStateError("There is an unresolved consequence")
+
+        exit_ = self._location.get_exit()
+        if exit_ is None:
+            raise AdventureStateError("There is no exit")
+
+        await self._change_location(location_id=exit_.get_target())
+
+    async def perform_action(self, action_index):
+        """Perform an action.
+
+        :param action_index: index of the action, negative indices don't address actions
+        :type: int
+        :raises: :exc:`AdventureStateError
+            <sunlessadventure.core.adventure.AdventureStateError>` if there is an unresolved
+            consequence or no action at the position
+        """
+        if self._consequence is not None:
+            raise AdventureStateError("There is an unresolved consequence")
+
+        if action_index < 0:
+            raise AdventureStateError(f"There is no action at the position '{action_index}'")
+        try:
+            action = (await self._location.get_actions(self._context))[action_index]
+        except IndexError as error:
+            raise AdventureStateError(
+                f"There is no action at the position '{action_index}'",
+            ) from error
+
+        outcome = await action.perform(self._context)
+        if outcome.get_consequences():
+            self._outcome = outcome
+            self._consequence_index = 0
+        else:
+            await self._change_location(location_id=outcome.get_target())
+
+    async def resolve_consequence(self):
+        """Resolve the active consequence.
+
+        :raises: :exc:`AdventureStateError
+            <sunlessadventure.core.adventure.AdventureStateError>` if there is no consequence
+        """
+        if self._consequence is None:
+            raise AdventureStateError("There is no consequence")
+
+        self._consequence_index += 1
+
+        outcome = self._outcome
+        if self._consequence_index >= len(outcome.get_consequences()):
+            await self._change_location(location_id=outcome.get_target())
+
+    async def resolve_all(self):
+        """Resolve the active consequence and all consequences after it.
+
+        :raises: :exc:`AdventureStateError
+            <sunlessadventure.core.adventure.AdventureStateError>` if there is no consequence
+        """
+        if self._consequence is None:
+            raise AdventureStateError("There is no consequence")
+
+        await self._change_location(location_id=self._outcome.get_target())
+
+    def restore_consequence(self, outcome, consequence_index=0):
+        """Restore an unresolved consequence of the current location.
+
+        The action leading to the outcome is not performed again.
+
+        :param outcome: outcome with the consequence
+        :type: :class:`Outcome <sunlessadventure.abstract.outcome.Outcome>`
+        :param consequence_index: index of the unresolved consequence
+        :type: int
+        :raises: :exc:`AdventureStateError
+            <sunlessadventure.core.adventure.AdventureStateError>` if there is an unresolved
+            consequence already. :exc:`AdventureError
+            <sunlessadventure.core.adventure.AdventureError>` if the outcome has no consequence
+            at the position
+        """
+        if self._consequence is not None:
+            raise AdventureStateError("There is an unresolved consequence")
+
+        if not 0 <= consequence_index < len(outcome.get_consequences()):
+            raise AdventureError(f"There is no consequence at the position '{consequence_index}'")
+
+        self._outcome = outcome
+        self._consequence_index = consequence_index
+
+    async def prefetch(self, steps=1):
+        """Get the locations, that may be reached next, ready.
+
+        Works as :meth:`Adventure.prefetch <sunlessadventure.core.adventure.Adventure.prefetch>`,
+        but the locations reachable in the same number of steps are loaded concurrently.
+
+        :param steps: number of steps
+        :type: int
+        :returns: identifiers of the reachable locations and names of the images of those
+            locations and of the consequences on the way
+        :rtype: tuple with frozenset of str and frozenset of str
+        """
+        context = self._context
+        location_ids = set()
+        images = set()
+        built_location_ids = {self._location.get_id()}
+        frontier = [self._location]
+        frontier_actions = [await get_async_actions(self._location, context)]
+        for _ in range(steps):
+            targets = []
+            for location, actions in zip(frontier, frontier_actions):
+                for target, outcome in get_moves(location, actions):
+                    if outcome is not None:
+                        images.update(get_consequence_images(outcome))
+                    if target not in built_location_ids:
+                        built_location_ids.add(target)
+                        targets.append(target)
+                    location_ids.add(target)
+
+            reached_locations = await asyncio.gather(
+                *(self._location_factory.get_location(target) for target in targets),
+                return_exceptions=True,
+            )
+            frontier = []
+            for reached_location in reached_locations:
+                if isinstance(reached_location, LocationError):
+                    continue
+                if isinstance(reached_location, BaseException):
+                    raise reached_location
+                frontier.append(reached_location)
+
+            depictions, frontier_actions = await asyncio.gather(
+                asyncio.gather(*(location.get_depiction(context) for location in frontier)),
+                asyncio.gather(*(get_async_actions(location, context) for location in frontier)),
+            )
+            for depiction, actions in zip(depictions, frontier_actions):
+                images.update(get_location_images(depiction, actions))
+
+        return frozenset(location_ids), frozenset(images)
+
+    @property
+    def context(self):
+        """State of the session passed to locations and actions."""
+        return self._context
+
+    @property
+    def location(self):
+        """Current location."""
+        return self._location
+
+    @property
+    def outcome(self):
+        """Outcome with the unresolved consequence or None, if there is no such consequence."""
+        if self._consequence is None:
+            return None
+        return self._outcome
+
+    @property
+    def consequence_index(self):
+        """Index of the unresolved consequence in the outcome."""
+        return self._consequence_index
+
+    @property
+    def _consequence(self):
+        """Get current consequence."""
+        if self._outcome is None:
+            return None
+
+        consequences = self._outcome.get_consequences()
+        if self._consequence_index >= len(consequences):
+            return None
+
+        return consequences[self._consequence_index]
+
+    async def _change_location(self, location_id):
+        """Change the current location.
+
+        :param location_id: identifier of the new location
+        :type location_id: str
+        """
+        try:
+            location = await self._location_factory.get_location(location_id)
+        except LocationError:
+            location = await self._location_factory.get_default_location()
+        await location.visit(self._context)
+
+        self._location = location
+        self._outcome = None
+        self._consequence_index = 0
+
@@ -0,0 +1 @@
+"""Package to compile stories into bundles and to load them back."""
@@ -0,0 +1,288 @@
+"""Module to compile story sources into bundles.
+
+A story source is a JSON document::
+
+    {
+        "default_location": "home",
+        "locations": [
+            {
+                "id": "home",
+                "type": "static",
+                "depiction": {"title": "...", "description": "...", "image": "..."},
+                "actions": [
+                    {
+                        "type": "static",
+                        "name": "...",
+                        "depiction": {...},
+                        "outcome": {
+                            "target": "home",
+                            "consequences": [
+                                {
+                                    "depiction": {...},
+                                    "resolution": "...",
+                                    "details": [{"description": "...", "image": "..."}]
+                                }
+                            ]
+                        },
+                        "parameters": []
+                    }
+                ],
+                "exit": {"name": "...", "target": "home"}
+            }
+        ]
+    }
+
+The fields "type", "actions", "consequences", "details", "parameters" and "exit" are optional.
+Types of locations and actions are resolved by the loader, the parameters are passed to
+the constructor of the type.
+"""
+
+import argparse
+import json
+import sys
+from array import array
+
+from sunlessadventure.core.bundle.format import (
+    BundleError,
+    MAGIC,
+    VERSION,
+    NONE,
+    STATIC_TYPE,
+    HEADER,
+)
+
+
+def compile_story(source):
+    """Compile a story source into a bundle.
+
+    :param source: story source
+    :type: dict
+    :returns: content of the bundle
+    :rtype: bytes
+    :raises: :exc:`BundleError <sunlessadventure.core.bundle.format.BundleError>` if the source is
+        malformed
+    """
+    compiler = _Compiler()
+    try:
+        for location in source["locations"]:
+            compiler.add_location(location)
+        default_location = compiler.add_string(source["default_location"])
+    except (KeyError, TypeError) as error:
+        raise BundleError(f"Malformed story source: {error!r}") from error
+
+    return compiler.dump(default_location=default_location)
+
+
+class _Compiler:
+    """Class to collect records of a bundle.
+
+    Equal strings and records are stored once.
+    """
+
+    def __init__(self):
+        self._strings = {}
+        self._tables = {
+            "depictions": array("I"),
+            "details": array("I"),
+            "consequences": array("I"),
+            "outcomes": array("I"),
+            "actions": array("I"),
+            "locations": array("I"),
+            "references": array("I"),
+        }
+        self._records = {}
+        self._reference_slices = {}
+        self._location_ids = set()
+
+    def add_string(self, value):
+        """Add a string to the string table.
+
+        :param value: string to add, None for a missing string
+        :type: str or None
+        :returns: index of the string
+        :rtype: int
+        """
+        if value is None:
+            return NONE
+        return self._strings.setdefault(str(value), len(self._strings))
+
+    def add_location(self, location):
+        """Add a location with all its content.
+
+        :param location: source of the location
+        :type: dict
+        """
+        location_id = str(location["id"])
+        if location_id in self._location_ids:
+            raise BundleError(f"Duplicate location '{location_id}'")
+        self._location_ids.add(location_id)
+
+        exit_ = location.get("exit") or {}
+        actions = [self._add_action(action) for action in location.get("actions", ())]
+        self._add_record("locations", (
+            self.add_string(location_id),
+            self.add_string(location.get("type", STATIC_TYPE)),
+            self._add_depiction(location["depiction"]),
+            *self._add_references(actions),
+            self.add_string(exit_.get("name")),
+            self.add_string(exit_.get("target")),
+        ), unique=False)
+
+    def dump(self, default_location):
+        """Dump collected records.
+
+        :param default_location: index of the identifier of the default location
+        :type: int
+        :returns: content of the bundle
+        :rtype: bytes
+        """
+        encoded_strings = [value.encode("utf-8") for value in self._strings]
+        offsets = array("I", [0])
+        for encoded_string in encoded_strings:
+            offsets.append(offsets[-1] + len(encoded_string))
+        blob = b"".join(encoded_strings)
+        blob += b"\0" * (-len(blob) % 4)
+
+        tables = self._tables
+        header = HEADER.pack(
+            MAGIC,
+            VERSION,
+            0,
+            default_location,
+            len(encoded_strings),
+            len(blob),
+            len(tables["depictions"]),
+            len(tables["details"]),
+            len(tables["consequences"]),
+            len(tables["outcomes"]),
+            len(tables["actions"]),
+            len(tables["locations"]),
+            len(tables["references"]),
+        )
+
+        chunks = [offsets, *tables.values()]
+        if sys.byteorder == "big":
+            chunks = [array("I", chunk) for chunk in chunks]
+            for chunk in chunks:
+                chunk.byteswap()
+
+        encoded_offsets, *encoded_tables = (chunk.tobytes() for chunk in chunks)
+        return b"".join([header, encoded_offsets, blob, *encoded_tables])
+
+    def _add_action(self, action):
+        """Add an action.
+
+        :returns: index of the action record
+        :rtype: int
+        """
+        parameters = [self.add_string(parameter) for parameter in action.get("parameters", ())]
+        return self._add_record("actions", (
+            self.add_string(action.get("type", STATIC_TYPE)),
+            self.add_string(action["name"]),
+            self._add_depiction(action["depiction"]),
+            self._add_outcome(action["outcome"]),
+            *self._add_references(parameters),
+        ))
+
+    def _add_outcome(self, outcome):
+        """Add an outcome.
+
+        :returns: index of the outcome record
+        :rtype: int
+        """
+        consequences = [
+            self._add_consequence(consequence) for consequence in outcome.get("consequences", ())
+        ]
+        return self._add_record("outcomes", (
+            self.add_string(outcome["target"]),
+            *self._add_references(consequences),
+        ))
+
+    def _add_consequence(self, consequence):
+        """Add a consequence.
+
+        :returns: index of the consequence record
+        :rtype: int
+        """
+        details = [
+            self._add_record("details", (
+                self.add_string(detail["description"]),
+                self.add_string(detail["image"]),
+            ))
+            for detail in consequence.get("details", ())
+        ]
+        return self._add_record("consequences", (
+            self._add_depiction(consequence["depiction"]),
+            self.add_string(consequence["resolution"]),
+            *self._add_references(details),
+        ))
+
+    def _add_depiction(self, depiction):
+        """Add a depiction.
+
+        :returns: index of the depiction record
+        :rtype: int
+        """
+        return self._add_record("depictions", (
+            self.add_string(depiction["title"]),
+            self.add_string(depiction["description"]),
+            self.add_string(depiction["image"]),
+        ))
+
+    def _add_references(self, indices):
+        """Add a sequence of references.
+
+        :returns: position of the first reference and the number of references
+        :rtype: tuple with int
+        """
+        indices = tuple(indices)
+        if indices not in self._reference_slices:
+            references = self._tables["references"]
+            self._reference_slices[indices] = (len(references), len(indices))
+            references.extend(indices)
+        return self._reference_slices[indices]
+
+    def _add_record(self, table_name, fields, unique=True):
+        """Add a record to a table.
+
+        :param table_name: name of the table
+        :type: str
+        :param fields: fields of the record
+        :type: tuple with int
+        :param unique: whether an equal record should be reused
+        :type: bool
+        :returns: index of the record in the table
+        :rtype: int
+        """
+        key = (table_name, fields)
+        if unique and key in self._records:
+            return self._records[key]
+
+        table = self._tables[table_name]
+        index = len(table) // len(fields)
+        table.extend(fields)
+        if unique:
+            self._records[key] = index
+        return index
+
+
+def main(argv=None):
+    """Compile a story source file into a bundle file.
+
+    :param argv: command line arguments
+    :type: list with str
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("source", help="path to the JSON story source")
+    parser.add_argument("bundle", help="path to write the bundle to")
+    arguments = parser.parse_args(argv)
+
+    with open(arguments.source, encoding="utf-8") as source_file:
+        source = json.load(source_file)
+
+    with open(arguments.bundle, "wb") as bundle_file:
+        bundle_file.write(compile_story(source))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+"""Module with the layout of story bundles.
+
+A story bundle is a binary file with the following little-endian layout:
+
+* header: magic bytes, version, index of the default location id and sizes of the tables;
+* string table: offsets of the strings followed by their UTF-8 encoded content;
+* record tables: flat arrays of unsigned 32-bit integers, a fixed number of fields per record.
+
+Records refer to strings and to other records by their indices. Sequences, like the actions of
+a location, are stored as a slice of the reference table.
+"""
+
+import struct
+
+
+class BundleError(Exception):
+    """Exception during work with story bundles."""
+
+
+MAGIC = b"SABN"
+VERSION = 1
+
+#: Marker of a missing string or record.
+NONE = 0xFFFFFFFF
+
+#: Type of locations and actions, which are built with core classes.
+STATIC_TYPE = "static"
+
+HEADER = struct.Struct("<4sHHI9I")
+
+DEPICTION_FIELDS = 3
+"""Fields of a depiction: title, description, image."""
+
+DETAIL_FIELDS = 2
+"""Fields of a detail: description, image."""
+
+CONSEQUENCE_FIELDS = 4
+"""Fields of a consequence: depiction, resolution, first detail reference, number of details."""
+
+OUTCOME_FIELDS = 3
+"""Fields of an outcome: target, first consequence reference, number of consequences."""
+
+ACTION_FIELDS = 6
+"""Fields of an action: type, name, depiction, outcome, first parameter reference, number of
+parameters."""
+
+LOCATION_FIELDS = 7
+"""Fields of a location: id, type, depiction, first action reference, number of actions,
+exit name, exit target."""
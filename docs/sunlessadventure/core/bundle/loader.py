@@ -0,0 +1,463 @@
+"""Module to load locations from story bundles."""
+
+import sys
+from array import array
+
+from sunlessadventure.abstract.location import LocationFactory, LocationError
+from sunlessadventure.core.action.static import StaticAction
+from sunlessadventure.core.depiction.static import StaticDepiction
+from sunlessadventure.core.location.static import StaticExit, StaticLocation
+from sunlessadventure.core.outcome.static import StaticDetail, StaticConsequence, StaticOutcome
+from sunlessadventure.core.bundle.format import (
+    BundleError,
+    MAGIC,
+    VERSION,
+    NONE,
+    STATIC_TYPE,
+    HEADER,
+    DEPICTION_FIELDS,
+    DETAIL_FIELDS,
+    CONSEQUENCE_FIELDS,
+    OUTCOME_FIELDS,
+    ACTION_FIELDS,
+    LOCATION_FIELDS,
+)
+
+
+_STRING = "strings"
+
+# Fields of the records by the names of their tables. A field refers to a string or to a record
+# of a table, a pair of fields in a tuple is a slice of the reference table.
+_RECORD_FIELDS = {
+    "depictions": (_STRING, _STRING, _STRING),
+    "details": (_STRING, _STRING),
+    "consequences": ("depictions", _STRING, ("details",)),
+    "outcomes": (_STRING, ("consequences",)),
+    "actions": (_STRING, _STRING, "depictions", "outcomes", (_STRING,)),
+    "locations": (_STRING, _STRING, "depictions", ("actions",), _STRING, _STRING),
+}
+_RECORD_SIZES = {
+    "depictions": DEPICTION_FIELDS,
+    "details": DETAIL_FIELDS,
+    "consequences": CONSEQUENCE_FIELDS,
+    "outcomes": OUTCOME_FIELDS,
+    "actions": ACTION_FIELDS,
+    "locations": LOCATION_FIELDS,
+}
+
+
+class Bundle:
+    """Class to read records of a story bundle.
+
+    Indices of strings and records are checked, when the bundle is loaded. Strings are decoded on
+    the first access.
+    """
+
+    def __init__(self, data):
+        data = memoryview(data)
+        if len(data) < HEADER.size:
+            raise BundleError("The bundle is truncated")
+
+        (
+            magic,
+            version,
+            _,
+            default_location,
+            string_count,
+            blob_size,
+            *table_sizes,
+        ) = HEADER.unpack_from(data)
+        if magic != MAGIC:
+            raise BundleError("The data is not a story bundle")
+        if version != VERSION:
+            raise BundleError(f"Unsupported version of the bundle '{version}'")
+
+        position = HEADER.size
+        self._offsets, position = _read_table(data, position, string_count + 1)
+        if position + blob_size > len(data):
+            raise BundleError("The bundle is truncated")
+        if not _is_sorted(self._offsets) or self._offsets[-1] > blob_size:
+            raise BundleError("The string table is malformed")
+        self._blob = data[position:position + blob_size]
+        position += blob_size
+
+        tables = []
+        for table_size in table_sizes:
+            table, position = _read_table(data, position, table_size)
+            tables.append(table)
+        (
+            self.depictions,
+            self.details,
+            self.consequences,
+            self.outcomes,
+            self.actions,
+            self.locations,
+            self.references,
+        ) = tables
+        if default_location >= string_count:
+            raise BundleError("The default location is out of range")
+        self._check_records(string_count)
+
+        self._strings = [None] * string_count
+        self._default_location = default_location
+        self._location_indices = {
+            self.get_string(self.locations[index * LOCATION_FIELDS]): index
+            for index in range(len(self.locations) // LOCATION_FIELDS)
+        }
+
+    @classmethod
+    def from_file(cls, path):
+        """Read a bundle from a file.
+
+        :param path: path to the bundle
+        :type: str
+        :returns: bundle
+        :rtype: :class:`Bundle`
+        """
+        with open(path, "rb") as bundle_file:
+            return cls(bundle_file.read())
+
+    def get_string(self, index):
+        """Get a string from the string table.
+
+        :param index: index of the string
+        :type: int
+        :returns: string or None, if the index marks a missing string
+        :rtype: str
+        """
+        if index == NONE:
+            return None
+
+        value = self._strings[index]
+        if value is None:
+            value = str(self._blob[self._offsets[index]:self._offsets[index + 1]], "utf-8")
+            self._strings[index] = value
+        return value
+
+    def get_default_location_id(self):
+        """Get the identifier of the default location.
+
+        :returns: identifier of the location
+        :rtype: str
+        """
+        return self.get_string(self._default_location)
+
+    def get_location_ids(self):
+        """Get identifiers of the locations in the bundle.
+
+        :returns: identifiers of the locations
+        :rtype: tuple with str
+        """
+        return tuple(self._location_indices)
+
+    def find_location(self, location_id):
+        """Find a location record.
+
+        :param location_id: identifier of the location
+        :type: str
+        :returns: index of the location record or None, if there is no such location
+        :rtype: int
+        """
+        return self._location_indices.get(location_id)
+
+    def _check_records(self, string_count):
+        """Check that the records refer to existing strings and records.
+
+        :param string_count: number of strings
+        :type: int
+        :raises: :exc:`BundleError <sunlessadventure.core.bundle.format.BundleError>` if a table
+            is malformed or an index is out of range
+        """
+        counts = {_STRING: string_count}
+        for name, record_size in _RECORD_SIZES.items():
+            table_size = len(getattr(self, name))
+            if table_size % record_size:
+                raise BundleError(f"The table of {name} is malformed")
+            counts[name] = table_size // record_size
+
+        references = self.references
+        for name, fields in _RECORD_FIELDS.items():
+            table = getattr(self, name)
+            for offset in range(0, len(table), _RECORD_SIZES[name]):
+                position = offset
+                for field in fields:
+                    if isinstance(field, tuple):
+                        (field,) = field
+                        start, count = table[position], table[position + 1]
+                        if start + count > len(references):
+                            raise BundleError(f"References of {name} are out of range")
+                        indices = references[start:start + count]
+                        position += 2
+                    else:
+                        indices = (table[position],)
+                        position += 1
+
+                    for index in indices:
+                        if index >= counts[field] and not (field == _STRING and index == NONE):
+                            raise BundleError(f"Index of {field} in {name} is out of range")
+
+    def get_references(self, start, count):
+        """Get a slice of the reference table.
+
+        :param start: position of the first reference
+        :type: int
+        :param count: number of references
+        :type: int
+        :returns: indices of the referenced records
+        :rtype: :class:`array.array`
+        """
+        return self.references[start:start + count]
+
+
+class BundleLocationFactory(LocationFactory):
+    """Class to materialize locations of a story bundle on demand.
+
+    Constructors of custom location types accept the arguments ``location_id``, ``depiction``,
+    ``actions`` and ``exit_``. Constructors of custom action types accept the arguments ``name``,
+    ``depiction``, ``outcome`` and ``parameters``. Locations missing in the bundle are requested
+    from the fallback factory. Records shared by several locations are materialized into shared
+    objects.
+    """
+
+    def __init__(self, bundle, location_types=None, action_types=None, fallback=None):
+        self._bundle = bundle
+        self._location_types = {STATIC_TYPE: StaticLocation, **(location_types or {})}
+        self._action_types = {STATIC_TYPE: _create_static_action, **(action_types or {})}
+        self._fallback = fallback
+
+        self._locations = {}
+        self._cache = {
+            "depictions": {},
+            "details": {},
+            "consequences": {},
+            "outcomes": {},
+            "actions": {},
+        }
+
+    @property
+    def bundle(self):
+        """Story bundle."""
+        return self._bundle
+
+    def get_location(self, location_id):
+        """Get a location by its identifier.
+
+        :param location_id: identifier of the location
+        :type: str
+        :returns: location
+        :rtype: :class:`Location <sunlessadventure.abstract.location.Location>`
+        :raises: :exc:`LocationError <sunlessadventure.abstract.location.LocationError>`
+        """
+        location = self._locations.get(location_id)
+        if location is not None:
+            return location
+
+        index = self._bundle.find_location(location_id)
+        if index is not None:
+            location = self._create_location(index)
+        elif self._fallback is not None:
+            location = self._fallback.get_location(location_id)
+        else:
+            raise LocationError(f"Unknown location '{location_id}'")
+
+        self._locations[location_id] = location
+        return location
+
+    def get_location_ids(self):
+        """Get identifiers of the locations in the bundle and in the fallback factory.
+
+        :returns: identifiers of the locations
+        :rtype: tuple with str
+        """
+        location_ids = self._bundle.get_location_ids()
+        if self._fallback is not None:
+            location_ids += tuple(
+                location_id for location_id in self._fallback.get_location_ids()
+                if self._bundle.find_location(location_id) is None
+            )
+        return location_ids
+
+    def get_default_location_id(self):
+        """Get the identifier of the default location.
+
+        :returns: identifier of the location
+        :rtype: str
+        """
+        return self._bundle.get_default_location_id()
+
+    def _create_location(self, index):
+        """Create a location from its record."""
+        bundle = self._bundle
+        offset = index * LOCATION_FIELDS
+        (
+            location_id,
+            location_type,
+            depiction,
+            first_action,
+            action_count,
+            exit_name,
+            exit_target,
+        ) = bundle.locations[offset:offset + LOCATION_FIELDS]
+
+        exit_ = None
+        if exit_target != NONE:
+            exit_ = StaticExit(
+                name=bundle.get_string(exit_name),
+                target=bundle.get_string(exit_target),
+            )
+
+        constructor = _get_constructor(self._location_types, bundle.get_string(location_type))
+        return constructor(
+            location_id=bundle.get_string(location_id),
+            depiction=self._create_depiction(depiction),
+            actions=[
+                self._create_action(action)
+                for action in bundle.get_references(first_action, action_count)
+            ],
+            exit_=exit_,
+        )
+
+    def _create_action(self, index):
+        """Create an action from its record."""
+        cache = self._cache["actions"]
+        if index in cache:
+            return cache[index]
+
+        bundle = self._bundle
+        offset = index * ACTION_FIELDS
+        (
+            action_type,
+            name,
+            depiction,
+            outcome,
+            first_parameter,
+            parameter_count,
+        ) = bundle.actions[offset:offset + ACTION_FIELDS]
+
+        constructor = _get_constructor(self._action_types, bundle.get_string(action_type))
+        action = constructor(
+            name=bundle.get_string(name),
+            depiction=self._create_depiction(depiction),
+            outcome=self._create_outcome(outcome),
+            parameters=tuple(
+                bundle.get_string(parameter)
+                for parameter in bundle.get_references(first_parameter, parameter_count)
+            ),
+        )
+        cache[index] = action
+        return action
+
+    def _create_outcome(self, index):
+        """Create an outcome from its record."""
+        cache = self._cache["outcomes"]
+        if index in cache:
+            return cache[index]
+
+        bundle = self._bundle
+        offset = index * OUTCOME_FIELDS
+        target, first_consequence, consequence_count = bundle.outcomes[
+            offset:offset + OUTCOME_FIELDS
+        ]
+        outcome = StaticOutcome(
+            target=bundle.get_string(target),
+            consequences=[
+                self._create_consequence(consequence)
+                for consequence in bundle.get_references(first_consequence, consequence_count)
+            ],
+        )
+        cache[index] = outcome
+        return outcome
+
+    def _create_consequence(self, index):
+        """Create a consequence from its record."""
+        cache = self._cache["consequences"]
+        if index in cache:
+            return cache[index]
+
+        bundle = self._bundle
+        offset = index * CONSEQUENCE_FIELDS
+        depiction, resolution, first_detail, detail_count = bundle.consequences[
+            offset:offset + CONSEQUENCE_FIELDS
+        ]
+        consequence = StaticConsequence(
+            depiction=self._create_depiction(depiction),
+            resolution=bundle.get_string(resolution),
+            details=[
+                self._create_detail(detail)
+                for detail in bundle.get_references(first_detail, detail_count)
+            ],
+        )
+        cache[index] = consequence
+        return consequence
+
+    def _create_detail(self, index):
+        """Create a detail from its record."""
+        cache = self._cache["details"]
+        if index not in cache:
+            bundle = self._bundle
+            offset = index * DETAIL_FIELDS
+            description, image = bundle.details[offset:offset + DETAIL_FIELDS]
+            cache[index] = StaticDetail(
+                description=bundle.get_string(description),
+                image=bundle.get_string(image),
+            )
+        return cache[index]
+
+    def _create_depiction(self, index):
+        """Create a depiction from its record."""
+        cache = self._cache["depictions"]
+        if index not in cache:
+            bundle = self._bundle
+            offset = index * DEPICTION_FIELDS
+            title, description, image = bundle.depictions[offset:offset + DEPICTION_FIELDS]
+            cache[index] = StaticDepiction(
+                title=bundle.get_string(title),
+                description=bundle.get_string(description),
+                image=bundle.get_string(image),
+            )
+        return cache[index]
+
+
+def _create_static_action(name, depiction, outcome, parameters):
+    """Create a static action.
+
+    :raises: :exc:`BundleError <sunlessadventure.core.bundle.format.BundleError>` if there are
+        parameters
+    """
+    if parameters:
+        raise BundleError("Static actions do not accept parameters")
+    return StaticAction(name=name, depiction=depiction, outcome=outcome)
+
+
+def _get_constructor(constructors, type_name):
+    """Get the constructor of a type.
+
+    :raises: :exc:`BundleError <sunlessadventure.core.bundle.format.BundleError>` if the type is
+        unknown
+    """
+    try:
+        return constructors[type_name]
+    except KeyError as error:
+        raise BundleError(f"Unknown type '{type_name}'") from error
+
+
+def _is_sorted(values):
+    """Check that values don't decrease."""
+    return all(value <= next_value for value, next_value in zip(values, values[1:]))
+
+
+def _read_table(data, position, size):
+    """Read a table of unsigned 32-bit integers.
+
+    :returns: the table and the position right after it
+    :rtype: tuple
+    """
+    end = position + 4 * size
+    if end > len(data):
+        raise BundleError("The bundle is truncated")
+
+    table = array("I")
+    table.frombytes(data[position:end])
+    if sys.byteorder == "big":
+        table.byteswap()
+    return table, end
@@ -0,0 +1,102 @@
+"""Module to export locations into story sources."""
+
+from sunlessadventure.core.action.static import StaticAction
+from sunlessadventure.core.location.static import StaticLocation
+from sunlessadventure.core.bundle.format import BundleError, STATIC_TYPE
+
+
+def export_story(locations, default_location_id, get_location_type=None, get_action_type=None):
+    """Export locations into a story source.
+
+    :param locations: locations to export. Their content must not depend on the session and
+        their actions must be static
+    :type: iterable with instances of
+        :class:`Location <sunlessadventure.abstract.location.Location>`
+    :param default_location_id: identifier of the default location
+    :type: str
+    :param get_location_type: function to get the type of a location
+    :type: callable
+    :param get_action_type: function to get the type and the parameters of an action
+    :type: callable
+    :returns: story source in the format of
+        :mod:`compiler <sunlessadventure.core.bundle.compiler>`
+    :rtype: dict
+    :raises: :exc:`BundleError <sunlessadventure.core.bundle.format.BundleError>` if a location
+        or an action can't be exported
+    """
+    get_location_type = get_location_type or _get_static_location_type
+    get_action_type = get_action_type or _get_static_action_type
+
+    return {
+        "default_location": str(default_location_id),
+        "locations": [
+            _export_location(location, get_location_type, get_action_type)
+            for location in locations
+        ],
+    }
+
+
+def _export_location(location, get_location_type, get_action_type):
+    """Export a location."""
+    exported_location = {
+        "id": location.get_id(),
+        "type": get_location_type(location),
+        "depiction": _export_depiction(location.get_depiction(None)),
+        "actions": [],
+    }
+
+    for action in location.get_actions(None):
+        if not isinstance(action, StaticAction):
+            raise BundleError(f"Action '{action.get_name()}' can't be exported")
+
+        action_type, parameters = get_action_type(action)
+        outcome = action.get_outcome()
+        exported_location["actions"].append({
+            "type": action_type,
+            "name": action.get_name(),
+            "depiction": _export_depiction(action.get_depiction()),
+            "outcome": {
+                "target": outcome.get_target(),
+                "consequences": [
+                    {
+                        "depiction": _export_depiction(consequence.get_depiction()),
+                        "resolution": consequence.get_resolution(),
+                        "details": [
+                            {"description": detail.get_description(), "image": detail.get_image()}
+                            for detail in consequence.get_details()
+                        ],
+                    }
+                    for consequence in outcome.get_consequences()
+                ],
+            },
+            "parameters": list(parameters),
+        })
+
+    exit_ = location.get_exit()
+    if exit_ is not None:
+        exported_location["exit"] = {"name": exit_.get_name(), "target": exit_.get_target()}
+
+    return exported_location
+
+
+def _export_depiction(depiction):
+    """Export a depiction."""
+    return {
+        "title": depiction.get_title(),
+        "description": depiction.get_description(),
+        "image": depiction.get_image(),
+    }
+
+
+def _get_static_location_type(location):
+    """Get the type of a static location."""
+    if type(location) is not StaticLocation:  # pylint: disable=unidiomatic-typecheck
+        raise BundleError(f"Location '{location.get_id()}' can't be exported")
+    return STATIC_TYPE
+
+
+def _get_static_action_type(action):
+    """Get the type and the parameters of a static action."""
+    if type(action) is not StaticAction:  # pylint: disable=unidiomatic-typecheck
+        raise BundleError(f"Action '{action.get_name()}' can't be exported")
+    return STATIC_TYPE, ()
@@ -0,0 +1,251 @@
+"""Module to share descriptions of locations and consequences between sessions.
+
+Descriptions are immutable: mappings are read-only and sequences are tuples, so sessions share
+them without copying.
+"""
+
+import json
+from types import MappingProxyType
+from weakref import WeakKeyDictionary
+
+
+class DescriptionCache:
+    """Class to cache descriptions of locations and consequences.
+
+    A location is described once per key of the session state, see
+    :meth:`Location.get_state_key <sunlessadventure.abstract.location.Location.get_state_key>`.
+    Entries live as long as the described objects. Locations and consequences without a state
+    key are described on every call.
+    """
+
+    def __init__(self):
+        self._descriptions = WeakKeyDictionary()
+        self._encoded_descriptions = WeakKeyDictionary()
+
+    def describe_location(self, location, context):
+        """Describe a location.
+
+        :param location: location to describe
+        :type: :class:`Location <sunlessadventure.abstract.location.Location>`
+        :param context: state of the session
+        :type: object
+        :returns: a structured description of the location
+        :rtype: :class:`types.MappingProxyType`
+        """
+        state_key = location.get_state_key(context)
+        if state_key is None:
+            return describe_location(location, context)
+        return self._get(self._descriptions, location, state_key, describe_location, context)
+
+    async def describe_async_location(self, location, context):
+        """Describe an asynchronous location.
+
+        :param location: location to describe
+        :type: :class:`AsyncLocation <sunlessadventure.abstract.location.AsyncLocation>`
+        :param context: state of the session
+        :type: object
+        :returns: a structured description of the location
+        :rtype: :class:`types.MappingProxyType`
+        """
+        state_key = location.get_state_key(context)
+        if state_key is not None:
+            description = self._descriptions.get(location, {}).get(state_key)
+            if description is not None:
+                return description
+
+        description = await describe_async_location(location, context)
+        if state_key is not None:
+            self._descriptions.setdefault(location, {})[state_key] = description
+        return description
+
+    def encode_location(self, location, context):
+        """Describe a location in JSON.
+
+        :param location: location to describe
+        :type: :class:`Location <sunlessadventure.abstract.location.Location>`
+        :param context: state of the session
+        :type: object
+        :returns: UTF-8 encoded JSON description of the location
+        :rtype: bytes
+        """
+        state_key = location.get_state_key(context)
+        if state_key is None:
+            return encode_description(describe_location(location, context))
+        return self._get(
+            self._encoded_descriptions,
+            location,
+            state_key,
+            self._encode_location,
+            context,
+        )
+
+    def describe_consequence(self, consequence):
+        """Describe a consequence.
+
+        :param consequence: consequence to describe
+        :type: :class:`Consequence <sunlessadventure.abstract.outcome.Consequence>`
+        :returns: a structured description of the consequence
+        :rtype: :class:`types.MappingProxyType`
+        """
+        state_key = consequence.get_state_key()
+        if state_key is None:
+            return describe_consequence(consequence)
+        return self._get(self._descriptions, consequence, state_key, describe_consequence)
+
+    def encode_consequence(self, consequence):
+        """Describe a consequence in JSON.
+
+        :param consequence: consequence to describe
+        :type: :class:`Consequence <sunlessadventure.abstract.outcome.Consequence>`
+        :returns: UTF-8 encoded JSON description of the consequence
+        :rtype: bytes
+        """
+        state_key = consequence.get_state_key()
+        if state_key is None:
+            return encode_description(describe_consequence(consequence))
+        return self._get(
+            self._encoded_descriptions,
+            consequence,
+            state_key,
+            self._encode_consequence,
+        )
+
+    def clear(self):
+        """Remove all cached descriptions."""
+        self._descriptions.clear()
+        self._encoded_descriptions.clear()
+
+    def _encode_location(self, location, context):
+        """Encode the cached description of a location."""
+        return encode_description(self.describe_location(location, context))
+
+    def _encode_consequence(self, consequence):
+        """Encode the cached description of a consequence."""
+        return encode_description(self.describe_consequence(consequence))
+
+    @staticmethod
+    def _get(cache, described_object, state_key, describe, *arguments):
+        """Get a cached value or create it.
+
+        :param cache: cache with values per object and state key
+        :type: :class:`weakref.WeakKeyDictionary`
+        :param described_object: object to describe
+        :type: object
+        :param state_key: key of the state the description depends on
+        :type: hashable
+        :param describe: function to create a value from the object and the arguments
+        :type: callable
+        :returns: cached value
+        :rtype: object
+        """
+        values = cache.get(described_object)
+        if values is None:
+            values = {}
+            cache[described_object] = values
+
+        value = values.get(state_key)
+        if value is None:
+            value = describe(described_object, *arguments)
+            values[state_key] = value
+        return value
+
+
+DESCRIPTION_CACHE = DescriptionCache()
+
+
+def describe_location(location, context):
+    """Describe a location without caching.
+
+    :param location: location to describe
+    :type: :class:`Location <sunlessadventure.abstract.location.Location>`
+    :param context: state of the session
+    :type: object
+    :returns: a structured description of the location
+    :rtype: :class:`types.MappingProxyType`
+    """
+    return _create_location_description(
+        location.get_id(),
+        location.get_depiction(context),
+        location.get_actions(context),
+        location.get_exit(),
+    )
+
+
+async def describe_async_location(location, context):
+    """Describe an asynchronous location without caching.
+
+    :param location: location to describe
+    :type: :class:`AsyncLocation <sunlessadventure.abstract.location.AsyncLocation>`
+    :param context: state of the session
+    :type: object
+    :returns: a structured description of the location
+    :rtype: :class:`types.MappingProxyType`
+    """
+    return _create_location_description(
+        location.get_id(),
+        await location.get_depiction(context),
+        await location.get_actions(context),
+        location.get_exit(),
+    )
+
+
+def describe_consequence(consequence):
+    """Describe a consequence without caching.
+
+    :param consequence: consequence to describe
+    :type: :class:`Consequence <sunlessadventure.abstract.outcome.Consequence>`
+    :returns: a structured description of the consequence
+    :rtype: :class:`types.MappingProxyType`
+    """
+    return MappingProxyType({
+        "depiction": _describe_depiction(consequence.get_depiction()),
+        "details": tuple(
+            MappingProxyType({
+                "image": detail.get_image(),
+                "description": detail.get_description(),
+            })
+            for detail in consequence.get_details()
+        ),
+        "resolution": consequence.get_resolution(),
+    })
+
+
+def encode_description(description):
+    """Encode a description into JSON.
+
+    :param description: a structured description
+    :type: :class:`types.MappingProxyType`
+    :returns: UTF-8 encoded JSON
+    :rtype: bytes
+    """
+    return json.dumps(
+        description,
+        default=dict,
+        ensure_ascii=False,
+        separators=(",", ":"),
+    ).encode("utf-8")
+
+
+def _create_location_description(location_id, depiction, actions, exit_):
+    """Create a description of a location from its parts."""
+    return MappingProxyType({
+        "id": location_id,
+        "depiction": _describe_depiction(depiction),
+        "actions": tuple(
+            MappingProxyType({
+                "depiction": _describe_depiction(action.get_depiction()),
+                "name": action.get_name(),
+            })
+            for action in actions
+        ),
+        "exit": exit_.get_name() if exit_ is not None else None,
+    })
+
+
+def _describe_depiction(depiction):
+    """Describe a depiction."""
+    return MappingProxyType({
+        "image": depiction.get_image(),
+        "title": depiction.get_title(),
+        "description": depiction.get_description(),
+    })
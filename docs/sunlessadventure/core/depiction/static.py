@@ -1,15 +1,21 @@
 """Module to manage static depictions."""
 
 from sunlessadventure.abstract.depiction import Depiction
+from sunlessadventure.core.flyweight import Flyweight, intern_string
 
 
-class StaticDepiction(Depiction):
-    """Class to describe an entity."""
+class StaticDepiction(Flyweight, Depiction):
+    """Class to describe an entity.
 
-    def __init__(self, title, description, image):
-        self._title = str(title)
-        self._description = str(description)
-        self._image = str(image)
+    Equal depictions are the same object.
+    """
+
+    __slots__ = ("_title", "_description", "_image")
+
+    _FIELDS = __slots__
+
+    def __new__(cls, title, description, image):
+        return cls._share(intern_string(title), str(description), intern_string(image))
 
     def get_title(self):
         """Get title.
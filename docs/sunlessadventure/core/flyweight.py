@@ -0,0 +1,51 @@
+"""Module to share equal immutable content objects within a process.
+
+Stories repeat the same images, resolutions and depictions many times. Equal objects are created
+once and kept for the lifetime of the process, like interned strings.
+"""
+
+import sys
+
+
+class Flyweight:
+    """Class for immutable content objects shared by their content.
+
+    Subclasses list the attributes with their content in ``_FIELDS`` and return
+    :meth:`_share` from ``__new__``. Each subclass keeps its own registry of instances.
+    """
+
+    __slots__ = ()
+
+    _FIELDS = ()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._instances = {}
+
+    @classmethod
+    def _share(cls, *content):
+        """Get the shared instance with the content.
+
+        :param content: values of the attributes in the order of ``_FIELDS``
+        :type: tuple with hashable values
+        :returns: a new instance or an existing one with the same content
+        :rtype: :class:`Flyweight`
+        """
+        instance = cls._instances.get(content)
+        if instance is None:
+            instance = object.__new__(cls)
+            for name, value in zip(cls._FIELDS, content):
+                setattr(instance, name, value)
+            cls._instances[content] = instance
+        return instance
+
+
+def intern_string(value):
+    """Intern a short string, that is likely repeated, e.g. an image identifier.
+
+    :param value: value to intern
+    :type: object
+    :returns: interned string
+    :rtype: str
+    """
+    return sys.intern(str(value))
@@ -0,0 +1,91 @@
+"""Module to walk the graph of a story.
+
+Adventures predict the next steps of a session by walking the exits and the outcomes of
+the locations, see :meth:`Adventure.prefetch <sunlessadventure.core.adventure.Adventure.prefetch>`.
+The walks take actions, that are already known, so synchronous and asynchronous locations share
+them.
+"""
+
+
+def get_actions(location, context):
+    """Get all actions of a location.
+
+    :param location: location
+    :type: :class:`Location <sunlessadventure.abstract.location.Location>`
+    :param context: state of the session to get the actions, if the location can't list all its
+        actions
+    :type: object
+    :returns: actions
+    :rtype: tuple with instances of :class:`Action <sunlessadventure.abstract.action.Action>`
+    """
+    return location.get_all_actions() or tuple(location.get_actions(context))
+
+
+async def get_async_actions(location, context):
+    """Get all actions of an asynchronous location.
+
+    :param location: location
+    :type: :class:`AsyncLocation <sunlessadventure.abstract.location.AsyncLocation>`
+    :param context: state of the session to get the actions, if the location can't list all its
+        actions
+    :type: object
+    :returns: actions
+    :rtype: tuple with instances of
+        :class:`AsyncAction <sunlessadventure.abstract.action.AsyncAction>`
+    """
+    return location.get_all_actions() or tuple(await location.get_actions(context))
+
+
+def get_moves(location, actions):
+    """Get targets of the moves from a location.
+
+    :param location: location
+    :type: :class:`Location <sunlessadventure.abstract.location.Location>` or
+        :class:`AsyncLocation <sunlessadventure.abstract.location.AsyncLocation>`
+    :param actions: actions of the location, see :func:`get_actions`
+    :type: iterable
+    :returns: pairs of the identifier of a target location and the outcome of the action leading
+        to it or None, if the location is left
+    :rtype: list with tuple
+    """
+    moves = []
+    exit_ = location.get_exit()
+    if exit_ is not None:
+        moves.append((exit_.get_target(), None))
+
+    for action in actions:
+        outcome = action.get_outcome()
+        if outcome is not None:
+            moves.append((outcome.get_target(), outcome))
+    return moves
+
+
+def get_location_images(depiction, actions):
+    """Get names of the images of a location and its actions.
+
+    :param depiction: depiction of the location
+    :type: :class:`Depiction <sunlessadventure.abstract.depiction.Depiction>`
+    :param actions: actions of the location, see :func:`get_actions`
+    :type: iterable
+    :returns: names of the images
+    :rtype: list with str
+    """
+    images = [depiction.get_image()]
+    for action in actions:
+        images.append(action.get_depiction().get_image())
+    return images
+
+
+def get_consequence_images(outcome):
+    """Get names of the images of the consequences of an outcome.
+
+    :param outcome: outcome
+    :type: :class:`Outcome <sunlessadventure.abstract.outcome.Outcome>`
+    :returns: names of the images
+    :rtype: list with str
+    """
+    images = []
+    for consequence in outcome.get_consequences():
+        images.append(consequence.get_depiction().get_image())
+        images.extend(detail.get_image() for detail in consequence.get_details())
+    return images
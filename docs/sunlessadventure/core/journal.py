@@ -0,0 +1,269 @@
+"""Module to journal the commands of adventures.
+
+A journal keeps a snapshot of a session and the events after it. Every event takes one byte,
+except a move, which takes two:
+
+========== ==============================================================================
+Byte       Event
+========== ==============================================================================
+0..251     the action at the index is performed
+252        all consequences are resolved
+253        the location is left
+254        the consequence is resolved
+255, N     the session moved to the location N of the location table of the journal
+========== ==============================================================================
+
+When the events outgrow the compaction size, the journal takes a new snapshot and drops
+the events before it, so the memory of a journal is bounded. A session is replayed from
+the snapshot to any event after it.
+"""
+
+import struct
+
+from sunlessadventure.core.adventure import (
+    LEAVE,
+    RESOLVE,
+    RESOLVE_ALL,
+    MOVED,
+    AdventureError,
+    AdventureStateError,
+)
+
+
+DEFAULT_COMPACTION_SIZE = 1024
+
+MAX_ACTION_INDEX = 251
+_RESOLVE_ALL = 252
+_LEAVE = 253
+_RESOLVE = 254
+_MOVE = 255
+
+_COMMAND_EVENTS = {
+    **{action_index: action_index for action_index in range(MAX_ACTION_INDEX + 1)},
+    RESOLVE_ALL: _RESOLVE_ALL,
+    LEAVE: _LEAVE,
+    RESOLVE: _RESOLVE,
+}
+_EVENT_COMMANDS = {event: command for command, event in _COMMAND_EVENTS.items()}
+
+_HEADER = struct.Struct("<HH")
+
+
+class JournalError(Exception):
+    """Exception raised when a journal can't be recorded or replayed."""
+
+
+class Journal:
+    """Class to journal the commands of a session.
+
+    The journal is attached to an adventure by its constructor. Snapshots are encoded by
+    the function ``encode_snapshot``, which accepts an adventure, and decoded into adventures by
+    the function ``decode_snapshot``. The functions come from the story, e.g. Sunless CV encodes
+    snapshots by :func:`encode_session <sunlesscv.session.encode_session>`. A new snapshot is
+    taken, when the events outgrow ``compaction_size`` bytes.
+    """
+
+    __slots__ = (
+        "_encode_snapshot",
+        "_decode_snapshot",
+        "_compaction_size",
+        "_snapshot",
+        "_events",
+        "_location_ids",
+        "_move_events",
+    )
+
+    def __init__(self, encode_snapshot, decode_snapshot, compaction_size=DEFAULT_COMPACTION_SIZE):
+        self._encode_snapshot = encode_snapshot
+        self._decode_snapshot = decode_snapshot
+        self._compaction_size = compaction_size
+
+        self._snapshot = None
+        self._events = bytearray()
+        self._location_ids = []
+        self._move_events = {}
+
+    @property
+    def snapshot(self):
+        """Snapshot, the events follow."""
+        return self._snapshot
+
+    @property
+    def events(self):
+        """Events after the snapshot."""
+        return bytes(self._events)
+
+    def start(self, adventure):
+        """Start the journal from the current state of an adventure.
+
+        :param adventure: journaled adventure
+        :type: :class:`Adventure <sunlessadventure.core.adventure.Adventure>`
+        """
+        self._snapshot = self._encode_snapshot(adventure)
+        self._events.clear()
+
+    def record(self, adventure, command):
+        """Record a command before it is applied.
+
+        :param adventure: journaled adventure
+        :type: :class:`Adventure <sunlessadventure.core.adventure.Adventure>`
+        :param command: index of an action, :data:`LEAVE <sunlessadventure.core.adventure.LEAVE>`,
+            :data:`RESOLVE <sunlessadventure.core.adventure.RESOLVE>` or
+            :data:`RESOLVE_ALL <sunlessadventure.core.adventure.RESOLVE_ALL>`
+        :type: int
+        :raises: :exc:`JournalError` if the command can't be recorded
+        """
+        events = self._events
+        if len(events) >= self._compaction_size:
+            self.start(adventure)
+
+        try:
+            events.append(_COMMAND_EVENTS[command])
+        except KeyError as error:
+            raise JournalError(f"The command '{command}' can't be recorded") from error
+
+    def record_move(self, location_id):
+        """Record a move to a location.
+
+        :param location_id: identifier of the location
+        :type: str
+        :raises: :exc:`JournalError` if the location table is full
+        """
+        move_event = self._move_events.get(location_id)
+        if move_event is None:
+            move_event = self._add_location(location_id)
+        self._events += move_event
+
+    def get_commands(self):
+        """Get the commands after the snapshot.
+
+        :returns: commands in the format of :meth:`Adventure.apply
+            <sunlessadventure.core.adventure.Adventure.apply>`
+        :rtype: list with int
+        """
+        return [command for command, _ in self._read()]
+
+    def replay(self, command_count=None):
+        """Replay the session from the snapshot.
+
+        Moves in the journal are compared with the moves of the replay, so a replay, that doesn't
+        repeat the session, fails.
+
+        :param command_count: number of commands to replay. All commands are replayed if omitted
+        :type: int
+        :returns: replayed adventure without a journal
+        :rtype: :class:`Adventure <sunlessadventure.core.adventure.Adventure>`
+        :raises: :exc:`JournalError` if the session can't be replayed
+        """
+        if self._snapshot is None:
+            raise JournalError("The journal isn't started")
+
+        adventure = self._decode_snapshot(self._snapshot)
+        for position, (command, location_id) in enumerate(self._read()):
+            if command_count is not None and position >= command_count:
+                break
+
+            try:
+                _, (event,) = adventure.apply((command,))
+            except (AdventureError, AdventureStateError) as error:
+                raise JournalError(f"The command at the position '{position}' failed") from error
+
+            moved_location_id = event[1] if event[0] == MOVED else None
+            if moved_location_id != location_id:
+                raise JournalError(
+                    f"The command at the position '{position}' moved to '{moved_location_id}' "
+                    f"instead of '{location_id}'",
+                )
+
+        return adventure
+
+    def to_bytes(self):
+        """Serialize the journal.
+
+        :returns: lengths of the snapshot and of the location table, the snapshot, identifiers of
+            the locations separated by new lines in UTF-8 and the events
+        :rtype: bytes
+        """
+        snapshot = self._snapshot or b""
+        location_table = "\n".join(self._location_ids).encode("utf-8")
+        return (
+            _HEADER.pack(len(snapshot), len(location_table))
+            + snapshot
+            + location_table
+            + self._events
+        )
+
+    @classmethod
+    def from_bytes(cls, data, encode_snapshot, decode_snapshot, **kwargs):
+        """Deserialize a journal.
+
+        :param data: serialized journal
+        :type: bytes
+        :param encode_snapshot: function to encode the state of an adventure into bytes
+        :type: callable
+        :param decode_snapshot: function to create an adventure from a snapshot
+        :type: callable
+        :param kwargs: other arguments of the journal, e.g. ``compaction_size``
+        :type: dict
+        :returns: journal
+        :rtype: :class:`Journal`
+        :raises: :exc:`JournalError` if the data is malformed
+        """
+        try:
+            snapshot_size, location_table_size = _HEADER.unpack_from(data)
+        except struct.error as error:
+            raise JournalError(f"Malformed journal: {error}") from error
+
+        # pylint: disable=protected-access
+        journal = cls(encode_snapshot, decode_snapshot, **kwargs)
+        offset = _HEADER.size
+        journal._snapshot = bytes(data[offset:offset + snapshot_size]) or None
+        offset += snapshot_size
+        location_table = str(data[offset:offset + location_table_size], "utf-8")
+        if location_table:
+            for location_id in location_table.split("\n"):
+                journal._add_location(location_id)
+        journal._events = bytearray(data[offset + location_table_size:])
+        return journal
+
+    def _add_location(self, location_id):
+        """Add a location to the location table.
+
+        :returns: event of a move to the location
+        :rtype: bytes
+        :raises: :exc:`JournalError` if the location table is full
+        """
+        location_index = len(self._location_ids)
+        if location_index > 0xFF:
+            raise JournalError(f"The location '{location_id}' can't be recorded")
+
+        move_event = bytes((_MOVE, location_index))
+        self._location_ids.append(location_id)
+        self._move_events[location_id] = move_event
+        return move_event
+
+    def _read(self):
+        """Read the events.
+
+        :returns: pairs of a command and the identifier of the location it moved to or None
+        :rtype: list with tuple
+        :raises: :exc:`JournalError` if the events are malformed
+        """
+        commands = []
+        events = self._events
+        position = 0
+        try:
+            while position < len(events):
+                event = events[position]
+                position += 1
+                if event == _MOVE:
+                    location_id = self._location_ids[events[position]]
+                    position += 1
+                    if not commands or commands[-1][1] is not None:
+                        raise JournalError("A move doesn't follow a command")
+                    commands[-1] = (commands[-1][0], location_id)
+                else:
+                    commands.append((_EVENT_COMMANDS.get(event, event), None))
+        except IndexError as error:
+            raise JournalError("Malformed events") from error
+        return commands
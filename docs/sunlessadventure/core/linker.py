@@ -0,0 +1,236 @@
+"""Module to link stories ahead of time.
+
+The linker builds every location of a story and resolves the targets of exits and outcomes into
+the locations themselves. Targets are checked while linking, so a linked story never sends
+a player to the default location because of a misspelled identifier. An :class:`Adventure
+<sunlessadventure.core.adventure.Adventure>` over a linked story moves along the resolved links
+without looking locations up by their identifiers. The linker also checks that images of the story
+exist and finds locations, that can't be reached from the start.
+"""
+
+from collections import deque
+from types import MappingProxyType
+
+from sunlessadventure.abstract.location import LocationError, LocationFactory
+from sunlessadventure.core.graph import get_actions
+
+
+class LinkError(Exception):
+    """Exception raised when a story can't be linked."""
+
+
+class LinkedStory(LocationFactory):
+    """Class to keep a story, which locations refer to each other directly.
+
+    All locations are built beforehand, so getting a location never builds or imports anything.
+    ``links`` map exits and outcomes of the story to the locations they lead to.
+    """
+
+    __slots__ = (
+        "_locations",
+        "_default_location_id",
+        "_targets",
+        "_links",
+        "_unreachable_location_ids",
+    )
+
+    def __init__(
+        self,
+        locations,
+        default_location_id,
+        targets,
+        links=None,
+        unreachable_location_ids=(),
+    ):
+        self._locations = locations
+        self._default_location_id = default_location_id
+        self._targets = targets
+        self._links = MappingProxyType(links if links is not None else {})
+        self._unreachable_location_ids = tuple(unreachable_location_ids)
+
+    def get_location(self, location_id):
+        """Get a location by its identifier.
+
+        :param location_id: identifier of the location
+        :type: str
+        :returns: location
+        :rtype: :class:`Location <sunlessadventure.abstract.location.Location>`
+        :raises: :exc:`LocationError <sunlessadventure.abstract.location.LocationError>`
+        """
+        try:
+            return self._locations[location_id]
+        except KeyError as error:
+            raise LocationError(f"Unknown location '{location_id}'") from error
+
+    def get_location_ids(self):
+        """Get identifiers of the locations of the story.
+
+        :returns: identifiers of the locations
+        :rtype: tuple with str
+        """
+        return tuple(self._locations)
+
+    def get_default_location_id(self):
+        """Get the identifier of the default location.
+
+        :returns: identifier of the location
+        :rtype: str
+        """
+        return self._default_location_id
+
+    def get_targets(self, location_id):
+        """Get locations, which a location leads to.
+
+        :param location_id: identifier of the location
+        :type: str
+        :returns: target of the exit, if there is an exit, followed by targets of the outcomes of
+            all actions of the location
+        :rtype: tuple with instances of :class:`Location
+            <sunlessadventure.abstract.location.Location>`
+        :raises: :exc:`LocationError <sunlessadventure.abstract.location.LocationError>`
+        """
+        try:
+            return self._targets[location_id]
+        except KeyError as error:
+            raise LocationError(f"Unknown location '{location_id}'") from error
+
+    @property
+    def links(self):
+        """Read-only mapping of exits and outcomes to the locations they lead to."""
+        return self._links
+
+    @property
+    def unreachable_location_ids(self):
+        """Identifiers of the locations, that can't be reached from the start."""
+        return self._unreachable_location_ids
+
+
+def link_story(location_factory, start_location_ids=None, context=None, image_exists=None):
+    """Link the story of a location factory.
+
+    Every location listed by the factory is built. Actions are taken from
+    :meth:`get_all_actions() <sunlessadventure.abstract.location.Location.get_all_actions>` or
+    from :meth:`get_actions() <sunlessadventure.abstract.location.Location.get_actions>` with
+    the context, if a location can't list all its actions.
+
+    :param location_factory: factory of the story
+    :type: :class:`LocationFactory <sunlessadventure.abstract.location.LocationFactory>`
+    :param start_location_ids: identifiers of the locations, where a player may start. The default
+        location is a start too
+    :type: iterable with str
+    :param context: state of a session to get the depictions and actions of the locations
+    :type: object
+    :param image_exists: function to check that an image exists. Images are not checked if omitted
+    :type: callable
+    :returns: linked story
+    :rtype: :class:`LinkedStory`
+    :raises: :exc:`LinkError` with all problems found, if a target or an image is missing
+    """
+    default_location_id = location_factory.get_default_location_id()
+    location_ids = location_factory.get_location_ids()
+    if not location_ids:
+        raise LinkError("Locations of the factory can't be listed")
+
+    problems = []
+    locations = {}
+    for location_id in location_ids:
+        try:
+            locations[location_id] = location_factory.get_location(location_id)
+        except LocationError as error:
+            problems.append(f"Location '{location_id}' can't be built: {error}")
+
+    targets = {}
+    links = {}
+    images = {}
+    for location_id, location in locations.items():
+        location_targets = []
+        for source, link in _get_links(location, context):
+            target = link.get_target()
+            target_location = locations.get(target)
+            if target_location is None:
+                problems.append(f"{source} leads to the unknown location '{target}'")
+            else:
+                location_targets.append(target_location)
+                links[link] = target_location
+        targets[location_id] = tuple(location_targets)
+
+        for source, image in _get_images(location, context):
+            images.setdefault(image, source)
+
+    if image_exists is not None:
+        for image, source in images.items():
+            if not image_exists(image):
+                problems.append(f"{source} refers to the missing image '{image}'")
+
+    if default_location_id not in locations:
+        problems.append(f"Default location '{default_location_id}' is unknown")
+
+    if problems:
+        raise LinkError("\n".join(problems))
+
+    reached_location_ids = _find_reachable(
+        targets,
+        (default_location_id, *(start_location_ids or ())),
+    )
+    return LinkedStory(
+        locations=locations,
+        default_location_id=default_location_id,
+        targets=targets,
+        links=links,
+        unreachable_location_ids=[
+            location_id for location_id in locations if location_id not in reached_location_ids
+        ],
+    )
+
+
+def _get_links(location, context):
+    """Get the exit and the outcomes of a location.
+
+    :returns: pairs of the description of the source and the exit or the outcome
+    :rtype: list with tuple
+    """
+    links = []
+    exit_ = location.get_exit()
+    if exit_ is not None:
+        links.append((f"Exit of '{location.get_id()}'", exit_))
+
+    for action in get_actions(location, context):
+        outcome = action.get_outcome()
+        if outcome is not None:
+            links.append((f"Action '{action.get_name()}' of '{location.get_id()}'", outcome))
+    return links
+
+
+def _get_images(location, context):
+    """Get images of a location, its actions and their consequences.
+
+    :returns: pairs of the description of the source and the name of the image
+    :rtype: list with tuple
+    """
+    location_id = location.get_id()
+    images = [(f"Location '{location_id}'", location.get_depiction(context).get_image())]
+    for action in get_actions(location, context):
+        source = f"Action '{action.get_name()}' of '{location_id}'"
+        images.append((source, action.get_depiction().get_image()))
+
+        outcome = action.get_outcome()
+        if outcome is None:
+            continue
+        for consequence in outcome.get_consequences():
+            images.append((source, consequence.get_depiction().get_image()))
+            images.extend((source, detail.get_image()) for detail in consequence.get_details())
+    return images
+
+
+def _find_reachable(targets, start_location_ids):
+    """Find identifiers of the locations reachable from the start locations."""
+    reached_location_ids = set()
+    queue = deque(start_location_ids)
+    while queue:
+        location_id = queue.popleft()
+        if location_id in reached_location_ids or location_id not in targets:
+            continue
+
+        reached_location_ids.add(location_id)
+        queue.extend(location.get_id() for location in targets[location_id])
+    return reached_location_ids
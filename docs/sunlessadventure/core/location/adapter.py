@@ -0,0 +1,168 @@
+"""Module with classes to use synchronous locations as asynchronous ones.
+
+Adapters let an :class:`AsyncAdventure <sunlessadventure.core.asynchronous.AsyncAdventure>` play
+a story made of static locations, e.g. a story, which part is loaded from a slow source. Adapters
+don't suspend and are built once per location, actions are adapted once per sequence of actions,
+so a static location costs a method call per operation on top of the location itself.
+"""
+
+from sunlessadventure.abstract.location import AsyncLocation, AsyncLocationFactory
+from sunlessadventure.core.action.adapter import adapt_actions
+
+
+# Sequences of actions of a location, that are adapted at most, e.g. one per variant of
+# the location. Locations, which build new sequences on every call, don't fill the memory
+_MAX_ADAPTED_ACTIONS = 16
+
+
+class SyncLocationAdapter(AsyncLocation):
+    """Class to use a :class:`Location <sunlessadventure.abstract.location.Location>` as
+    an :class:`AsyncLocation <sunlessadventure.abstract.location.AsyncLocation>`.
+
+    The adapter delegates every call to the adapted ``location``. Actions are adapted once per
+    sequence of actions the location returns, so a location, that alternates between variants,
+    reuses the adapted actions of each variant.
+    """
+
+    __slots__ = (
+        "_location",
+        "_adapted_actions",
+        "_adapted_all_actions",
+        "__weakref__",
+    )
+
+    def __init__(self, location):
+        self._location = location
+        self._adapted_actions = {}
+        self._adapted_all_actions = None
+
+    def get_id(self):
+        """Get identifier of the location.
+
+        :returns: identifier of the location
+        :rtype: str
+        """
+        return self._location.get_id()
+
+    async def visit(self, context):
+        """Visit the location.
+
+        :param context: state of the session, e.g. the progress of a player
+        :type: object
+        """
+        self._location.visit(context)
+
+    async def get_depiction(self, context):
+        """Get depiction of the location.
+
+        :param context: state of the session, e.g. the progress of a player
+        :type: object
+        :returns: depiction of the location
+        :rtype: :class:`Depiction <sunlessadventure.abstract.depiction.Depiction>`
+        """
+        return self._location.get_depiction(context)
+
+    async def get_actions(self, context):
+        """Get actions available in the location.
+
+        :param context: state of the session, e.g. the progress of a player
+        :type: object
+        :returns: list of available actions
+        :rtype: tuple with instances of
+            :class:`SyncActionAdapter <sunlessadventure.core.action.adapter.SyncActionAdapter>`
+        """
+        actions = self._location.get_actions(context)
+        # The sequence is kept in the entry, so its identifier isn't reused
+        cached_actions, adapted_actions = self._adapted_actions.get(id(actions), (None, None))
+        if cached_actions is not actions:
+            if len(self._adapted_actions) >= _MAX_ADAPTED_ACTIONS:
+                self._adapted_actions.clear()
+            adapted_actions = adapt_actions(actions)
+            self._adapted_actions[id(actions)] = (actions, adapted_actions)
+        return adapted_actions
+
+    def get_exit(self):
+        """Get exit.
+
+        :returns: information about the exit from the location
+        :rtype: :class:`Exit <sunlessadventure.abstract.location.Exit>` or None, if there is
+            no exit
+        """
+        return self._location.get_exit()
+
+    def get_state_key(self, context):
+        """Get a key of the session state the content of the location depends on.
+
+        :param context: state of the session, e.g. the progress of a player
+        :type: object
+        :returns: hashable key or None, if the content must not be cached
+        :rtype: hashable
+        """
+        return self._location.get_state_key(context)
+
+    def get_all_actions(self):
+        """Get all actions the location may offer in any session.
+
+        :returns: all actions of the location or an empty tuple, if they can't be listed
+        :rtype: tuple with instances of
+            :class:`SyncActionAdapter <sunlessadventure.core.action.adapter.SyncActionAdapter>`
+        """
+        if self._adapted_all_actions is None:
+            self._adapted_all_actions = adapt_actions(self._location.get_all_actions())
+        return self._adapted_all_actions
+
+    @property
+    def location(self):
+        """Adapted location."""
+        return self._location
+
+
+class SyncLocationFactoryAdapter(AsyncLocationFactory):
+    """Class to use a :class:`LocationFactory <sunlessadventure.abstract.location.LocationFactory>`
+    as an :class:`AsyncLocationFactory <sunlessadventure.abstract.location.AsyncLocationFactory>`.
+
+    An adapter is built once per location returned by the adapted ``location_factory``.
+    """
+
+    __slots__ = ("_location_factory", "_adapters")
+
+    def __init__(self, location_factory):
+        self._location_factory = location_factory
+        self._adapters = {}
+
+    async def get_location(self, location_id):
+        """Get a location by its identifier.
+
+        :param location_id: identifier of the location
+        :type: str
+        :returns: location
+        :rtype: :class:`SyncLocationAdapter`
+        :raises: :exc:`LocationError <sunlessadventure.abstract.location.LocationError>`
+        """
+        location = self._location_factory.get_location(location_id)
+        adapter = self._adapters.get(location_id)
+        if adapter is None or adapter.location is not location:
+            adapter = SyncLocationAdapter(location)
+            self._adapters[location_id] = adapter
+        return adapter
+
+    def get_default_location_id(self):
+        """Get the identifier of the default location.
+
+        :returns: identifier of the location
+        :rtype: str
+        """
+        return self._location_factory.get_default_location_id()
+
+    def get_location_ids(self):
+        """Get identifiers of all locations the factory can build.
+
+        :returns: identifiers of the locations or an empty tuple, if they can't be listed
+        :rtype: tuple with str
+        """
+        return self._location_factory.get_location_ids()
+
+    @property
+    def location_factory(self):
+        """Adapted location factory."""
+        return self._location_factory
@@ -1,14 +1,17 @@
 """Module with classes to work with static locations."""
 
 from sunlessadventure.abstract.location import Exit, Location
+from sunlessadventure.core.flyweight import intern_string
 
 
 class StaticExit(Exit):
     """Class to manage a static exit from a location."""
 
+    __slots__ = ("_name", "_target")
+
     def __init__(self, name, target):
-        self._name = str(name)
-        self._target = str(target)
+        self._name = intern_string(name)
+        self._target = intern_string(target)
 
     def get_name(self):
         """Get name of the exit.
@@ -30,14 +33,21 @@ class StaticExit(Exit):
 class StaticLocation(Location):
     """Class to manage a static location."""
 
+    __slots__ = ("_id", "_depiction", "_actions", "_exit", "__weakref__")
+
     def __init__(self, location_id, depiction, actions=(), exit_=None):
-        self._id = str(location_id)
+        self._id = intern_string(location_id)
         self._depiction = depiction
         self._actions = tuple(actions)
         self._exit = exit_
 
-    def visit(self):
-        """Visit the location."""
+    def visit(self, context):
+        """Visit the location.
+
+        :param context: state of the session, e.g. the progress of a player
+        :type: object
+        """
+        # pylint: disable=unused-argument
 
     def get_id(self):
         """Get identifier of the location.
@@ -47,20 +57,26 @@ class StaticLocation(Location):
         """
         return self._id
 
-    def get_depiction(self):
+    def get_depiction(self, context):
         """Get depiction of the location.
 
+        :param context: state of the session, e.g. the progress of a player
+        :type: object
         :returns: depiction of the location
         :rtype: :class:`Depiction <sunlessadventure.abstract.depiction.Depiction>`
         """
+        # pylint: disable=unused-argument
         return self._depiction
 
-    def get_actions(self):
+    def get_actions(self, context):
         """Get actions available in the location.
 
+        :param context: state of the session, e.g. the progress of a player
+        :type: object
         :returns: list of available actions
         :rtype: iterable with instances of :class:`Action <sunlessadventure.abstract.action.Action>`
         """
+        # pylint: disable=unused-argument
         return self._actions
 
     def get_exit(self):
@@ -70,3 +86,22 @@ class StaticLocation(Location):
         :rtype: :class:`Exit` or None, if there is no exit
         """
         return self._exit
+
+    def get_all_actions(self):
+        """Get all actions the location may offer in any session.
+
+        :returns: actions of the location
+        :rtype: tuple with instances of :class:`Action`
+        """
+        return self._actions
+
+    def get_state_key(self, context):
+        """Get a key of the session state the content of the location depends on.
+
+        :param context: state of the session, e.g. the progress of a player
+        :type: object
+        :returns: empty tuple, because the content never changes
+        :rtype: tuple
+        """
+        # pylint: disable=unused-argument
+        return ()
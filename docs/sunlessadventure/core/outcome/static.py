@@ -1,14 +1,21 @@
 """Module to manage static outcomes."""
 
 from sunlessadventure.abstract.outcome import Detail, Consequence, Outcome
+from sunlessadventure.core.flyweight import Flyweight, intern_string
 
 
-class StaticDetail(Detail):
-    """Class to manage a single static detail of a consequence."""
+class StaticDetail(Flyweight, Detail):
+    """Class to manage a single static detail of a consequence.
 
-    def __init__(self, description, image):
-        self._description = str(description)
-        self._image = str(image)
+    Equal details are the same object.
+    """
+
+    __slots__ = ("_description", "_image")
+
+    _FIELDS = __slots__
+
+    def __new__(cls, description, image):
+        return cls._share(str(description), intern_string(image))
 
     def get_description(self):
         """Get description of the detail.
@@ -30,9 +37,11 @@ class StaticDetail(Detail):
 class StaticConsequence(Consequence):
     """Class to manage a consequence of an action."""
 
+    __slots__ = ("_depiction", "_resolution", "_details", "__weakref__")
+
     def __init__(self, depiction, resolution, details=()):
         self._depiction = depiction
-        self._resolution = str(resolution)
+        self._resolution = intern_string(resolution)
         self._details = tuple(details)
 
     def get_depiction(self):
@@ -59,12 +68,22 @@ class StaticConsequence(Consequence):
         """
         return self._resolution
 
+    def get_state_key(self):
+        """Get a key of the state the content of the consequence depends on.
+
+        :returns: empty tuple, because the content never changes
+        :rtype: tuple
+        """
+        return ()
+
 
 class StaticOutcome(Outcome):
     """Class to manage a static outcome of an action."""
 
+    __slots__ = ("_target", "_consequences")
+
     def __init__(self, target, consequences=()):
-        self._target = str(target)
+        self._target = intern_string(target)
         self._consequences = tuple(consequences)
 
     def get_consequences(self):
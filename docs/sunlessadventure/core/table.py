@@ -0,0 +1,526 @@
+"""Module to run adventures over compiled story tables."""
+
+from types import MappingProxyType
+
+from sunlessadventure.abstract.location import LocationError
+from sunlessadventure.core.adventure import AdventureStateError
+from sunlessadventure.core.cache import DESCRIPTION_CACHE, encode_description
+from sunlessadventure.core.bundle.format import (
+    NONE,
+    STATIC_TYPE,
+    DEPICTION_FIELDS,
+    DETAIL_FIELDS,
+    CONSEQUENCE_FIELDS,
+    OUTCOME_FIELDS,
+    ACTION_FIELDS,
+    LOCATION_FIELDS,
+)
+
+
+class StoryTable:
+    """Class to keep a story in flat tables addressed by integer identifiers.
+
+    The tables are compiled from the bundle of a :class:`BundleLocationFactory
+    <sunlessadventure.core.bundle.loader.BundleLocationFactory>`. Locations missing in the bundle
+    are requested from the factory and described through :data:`DESCRIPTION_CACHE
+    <sunlessadventure.core.cache.DESCRIPTION_CACHE>`, because their content may depend on
+    the session. Outcomes of their actions are added to the tables by their content once per
+    action, so equal outcomes share the same row. Descriptions of rows are immutable and shared
+    between sessions.
+    """
+
+    def __init__(self, location_factory):
+        # pylint: disable=too-many-instance-attributes
+        self._location_factory = location_factory
+
+        self.location_rows = {}
+        self.location_descriptions = []
+        self.location_encodings = []
+        self.location_actions = []
+        self.location_exits = []
+        self.location_objects = []
+        self.location_effects = []
+
+        self.action_outcomes = []
+        self.action_effects = []
+
+        self.outcome_targets = []
+        self.outcome_consequences = []
+
+        self.consequence_views = []
+        self.consequence_descriptions = []
+        self.consequence_encodings = []
+
+        self._outcome_rows = {}
+        self._consequence_rows = {}
+        self._action_outcome_rows = {}
+
+        bundle = location_factory.bundle
+        for location_id in bundle.get_location_ids():
+            self._compile_location(bundle, bundle.find_location(location_id))
+
+        self.default_location_row = self.get_location_row(
+            location_factory.get_default_location_id(),
+        )
+
+    def get_location_row(self, location_id):
+        """Get the row of a location.
+
+        :param location_id: identifier of the location
+        :type: str
+        :returns: index of the row
+        :rtype: int
+        :raises: :exc:`LocationError <sunlessadventure.abstract.location.LocationError>` if there is
+            no such location
+        """
+        row = self.location_rows.get(location_id)
+        if row is None:
+            location = self._location_factory.get_location(location_id)
+            row = self._add_location(
+                location_id=location_id,
+                view=None,
+                actions=None,
+                exit_=None,
+                location=location,
+                effect=location,
+            )
+        return row
+
+    def add_outcome(self, outcome):
+        """Add an outcome to the tables.
+
+        :param outcome: outcome of an action
+        :type: :class:`Outcome <sunlessadventure.abstract.outcome.Outcome>`
+        :returns: index of the outcome row
+        :rtype: int
+        """
+        consequences = []
+        for consequence in outcome.get_consequences():
+            depiction = consequence.get_depiction()
+            consequences.append(self._add_consequence((
+                (depiction.get_image(), depiction.get_title(), depiction.get_description()),
+                tuple(
+                    (detail.get_image(), detail.get_description())
+                    for detail in consequence.get_details()
+                ),
+                consequence.get_resolution(),
+            )))
+        return self._add_outcome(outcome.get_target(), tuple(consequences))
+
+    def get_outcome_row(self, action, outcome):
+        """Get the row of an outcome of an action of a location missing in the bundle.
+
+        The outcome is added to the tables, unless the action returned it before.
+
+        :param action: performed action
+        :type: :class:`Action <sunlessadventure.abstract.action.Action>`
+        :param outcome: outcome of the action
+        :type: :class:`Outcome <sunlessadventure.abstract.outcome.Outcome>`
+        :returns: index of the outcome row
+        :rtype: int
+        """
+        cached_action, cached_outcome, row = self._action_outcome_rows.get(
+            id(action),
+            (None, None, None),
+        )
+        if cached_action is not action or cached_outcome is not outcome:
+            row = self.add_outcome(outcome)
+            # The action is kept in the entry, so its identifier isn't reused
+            self._action_outcome_rows[id(action)] = (action, outcome, row)
+        return row
+
+    def encode_location(self, row):
+        """Get the JSON description of a location, which content doesn't depend on the session.
+
+        :param row: index of the location row
+        :type: int
+        :returns: UTF-8 encoded JSON description of the location
+        :rtype: bytes
+        """
+        encoding = self.location_encodings[row]
+        if encoding is None:
+            encoding = encode_description(self.location_descriptions[row])
+            self.location_encodings[row] = encoding
+        return encoding
+
+    def encode_consequence(self, row):
+        """Get the JSON description of a consequence.
+
+        :param row: index of the consequence row
+        :type: int
+        :returns: UTF-8 encoded JSON description of the consequence
+        :rtype: bytes
+        """
+        encoding = self.consequence_encodings[row]
+        if encoding is None:
+            encoding = encode_description(self.consequence_descriptions[row])
+            self.consequence_encodings[row] = encoding
+        return encoding
+
+    def _compile_location(self, bundle, index):
+        """Compile a location record of the bundle."""
+        get_string = bundle.get_string
+        offset = index * LOCATION_FIELDS
+        (
+            location_id,
+            location_type,
+            depiction,
+            first_action,
+            action_count,
+            exit_name,
+            exit_target,
+        ) = bundle.locations[offset:offset + LOCATION_FIELDS]
+        location_id = get_string(location_id)
+
+        location = None
+        if get_string(location_type) != STATIC_TYPE:
+            location = self._location_factory.get_location(location_id)
+
+        action_views = []
+        action_rows = []
+        for position, action in enumerate(bundle.get_references(first_action, action_count)):
+            offset = action * ACTION_FIELDS
+            action_type, name, action_depiction, outcome, *_ = bundle.actions[
+                offset:offset + ACTION_FIELDS
+            ]
+            action_views.append(
+                _compile_depiction(bundle, action_depiction) + (get_string(name),),
+            )
+
+            effect = None
+            if get_string(action_type) != STATIC_TYPE:
+                if location is None:
+                    location = self._location_factory.get_location(location_id)
+                effect = location.get_all_actions()[position]
+
+            action_rows.append(len(self.action_outcomes))
+            self.action_outcomes.append(self._compile_outcome(bundle, outcome))
+            self.action_effects.append(effect)
+
+        exit_ = None
+        if exit_target != NONE:
+            exit_ = (get_string(exit_name), get_string(exit_target))
+
+        self._add_location(
+            location_id=location_id,
+            view=(
+                location_id,
+                _compile_depiction(bundle, depiction),
+                tuple(action_views),
+                exit_[0] if exit_ is not None else None,
+            ),
+            actions=tuple(action_rows),
+            exit_=exit_,
+            location=location,
+            effect=location if get_string(location_type) != STATIC_TYPE else None,
+        )
+
+    def _compile_outcome(self, bundle, index):
+        """Compile an outcome record of the bundle."""
+        get_string = bundle.get_string
+        offset = index * OUTCOME_FIELDS
+        target, first_consequence, consequence_count = bundle.outcomes[
+            offset:offset + OUTCOME_FIELDS
+        ]
+
+        consequences = []
+        for consequence in bundle.get_references(first_consequence, consequence_count):
+            offset = consequence * CONSEQUENCE_FIELDS
+            depiction, resolution, first_detail, detail_count = bundle.consequences[
+                offset:offset + CONSEQUENCE_FIELDS
+            ]
+            details = []
+            for detail in bundle.get_references(first_detail, detail_count):
+                offset = detail * DETAIL_FIELDS
+                description, image = bundle.details[offset:offset + DETAIL_FIELDS]
+                details.append((get_string(image), get_string(description)))
+
+            consequences.append(self._add_consequence((
+                _compile_depiction(bundle, depiction),
+                tuple(details),
+                get_string(resolution),
+            )))
+
+        return self._add_outcome(get_string(target), tuple(consequences))
+
+    def _add_location(self, location_id, view, actions, exit_, location, effect):
+        """Add a location row."""
+        # pylint: disable=too-many-arguments
+        row = len(self.location_descriptions)
+        self.location_rows[location_id] = row
+        self.location_descriptions.append(_describe_location(view) if view is not None else None)
+        self.location_encodings.append(None)
+        self.location_actions.append(actions)
+        self.location_exits.append(exit_)
+        self.location_objects.append(location)
+        self.location_effects.append(effect)
+        return row
+
+    def _add_outcome(self, target, consequences):
+        """Add an outcome row unless there is an equal one."""
+        key = (target, consequences)
+        row = self._outcome_rows.get(key)
+        if row is None:
+            row = len(self.outcome_targets)
+            self._outcome_rows[key] = row
+            self.outcome_targets.append(target)
+            self.outcome_consequences.append(consequences)
+        return row
+
+    def _add_consequence(self, view):
+        """Add a consequence row unless there is an equal one."""
+        row = self._consequence_rows.get(view)
+        if row is None:
+            row = len(self.consequence_views)
+            self._consequence_rows[view] = row
+            self.consequence_views.append(view)
+            self.consequence_descriptions.append(_describe_consequence(view))
+            self.consequence_encodings.append(None)
+        return row
+
+
+class TableAdventure:
+    """Class to manage an adventure over a compiled story table.
+
+    The adventure has the same interface and produces the same descriptions as
+    :class:`Adventure <sunlessadventure.core.adventure.Adventure>`.
+    """
+
+    __slots__ = ("_table", "_context", "_location", "_outcome", "_consequence_index")
+
+    def __init__(self, story_table, start_location_id, context=None):
+        self._table = story_table
+        self._context = context
+        self._outcome = None
+        self._consequence_index = 0
+
+        try:
+            row = story_table.get_location_row(start_location_id)
+        except LocationError:
+            row = story_table.default_location_row
+        self._visit(row)
+
+    @property
+    def context(self):
+        """State of the session passed to locations and actions."""
+        return self._context
+
+    def describe_location(self):
+        """Describe the current location.
+
+        :returns: a structured immutable description of the current location, shared between
+            sessions
+        :rtype: :class:`types.MappingProxyType`
+        :raises: :exc:`AdventureStateError <sunlessadventure.core.adventure.AdventureStateError>`
+            if the location can't be described at the moment. For instance, if there is
+            an unresolved consequence
+        """
+        if self._outcome is not None:
+            raise AdventureStateError("There is an unresolved consequence")
+
+        table = self._table
+        description = table.location_descriptions[self._location]
+        if description is None:
+            return DESCRIPTION_CACHE.describe_location(
+                table.location_objects[self._location],
+                self._context,
+            )
+        return description
+
+    def describe_location_json(self):
+        """Describe the current location in JSON.
+
+        :returns: UTF-8 encoded JSON description of the current location
+        :rtype: bytes
+        :raises: :exc:`AdventureStateError <sunlessadventure.core.adventure.AdventureStateError>`
+            if the location can't be described at the moment. For instance, if there is
+            an unresolved consequence
+        """
+        if self._outcome is not None:
+            raise AdventureStateError("There is an unresolved consequence")
+
+        table = self._table
+        if table.location_descriptions[self._location] is None:
+            return DESCRIPTION_CACHE.encode_location(
+                table.location_objects[self._location],
+                self._context,
+            )
+        return table.encode_location(self._location)
+
+    def describe_consequence(self):
+        """Describe the current consequence.
+
+        :returns: a structured immutable description of the current consequence, shared between
+            sessions
+        :rtype: :class:`types.MappingProxyType`
+        :raises: :exc:`AdventureStateError <sunlessadventure.core.adventure.AdventureStateError>`
+            if the consequence can't be described at the moment. For instance, if there is
+            no consequence
+        """
+        if self._outcome is None:
+            raise AdventureStateError("There is no consequence")
+
+        table = self._table
+        consequence = table.outcome_consequences[self._outcome][self._consequence_index]
+        return table.consequence_descriptions[consequence]
+
+    def describe_consequence_json(self):
+        """Describe the current consequence in JSON.
+
+        :returns: UTF-8 encoded JSON description of the current consequence
+        :rtype: bytes
+        :raises: :exc:`AdventureStateError <sunlessadventure.core.adventure.AdventureStateError>`
+            if the consequence can't be described at the moment. For instance, if there is
+            no consequence
+        """
+        if self._outcome is None:
+            raise AdventureStateError("There is no consequence")
+
+        table = self._table
+        consequence = table.outcome_consequences[self._outcome][self._consequence_index]
+        return table.encode_consequence(consequence)
+
+    def leave_location(self):
+        """Leave the current location.
+
+        :raises: :exc:`AdventureStateError <sunlessadventure.core.adventure.AdventureStateError>`
+            if the location can't be left. For instance, if there is an unresolved consequence or
+            there is no exit.
+        """
+        if self._outcome is not None:
+            raise AdventureStateError("There is an unresolved consequence")
+
+        table = self._table
+        location = table.location_objects[self._location]
+        if table.location_descriptions[self._location] is None:
+            exit_ = location.get_exit()
+            target = exit_.get_target() if exit_ is not None else None
+        else:
+            exit_ = table.location_exits[self._location]
+            target = exit_[1] if exit_ is not None else None
+
+        if target is None:
+            raise AdventureStateError("There is no exit")
+
+        self._change_location(target)
+
+    def perform_action(self, action_index):
+        """Perform an action.
+
+        :param action_index: index of the action, negative indices don't address actions
+        :type: int
+        :raises: :exc:`AdventureStateError <sunlessadventure.core.adventure.AdventureStateError>`
+            if the action can't be performed. For instance, if there is an unresolved consequence.
+        """
+        if self._outcome is not None:
+            raise AdventureStateError("There is an unresolved consequence")
+
+        if action_index < 0:
+            raise AdventureStateError(f"There is no action at the position '{action_index}'")
+        table = self._table
+        actions = table.location_actions[self._location]
+        try:
+            if actions is None:
+                action = table.location_objects[self._location].get_actions(self._context)[
+                    action_index
+                ]
+            else:
+                action = actions[action_index]
+        except IndexError as error:
+            raise AdventureStateError(
+                f"There is no action at the position '{action_index}'",
+            ) from error
+
+        if actions is None:
+            outcome = table.get_outcome_row(action, action.perform(self._context))
+        else:
+            effect = table.action_effects[action]
+            if effect is not None:
+                effect.perform(self._context)
+            outcome = table.action_outcomes[action]
+
+        if table.outcome_consequences[outcome]:
+            self._outcome = outcome
+            self._consequence_index = 0
+        else:
+            self._change_location(table.outcome_targets[outcome])
+
+    def resolve_consequence(self):
+        """Resolve the active consequence.
+
+        :raises: :exc:`AdventureStateError <sunlessadventure.core.adventure.AdventureStateError>`
+            if the consequence can't be resolved at the moment. For instance, if there is
+            no consequence
+        """
+        outcome = self._outcome
+        if outcome is None:
+            raise AdventureStateError("There is no consequence")
+
+        self._consequence_index += 1
+        if self._consequence_index >= len(self._table.outcome_consequences[outcome]):
+            self._change_location(self._table.outcome_targets[outcome])
+
+    def _change_location(self, location_id):
+        """Change the current location.
+
+        :param location_id: identifier of the new location
+        :type location_id: str
+        """
+        try:
+            row = self._table.get_location_row(location_id)
+        except LocationError:
+            row = self._table.default_location_row
+        self._visit(row)
+
+    def _visit(self, row):
+        """Visit a location by its row."""
+        effect = self._table.location_effects[row]
+        if effect is not None:
+            effect.visit(self._context)
+
+        self._location = row
+        self._outcome = None
+        self._consequence_index = 0
+
+
+def _compile_depiction(bundle, index):
+    """Compile a depiction record of the bundle into its view."""
+    offset = index * DEPICTION_FIELDS
+    title, description, image = bundle.depictions[offset:offset + DEPICTION_FIELDS]
+    return bundle.get_string(image), bundle.get_string(title), bundle.get_string(description)
+
+
+def _describe_location(view):
+    """Describe a location by its view."""
+    location_id, depiction, actions, exit_ = view
+    return MappingProxyType({
+        "id": location_id,
+        "depiction": _describe_depiction(depiction),
+        "actions": tuple(
+            MappingProxyType({
+                "depiction": _describe_depiction(action[:3]),
+                "name": action[3],
+            })
+            for action in actions
+        ),
+        "exit": exit_,
+    })
+
+
+def _describe_consequence(view):
+    """Describe a consequence by its view."""
+    depiction, details, resolution = view
+    return MappingProxyType({
+        "depiction": _describe_depiction(depiction),
+        "details": tuple(
+            MappingProxyType({"image": image, "description": description})
+            for image, description in details
+        ),
+        "resolution": resolution,
+    })
+
+
+def _describe_depiction(view):
+    """Describe a depiction by its view."""
+    image, title, description = view
+    return MappingProxyType({"image": image, "title": title, "description": description})
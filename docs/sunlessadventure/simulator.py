@@ -0,0 +1,441 @@
+"""Module to drive adventures through simulated walks without a user interface.
+
+The simulator plays many sessions, measures the throughput of the engine and the latency of each
+operation. For instance, Sunless CV is simulated with::
+
+    python -m sunlessadventure.simulator \\
+        --factory sunlesscv.location.factory:LocationFactory \\
+        --context sunlesscv.progress.manager:create_progress_manager \\
+        --sessions 100 --steps 10000 --policy coverage
+
+A step is one description of the screen followed by one command: an action, leaving
+the location or resolving a consequence. A session stops early, if it reaches a dead end,
+a location without actions and without an exit. Dead ends are counted in the report.
+"""
+
+import argparse
+import functools
+import gc
+import importlib
+import json
+import random
+import sys
+import time
+import tracemalloc
+from array import array
+from collections import Counter
+
+from sunlessadventure.core.adventure import Adventure, AdventureStateError
+
+
+PERFORM_ACTION = "perform_action"
+LEAVE_LOCATION = "leave_location"
+RESOLVE_CONSEQUENCE = "resolve_consequence"
+DESCRIBE_LOCATION = "describe_location"
+DESCRIBE_CONSEQUENCE = "describe_consequence"
+
+OPERATIONS = (
+    DESCRIBE_LOCATION,
+    DESCRIBE_CONSEQUENCE,
+    PERFORM_ACTION,
+    LEAVE_LOCATION,
+    RESOLVE_CONSEQUENCE,
+)
+
+
+class SimulationError(Exception):
+    """Exception raised when a simulation can't be set up."""
+
+
+class DeadEndError(Exception):
+    """Exception raised when a walk reaches a location, that offers no command.
+
+    The identifier of the location is the argument of the exception.
+    """
+
+
+class UniformPolicy:
+    """Class to choose commands uniformly at random."""
+
+    def __init__(self, seed):
+        self._random = random.Random(seed)
+
+    def choose(self, location):
+        """Choose a command in a location.
+
+        :param location: description of the location
+        :type: mapping
+        :returns: index of an action or None to leave the location
+        :rtype: int
+        :raises: :exc:`DeadEndError` if the location offers no command
+        """
+        command_count = len(location["actions"]) + (location["exit"] is not None)
+        if command_count == 0:
+            raise DeadEndError(location["id"])
+        command = self._random.randrange(command_count)
+        if command == len(location["actions"]):
+            return None
+        return command
+
+
+class CoveragePolicy:
+    """Class to choose commands least used in the session.
+
+    Ties are broken at random, so the walk explores every command of the visited locations.
+    """
+
+    def __init__(self, seed):
+        self._random = random.Random(seed)
+        self._usage = Counter()
+
+    def choose(self, location):
+        """Choose a command in a location.
+
+        :param location: description of the location
+        :type: mapping
+        :returns: index of an action or None to leave the location
+        :rtype: int
+        :raises: :exc:`DeadEndError` if the location offers no command
+        """
+        commands = list(range(len(location["actions"])))
+        if location["exit"] is not None:
+            commands.append(None)
+        if not commands:
+            raise DeadEndError(location["id"])
+
+        location_id = location["id"]
+        usage = self._usage
+        least_usage = min(usage[location_id, command] for command in commands)
+        command = self._random.choice([
+            command for command in commands if usage[location_id, command] == least_usage
+        ])
+        usage[location_id, command] += 1
+        return command
+
+
+class ScriptPolicy:
+    """Class to choose commands from a script.
+
+    A script is a sequence of action indices and the word "leave". The script is repeated
+    when it is over.
+    """
+
+    def __init__(self, script):
+        commands = []
+        for token in script:
+            if token == "leave":
+                commands.append(None)
+            else:
+                try:
+                    commands.append(int(token))
+                except ValueError as error:
+                    raise SimulationError(f"Unknown command '{token}'") from error
+        if not commands:
+            raise SimulationError("The script is empty")
+
+        self._commands = commands
+        self._position = 0
+
+    def choose(self, location):
+        """Choose a command in a location.
+
+        :param location: description of the location
+        :type: mapping
+        :returns: index of an action or None to leave the location
+        :rtype: int
+        """
+        # pylint: disable=unused-argument
+        command = self._commands[self._position % len(self._commands)]
+        self._position += 1
+        return command
+
+
+class Simulator:
+    """Class to play sessions of an adventure and collect measurements."""
+
+    def __init__(self, location_factory, create_context=None, start_location_id=None):
+        self._location_factory = location_factory
+        self._create_context = create_context
+        if start_location_id is None:
+            start_location_id = location_factory.get_default_location_id()
+        self._start_location_id = start_location_id
+
+    def run(self, sessions, steps, create_policy, trace_allocations=False):
+        """Play sessions and measure them.
+
+        :param sessions: number of sessions
+        :type: int
+        :param steps: number of steps in each session
+        :type: int
+        :param create_policy: function to create the policy of a session by its number
+        :type: callable
+        :param trace_allocations: whether to trace the peak of allocated memory per step. Tracing
+            slows the simulation down, so latencies are not measured in this mode
+        :type: bool
+        :returns: report of the simulation
+        :rtype: dict
+        """
+        latencies = {operation: array("Q") for operation in OPERATIONS}
+        rejected_commands = 0
+        total_steps = 0
+        dead_ends = Counter()
+        peak_bytes = 0
+
+        gc.collect()
+        start_blocks = sys.getallocatedblocks()
+        if trace_allocations:
+            tracemalloc.start()
+
+        start_time = time.perf_counter()
+        for session in range(sessions):
+            context = self._create_context() if self._create_context is not None else None
+            adventure = Adventure(
+                location_factory=self._location_factory,
+                start_location_id=self._start_location_id,
+                context=context,
+            )
+            policy = create_policy(session)
+
+            for _ in range(steps):
+                if trace_allocations:
+                    tracemalloc.reset_peak()
+                    current_bytes = tracemalloc.get_traced_memory()[0]
+
+                try:
+                    rejected_commands += _play_step(adventure, policy, latencies)
+                except AdventureStateError:
+                    rejected_commands += 1
+                except DeadEndError as error:
+                    dead_ends[error.args[0]] += 1
+                    break
+                total_steps += 1
+
+                if trace_allocations:
+                    peak_bytes += tracemalloc.get_traced_memory()[1] - current_bytes
+        elapsed_time = time.perf_counter() - start_time
+
+        if trace_allocations:
+            tracemalloc.stop()
+        retained_blocks = sys.getallocatedblocks() - start_blocks
+
+        report = {
+            "sessions": sessions,
+            "steps": total_steps,
+            "seconds": elapsed_time,
+            "steps_per_second": total_steps / elapsed_time if elapsed_time else 0,
+            "rejected_commands": rejected_commands,
+            "dead_ends": dict(dead_ends),
+            "retained_blocks_per_step": retained_blocks / total_steps if total_steps else 0,
+        }
+        if trace_allocations:
+            report["peak_bytes_per_step"] = peak_bytes / total_steps if total_steps else 0
+        else:
+            report["operations"] = {
+                operation: _summarize(operation_latencies)
+                for operation, operation_latencies in latencies.items()
+                if operation_latencies
+            }
+        return report
+
+
+def _play_step(adventure, policy, latencies):
+    """Describe the screen and play one command.
+
+    :returns: number of rejected commands
+    :rtype: int
+    :raises: :exc:`DeadEndError` if the location offers no command
+    """
+    clock = time.perf_counter_ns
+
+    start = clock()
+    try:
+        location = adventure.describe_location()
+    except AdventureStateError:
+        adventure.describe_consequence()
+        latencies[DESCRIBE_CONSEQUENCE].append(clock() - start)
+
+        start = clock()
+        adventure.resolve_consequence()
+        latencies[RESOLVE_CONSEQUENCE].append(clock() - start)
+        return 0
+    latencies[DESCRIBE_LOCATION].append(clock() - start)
+
+    if not location["actions"] and location["exit"] is None:
+        raise DeadEndError(location["id"])
+    command = policy.choose(location)
+    if command is None:
+        if location["exit"] is None:
+            return 1
+        start = clock()
+        adventure.leave_location()
+        latencies[LEAVE_LOCATION].append(clock() - start)
+    else:
+        if command >= len(location["actions"]):
+            return 1
+        start = clock()
+        adventure.perform_action(command)
+        latencies[PERFORM_ACTION].append(clock() - start)
+    return 0
+
+
+def _summarize(latencies):
+    """Summarize latencies of an operation in microseconds."""
+    latencies = sorted(latencies)
+    count = len(latencies)
+
+    def get_percentile(percentile):
+        return latencies[min(count - 1, count * percentile // 100)] / 1000
+
+    return {
+        "count": count,
+        "mean_us": sum(latencies) / count / 1000,
+        "p50_us": get_percentile(50),
+        "p90_us": get_percentile(90),
+        "p99_us": get_percentile(99),
+        "max_us": latencies[-1] / 1000,
+    }
+
+
+def create_policy_by_name(name, session, seed=0, script=()):
+    """Create the policy of a session by the name of the policy.
+
+    :param name: name of the policy: "uniform", "coverage" or "script"
+    :type: str
+    :param session: number of the session
+    :type: int
+    :param seed: seed of the first session
+    :type: int
+    :param script: commands of the script policy
+    :type: iterable with str
+    :returns: policy of the session
+    :rtype: :class:`UniformPolicy`, :class:`CoveragePolicy` or :class:`ScriptPolicy`
+    :raises: :exc:`SimulationError` if the policy is unknown
+    """
+    if name == "uniform":
+        return UniformPolicy(seed + session)
+    if name == "coverage":
+        return CoveragePolicy(seed + session)
+    if name == "script":
+        return ScriptPolicy(script)
+    raise SimulationError(f"Unknown policy '{name}'")
+
+
+def load_callable(reference):
+    """Load a callable by its reference.
+
+    :param reference: reference in the format "module:name"
+    :type: str
+    :returns: the referenced callable
+    :rtype: callable
+    :raises: :exc:`SimulationError` if the reference can't be resolved
+    """
+    module_name, _, name = reference.partition(":")
+    if not module_name or not name:
+        raise SimulationError(f"Malformed reference '{reference}'")
+
+    try:
+        return getattr(importlib.import_module(module_name), name)
+    except (ImportError, AttributeError) as error:
+        raise SimulationError(f"Unknown callable '{reference}'") from error
+
+
+def format_report(report):
+    """Format a report of a simulation for humans.
+
+    :param report: report of the simulation
+    :type: dict
+    :returns: formatted report
+    :rtype: str
+    """
+    lines = [
+        f"sessions: {report['sessions']}",
+        f"steps: {report['steps']}",
+        f"seconds: {report['seconds']:.3f}",
+        f"steps/sec: {report['steps_per_second']:.0f}",
+        f"rejected commands: {report['rejected_commands']}",
+        f"retained blocks/step: {report['retained_blocks_per_step']:.4f}",
+    ]
+    for location_id, count in report.get("dead_ends", {}).items():
+        lines.append(f"dead end: {location_id} in {count} sessions")
+    if "peak_bytes_per_step" in report:
+        lines.append(f"peak bytes/step: {report['peak_bytes_per_step']:.1f}")
+
+    for operation, summary in report.get("operations", {}).items():
+        lines.append(
+            f"{operation}: count={summary['count']} mean={summary['mean_us']:.2f}us "
+            f"p50={summary['p50_us']:.2f}us p90={summary['p90_us']:.2f}us "
+            f"p99={summary['p99_us']:.2f}us max={summary['max_us']:.2f}us"
+        )
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    """Simulate sessions of an adventure and print the measurements.
+
+    :param argv: command line arguments
+    :type: list with str
+    """
+    parser = argparse.ArgumentParser(description=main.__doc__.splitlines()[0])
+    parser.add_argument("--factory", required=True, help="location factory as 'module:callable'")
+    parser.add_argument("--context", help="function to create a session context as 'module:name'")
+    parser.add_argument("--start", help="identifier of the start location")
+    parser.add_argument("--sessions", type=int, default=1, help="number of sessions")
+    parser.add_argument("--steps", type=int, default=100000, help="number of steps per session")
+    parser.add_argument("--seed", type=int, default=0, help="seed of the first session")
+    parser.add_argument(
+        "--policy",
+        choices=("uniform", "coverage", "script"),
+        default="uniform",
+        help="how to choose commands",
+    )
+    parser.add_argument(
+        "--script",
+        nargs="*",
+        default=(),
+        help="commands of the script policy: action indices and 'leave'",
+    )
+    parser.add_argument(
+        "--trace-allocations",
+        action="store_true",
+        help="measure the peak of allocated memory per step instead of latencies",
+    )
+    parser.add_argument("--json", action="store_true", help="print the report in JSON")
+    arguments = parser.parse_args(argv)
+
+    try:
+        location_factory = load_callable(arguments.factory)()
+        create_context = None
+        if arguments.context is not None:
+            create_context = load_callable(arguments.context)
+
+        create_policy = functools.partial(
+            create_policy_by_name,
+            arguments.policy,
+            seed=arguments.seed,
+            script=arguments.script,
+        )
+        # Fail on a malformed script before the simulation starts
+        create_policy(0)
+    except SimulationError as error:
+        parser.error(str(error))
+
+    simulator = Simulator(
+        location_factory=location_factory,
+        create_context=create_context,
+        start_location_id=arguments.start,
+    )
+    report = simulator.run(
+        sessions=arguments.sessions,
+        steps=arguments.steps,
+        create_policy=create_policy,
+        trace_allocations=arguments.trace_allocations,
+    )
+
+    if arguments.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print(format_report(report))
+
+
+if __name__ == "__main__":
+    main()
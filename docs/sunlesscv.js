@@ -0,0 +1,501 @@
+/*
+ * Rendering layer of Sunless CV.
+ *
+ * The adventure panel is built once. Later screens patch the nodes of the panel: texts and images
+ * are written only if they change, action cards are keyed by the names of the actions and reused
+ * between locations, progress bars are touched only if their values change. Clicks are handled by
+ * a single listener on the panel. The number of DOM operations of every painted message is
+ * reported with console.debug.
+ *
+ * Static screens are pre-rendered into HTML fragments with the markup of the panel, see
+ * sunlesscv/fragment.py. A fragment is parsed once and patched into the panel like a description.
+ * The page is built with the fragment of home in the panel, the renderer adopts that markup.
+ *
+ * The adventure runs in a web worker, see worker.py. The page sends commands to the worker and
+ * paints the changes, which the worker sends back, see sunlesscv/shell.py.
+ */
+(function () {
+  "use strict";
+
+  const PANEL_HTML = `
+    <div class="card">
+      <div class="row g-0">
+        <div class="col-2 col-lg-1" data-sunless-slot="image">
+          <svg class="img-fluid rounded" role="img"><use></use></svg>
+        </div>
+        <div class="col-10 col-lg-11">
+          <div class="card-body p-2">
+            <h4 class="card-title" data-sunless-slot="title"></h4>
+            <p class="card-text" data-sunless-slot="description"></p>
+          </div>
+        </div>
+      </div>
+    </div>
+    <div class="row row-cols-1 ps-2 pt-2 row-gap-2 d-none" data-sunless-slot="actions"></div>
+    <button class="btn btn-dark mt-2 d-none" data-sunless-slot="exit" data-sunless-command="leave"></button>
+    <div class="row row-cols-1 ps-2 pt-2 row-gap-2 d-none" data-sunless-slot="consequence">
+      <div class="col">
+        <div class="card">
+          <ul class="list-group list-group-flush" data-sunless-slot="details"></ul>
+          <div class="card-footer p-2 text-end">
+            <button class="btn btn-primary" data-sunless-slot="resolution" data-sunless-command="resolve"></button>
+          </div>
+        </div>
+      </div>
+    </div>
+  `;
+
+  const ACTION_HTML = `
+    <div class="card">
+      <div class="row g-0">
+        <div class="col-2 col-lg-1" data-sunless-slot="image">
+          <svg class="img-fluid rounded" role="img"><use></use></svg>
+        </div>
+        <div class="col-10 col-lg-11">
+          <div class="card-body p-2">
+            <h4 class="card-title" data-sunless-slot="title"></h4>
+            <p class="card-text" data-sunless-slot="description"></p>
+          </div>
+        </div>
+      </div>
+      <div class="card-footer p-2 text-end">
+        <button class="btn btn-primary" data-sunless-slot="name"></button>
+      </div>
+    </div>
+  `;
+
+  const DETAIL_HTML = `
+    <svg class="float-start rounded pe-2 sunless-detail-image" role="img"><use></use></svg>
+    <span></span>
+  `;
+
+  const SESSION_STORAGE_KEY = "sunlesscv.session";
+
+  /**
+   * Renderer of the adventure panel and the progress bars.
+   *
+   * The panel is adopted, if it holds the markup of a fragment, its key is the attribute
+   * data-sunless-fragment of the panel. Images and fragments are unknown until the worker sends
+   * them, see setAssets.
+   *
+   * @param {Element} panel - element to render the adventure into
+   * @param {function(string)} onCommand - function to apply a command: "leave", "resolve" or
+   *     the index of an action
+   */
+  class Renderer {
+    constructor(panel, onCommand) {
+      this.operations = 0;
+      this.sprites = {};
+      this.fragments = {};
+      this.fragmentScreens = new Map();
+      this.onCommand = onCommand;
+
+      this.fragmentKey = panel.dataset.sunlessFragment || null;
+      if (this.fragmentKey === null) {
+        panel.innerHTML = PANEL_HTML;
+      }
+      const [screenCard, actions, exit, consequence] = panel.children;
+      this.slots = {actions: actions, exit: exit, consequence: consequence};
+      Object.assign(this.slots, findSlots(consequence));
+      this.screen = adoptCard(screenCard);
+      this.actionCards = new Map();
+      const cards = Array.from(actions.children, adoptCard);
+      const keys = getActionKeys(cards.map((card) => card.name.textContent));
+      cards.forEach((card, cardIndex) => this.actionCards.set(keys[cardIndex], card));
+      this.detailItems = Array.from(this.slots.details.children, adoptDetailItem);
+
+      this.progress = new Map();
+      for (const row of document.querySelectorAll("[data-sunless-progress]")) {
+        const name = row.dataset.sunlessProgress;
+        if (!this.progress.has(name)) {
+          this.progress.set(name, {value: 0, rows: []});
+        }
+        this.progress.get(name).rows.push({
+          row: row,
+          progress: row.querySelector(".progress"),
+          bar: row.querySelector(".progress-bar"),
+          isOptional: row.hasAttribute("data-sunless-optional"),
+        });
+      }
+
+      panel.addEventListener("click", (event) => this.handleClick(event));
+    }
+
+    /**
+     * Set the images and the fragments of static screens.
+     *
+     * @param {Object} sprites - symbol of every image by its name, see tools/build_site.py
+     * @param {Object} fragments - HTML fragments of static screens by their keys
+     */
+    setAssets(sprites, fragments) {
+      this.sprites = sprites;
+      this.fragments = fragments;
+    }
+
+    /**
+     * Paint a message of the worker.
+     *
+     * @param {Object} message - changes of the page, see sunlesscv/shell.py
+     */
+    paint(message) {
+      this.operations = 0;
+      if (message.screen !== undefined) {
+        this.renderScreen(...message.screen);
+      }
+      if (message.progress !== undefined) {
+        this.updateProgress(message.progress);
+      }
+      console.debug(`Sunless CV: ${this.operations} DOM operations`);
+    }
+
+    /**
+     * Render a screen.
+     *
+     * @param {string} type - "fragment", "location" or "consequence"
+     * @param {(string|Object)} value - key of the fragment or description of the screen
+     */
+    renderScreen(type, value) {
+      this.fragmentKey = null;
+      if (type === "location") {
+        this.renderLocation(value);
+      } else if (type === "consequence") {
+        this.renderConsequence(value);
+      } else {
+        let screen = this.fragmentScreens.get(value);
+        if (screen === undefined) {
+          screen = readFragment(this.fragments[value]);
+          this.fragmentScreens.set(value, screen);
+        }
+        if (screen.isConsequence) {
+          this.renderConsequence(screen.description);
+        } else {
+          this.renderLocation(screen.description);
+        }
+        this.fragmentKey = value;
+      }
+    }
+
+    renderLocation(location) {
+      this.renderDepiction(this.screen, location.depiction);
+      this.setHidden(this.slots.consequence, true);
+
+      const cards = new Map();
+      const keys = getActionKeys(location.actions.map((action) => action.name));
+      location.actions.forEach((action, actionIndex) => {
+        const key = keys[actionIndex];
+        const card = this.actionCards.get(key) || this.createActionCard();
+        this.renderDepiction(card, action.depiction);
+        this.setText(card.name, action.name);
+        this.setAttribute(card.name, "data-sunless-command", String(actionIndex));
+        this.place(this.slots.actions, card.element, actionIndex);
+        cards.set(key, card);
+      });
+      for (const [key, card] of this.actionCards) {
+        if (cards.get(key) !== card) {
+          this.remove(card.element);
+        }
+      }
+      this.actionCards = cards;
+      this.setHidden(this.slots.actions, !cards.size);
+
+      this.setHidden(this.slots.exit, location.exit === null);
+      if (location.exit !== null) {
+        this.setText(this.slots.exit, `← ${location.exit}`);
+      }
+    }
+
+    renderConsequence(consequence) {
+      this.renderDepiction(this.screen, consequence.depiction);
+      this.setHidden(this.slots.actions, true);
+      this.setHidden(this.slots.exit, true);
+      this.setHidden(this.slots.consequence, false);
+
+      consequence.details.forEach((detail, detailIndex) => {
+        let item = this.detailItems[detailIndex];
+        if (item === undefined) {
+          item = this.createDetailItem();
+          this.detailItems.push(item);
+        }
+        this.renderImage(item.image, detail.image);
+        this.setText(item.description, detail.description);
+        this.setHidden(item.element, false);
+      });
+      for (const item of this.detailItems.slice(consequence.details.length)) {
+        this.setHidden(item.element, true);
+      }
+
+      this.setText(this.slots.resolution, consequence.resolution);
+    }
+
+    /**
+     * Update the progress bars.
+     *
+     * @param {Object} values - percentages of the progress bars, that changed, by their names
+     */
+    updateProgress(values) {
+      for (const [name, value] of Object.entries(values)) {
+        const progress = this.progress.get(name);
+        if (progress === undefined || progress.value === value) {
+          continue;
+        }
+
+        for (const row of progress.rows) {
+          this.setAttribute(row.progress, "aria-valuenow", String(value));
+          this.operations += 1;
+          row.bar.style.width = `${value}%`;
+          if (row.isOptional && !value !== !progress.value) {
+            this.operations += 2;
+            row.row.classList.toggle("invisible", !value);
+            row.row.classList.toggle("d-none", !value);
+          }
+        }
+        progress.value = value;
+      }
+    }
+
+    handleClick(event) {
+      const button = event.target.closest("[data-sunless-command]");
+      if (button === null) {
+        return;
+      }
+
+      this.onCommand(button.getAttribute("data-sunless-command"));
+    }
+
+    renderDepiction(target, depiction) {
+      this.renderImage(target.image, depiction.image);
+      this.setText(target.title, depiction.title);
+      this.setText(target.description, depiction.description);
+    }
+
+    renderImage(image, name) {
+      if (image.dataset.sunlessImage === name) {
+        return;
+      }
+
+      const sprite = this.sprites[name];
+      image.dataset.sunlessImage = name;
+      image.setAttribute("viewBox", sprite.view_box);
+      image.firstChild.setAttribute("href", sprite.href);
+      this.operations += 3;
+    }
+
+    createActionCard() {
+      const element = document.createElement("div");
+      element.className = "col";
+      element.innerHTML = ACTION_HTML;
+      this.operations += 2;
+      return adoptCard(element);
+    }
+
+    createDetailItem() {
+      const element = document.createElement("li");
+      element.className = "list-group-item";
+      element.innerHTML = DETAIL_HTML;
+      this.slots.details.appendChild(element);
+      this.operations += 3;
+      return adoptDetailItem(element);
+    }
+
+    place(parent, element, index) {
+      if (parent.children[index] !== element) {
+        parent.insertBefore(element, parent.children[index] || null);
+        this.operations += 1;
+      }
+    }
+
+    remove(element) {
+      element.remove();
+      this.operations += 1;
+    }
+
+    setText(element, text) {
+      if (element.textContent !== text) {
+        element.textContent = text;
+        this.operations += 1;
+      }
+    }
+
+    setAttribute(element, name, value) {
+      if (element.getAttribute(name) !== value) {
+        element.setAttribute(name, value);
+        this.operations += 1;
+      }
+    }
+
+    setHidden(element, isHidden) {
+      if (element.classList.contains("d-none") !== isHidden) {
+        element.classList.toggle("d-none", isHidden);
+        this.operations += 1;
+      }
+    }
+  }
+
+  /**
+   * Read a fragment into the description of its screen.
+   *
+   * @param {string} fragment - HTML fragment of a screen
+   * @returns {{isConsequence: boolean, description: Object}} description in the format of
+   *     the descriptions of the adventure
+   */
+  function readFragment(fragment) {
+    const template = document.createElement("template");
+    template.innerHTML = fragment;
+    const [card, actions, exit, consequence] = template.content.children;
+    const depiction = readDepiction(card);
+
+    if (!consequence.classList.contains("d-none")) {
+      const slots = findSlots(consequence);
+      return {
+        isConsequence: true,
+        description: {
+          depiction: depiction,
+          details: Array.from(slots.details.children, (item) => ({
+            image: item.querySelector("svg").dataset.sunlessImage,
+            description: item.querySelector("span").textContent,
+          })),
+          resolution: slots.resolution.textContent,
+        },
+      };
+    }
+
+    return {
+      isConsequence: false,
+      description: {
+        depiction: depiction,
+        actions: Array.from(actions.children, (action) => ({
+          depiction: readDepiction(action),
+          name: findSlots(action).name.textContent,
+        })),
+        exit: exit.classList.contains("d-none") ? null : exit.textContent.replace(/^← /, ""),
+      },
+    };
+  }
+
+  function adoptCard(element) {
+    const slots = findSlots(element);
+    return {
+      element: element,
+      image: slots.image.querySelector("svg"),
+      title: slots.title,
+      description: slots.description,
+      name: slots.name,
+    };
+  }
+
+  function adoptDetailItem(element) {
+    return {
+      element: element,
+      image: element.querySelector("svg"),
+      description: element.querySelector("span"),
+    };
+  }
+
+  function getActionKeys(names) {
+    // Names are unique in a location as a rule, repeated names get their own cards
+    const counts = new Map();
+    return names.map((name) => {
+      const count = counts.get(name) || 0;
+      counts.set(name, count + 1);
+      return count ? `${name}\u0000${count}` : name;
+    });
+  }
+
+  function readDepiction(card) {
+    const slots = findSlots(card);
+    return {
+      image: slots.image.querySelector("svg").dataset.sunlessImage,
+      title: slots.title.textContent,
+      description: slots.description.textContent,
+    };
+  }
+
+  function findSlots(root) {
+    const slots = {};
+    for (const element of root.querySelectorAll("[data-sunless-slot]")) {
+      slots[element.dataset.sunlessSlot] = element;
+    }
+    return slots;
+  }
+
+  /**
+   * Start the page.
+   *
+   * The first command clicked before the worker starts the session is sent after it, unless the
+   * worker shows another screen than the panel. Clicks are ignored, while a command waits for
+   * the answer of the worker, and every command carries the token of its screen, so the worker
+   * drops commands sent from a stale screen, see sunlesscv/shell.py.
+   *
+   * @param {Element} panel - element to render the adventure into
+   * @param {Worker} worker - worker running worker.py
+   */
+  function start(panel, worker) {
+    let isStarted = false;
+    let isBusy = false;
+    let screenToken = 0;
+    let pendingCommand = null;
+    const sendCommand = (command) => {
+      isBusy = true;
+      worker.postMessage(JSON.stringify(["command", command, screenToken]));
+    };
+    const renderer = new Renderer(panel, (command) => {
+      if (!isStarted) {
+        pendingCommand = pendingCommand === null ? command : pendingCommand;
+      } else if (!isBusy) {
+        sendCommand(command);
+      }
+    });
+    const prefetchedFiles = new Set();
+
+    worker.onmessage = (event) => {
+      const message = JSON.parse(event.data);
+      if (message.sprites !== undefined) {
+        renderer.setAssets(message.sprites, message.fragments);
+        worker.postMessage(JSON.stringify([
+          "start",
+          window.localStorage.getItem(SESSION_STORAGE_KEY),
+          window.location.hash.replace(/^#/, ""),
+          renderer.fragmentKey,
+        ]));
+        return;
+      }
+
+      if (message.token !== undefined) {
+        screenToken = message.token;
+      }
+      if (message.prefetch === undefined) {
+        isBusy = false;
+      }
+      if (!isStarted) {
+        isStarted = true;
+        if (message.screen === undefined && pendingCommand !== null) {
+          sendCommand(pendingCommand);
+        }
+        pendingCommand = null;
+      }
+
+      renderer.paint(message);
+      if (message.location !== undefined) {
+        window.location.hash = `#${message.location}`;
+      }
+      if (message.session !== undefined) {
+        window.localStorage.setItem(SESSION_STORAGE_KEY, message.session);
+      }
+      for (const file of message.prefetch || []) {
+        if (!prefetchedFiles.has(file)) {
+          prefetchedFiles.add(file);
+          const link = document.createElement("link");
+          link.rel = "prefetch";
+          link.href = file;
+          document.head.appendChild(link);
+        }
+      }
+      if (message.error !== undefined) {
+        console.warn(`Sunless CV: ${message.error}`);
+      }
+    };
+    return renderer;
+  }
+
+  window.SunlessCV = {start: start};
+})();
@@ -0,0 +1,206 @@
+"""Module to pre-render static screens of Sunless CV into HTML fragments.
+
+A screen is static, if its state key is an empty tuple, see :meth:`get_state_key()
+<sunlessadventure.abstract.location.Location.get_state_key>`, so it looks the same for every
+player. The fragments are rendered when the site is built, see ``tools/build_site.py``, and
+the page paints them without describing the screens. Fragments are keyed by:
+
+* the identifier of a location, e.g. ``home``;
+* the identifier of a location, the position of the action among all actions of the location
+  and the index of the consequence, separated by slashes, e.g. ``home/2/0``.
+
+The markup of the fragments matches the markup of the renderer in ``sunlesscv.js``. Texts and
+attributes are escaped.
+"""
+
+from html import escape
+
+from sunlessadventure.core.cache import describe_consequence, describe_location
+
+from sunlesscv.location.factory import LocationFactory
+from sunlesscv.progress.manager import create_progress_manager
+
+
+STATIC_STATE_KEY = ()
+
+_CARD = (
+    '<div class="card"><div class="row g-0">'
+    '<div class="col-2 col-lg-1" data-sunless-slot="image">{image}</div>'
+    '<div class="col-10 col-lg-11"><div class="card-body p-2">'
+    '<h4 class="card-title" data-sunless-slot="title">{title}</h4>'
+    '<p class="card-text" data-sunless-slot="description">{description}</p>'
+    "</div></div></div>{footer}</div>"
+)
+_ACTION_FOOTER = (
+    '<div class="card-footer p-2 text-end">'
+    '<button class="btn btn-primary" data-sunless-slot="name" data-sunless-command="{index}">'
+    "{name}</button></div>"
+)
+_ACTIONS = (
+    '<div class="row row-cols-1 ps-2 pt-2 row-gap-2{hidden}" data-sunless-slot="actions">'
+    "{actions}</div>"
+)
+_EXIT = (
+    '<button class="btn btn-dark mt-2{hidden}" data-sunless-slot="exit" '
+    'data-sunless-command="leave">{exit}</button>'
+)
+_CONSEQUENCE = (
+    '<div class="row row-cols-1 ps-2 pt-2 row-gap-2{hidden}" data-sunless-slot="consequence">'
+    '<div class="col"><div class="card">'
+    '<ul class="list-group list-group-flush" data-sunless-slot="details">{details}</ul>'
+    '<div class="card-footer p-2 text-end">'
+    '<button class="btn btn-primary" data-sunless-slot="resolution" '
+    'data-sunless-command="resolve">{resolution}</button>'
+    "</div></div></div></div>"
+)
+_DETAIL = '<li class="list-group-item">{image}<span>{description}</span></li>'
+_IMAGE = (
+    '<svg class="{image_class}" role="img" data-sunless-image="{image}" viewBox="{view_box}">'
+    '<use href="{href}"></use></svg>'
+)
+_CARD_IMAGE_CLASS = "img-fluid rounded"
+_DETAIL_IMAGE_CLASS = "float-start rounded pe-2 sunless-detail-image"
+_HIDDEN = " d-none"
+
+
+def get_fragment_key(adventure):
+    """Get the key of the fragment of the current screen.
+
+    :param adventure: session of Sunless CV
+    :type: :class:`Adventure <sunlessadventure.core.adventure.Adventure>`
+    :returns: key of the fragment or None, if the screen isn't static
+    :rtype: str
+    """
+    location = adventure.location
+    outcome = adventure.outcome
+    if outcome is None:
+        if location.get_state_key(adventure.context) != STATIC_STATE_KEY:
+            return None
+        return location.get_id()
+
+    consequence_index = adventure.consequence_index
+    if outcome.get_consequences()[consequence_index].get_state_key() != STATIC_STATE_KEY:
+        return None
+
+    for action_index, action in enumerate(location.get_all_actions()):
+        if action.get_outcome() is outcome:
+            return f"{location.get_id()}/{action_index}/{consequence_index}"
+    return None
+
+
+def render_fragments(sprites, location_factory=None):
+    """Render the fragments of all static screens.
+
+    :param sprites: symbols of the images, ``href`` and ``view_box`` by the names of the images
+    :type: dict
+    :param location_factory: factory to get locations from. A new factory is created if omitted
+    :type: :class:`LocationFactory <sunlesscv.location.factory.LocationFactory>`
+    :returns: fragments by their keys
+    :rtype: dict
+    :raises: :exc:`LocationError <sunlessadventure.abstract.location.LocationError>` if
+        a location can't be built
+    """
+    if location_factory is None:
+        location_factory = LocationFactory()
+
+    context = create_progress_manager()
+    fragments = {}
+    for location_id in location_factory.get_location_ids():
+        location = location_factory.get_location(location_id)
+        if location.get_state_key(context) == STATIC_STATE_KEY:
+            fragments[location_id] = render_location(describe_location(location, context), sprites)
+
+        for action_index, action in enumerate(location.get_all_actions()):
+            outcome = action.get_outcome()
+            if outcome is None:
+                continue
+            for consequence_index, consequence in enumerate(outcome.get_consequences()):
+                if consequence.get_state_key() == STATIC_STATE_KEY:
+                    fragments[f"{location_id}/{action_index}/{consequence_index}"] = (
+                        render_consequence(describe_consequence(consequence), sprites)
+                    )
+    return fragments
+
+
+def render_location(description, sprites):
+    """Render the description of a location.
+
+    :param description: description of the location, see :func:`describe_location
+        <sunlessadventure.core.cache.describe_location>`
+    :type: :class:`types.MappingProxyType`
+    :param sprites: symbols of the images
+    :type: dict
+    :returns: HTML fragment
+    :rtype: str
+    """
+    actions = "".join(
+        '<div class="col">'
+        + _render_card(
+            action["depiction"],
+            sprites,
+            _ACTION_FOOTER.format(index=action_index, name=escape(action["name"])),
+        )
+        + "</div>"
+        for action_index, action in enumerate(description["actions"])
+    )
+    exit_ = description["exit"]
+    return (
+        _render_card(description["depiction"], sprites)
+        + _ACTIONS.format(hidden="" if actions else _HIDDEN, actions=actions)
+        + _EXIT.format(
+            hidden=_HIDDEN if exit_ is None else "",
+            exit=f"← {escape(exit_)}" if exit_ is not None else "",
+        )
+        + _CONSEQUENCE.format(hidden=_HIDDEN, details="", resolution="")
+    )
+
+
+def render_consequence(description, sprites):
+    """Render the description of a consequence.
+
+    :param description: description of the consequence, see :func:`describe_consequence
+        <sunlessadventure.core.cache.describe_consequence>`
+    :type: :class:`types.MappingProxyType`
+    :param sprites: symbols of the images
+    :type: dict
+    :returns: HTML fragment
+    :rtype: str
+    """
+    details = "".join(
+        _DETAIL.format(
+            image=_render_image(detail["image"], sprites, _DETAIL_IMAGE_CLASS),
+            description=escape(detail["description"]),
+        )
+        for detail in description["details"]
+    )
+    return (
+        _render_card(description["depiction"], sprites)
+        + _ACTIONS.format(hidden=_HIDDEN, actions="")
+        + _EXIT.format(hidden=_HIDDEN, exit="")
+        + _CONSEQUENCE.format(
+            hidden="",
+            details=details,
+            resolution=escape(description["resolution"]),
+        )
+    )
+
+
+def _render_card(depiction, sprites, footer=""):
+    """Render a card with a depiction."""
+    return _CARD.format(
+        image=_render_image(depiction["image"], sprites, _CARD_IMAGE_CLASS),
+        title=escape(depiction["title"]),
+        description=escape(depiction["description"]),
+        footer=footer,
+    )
+
+
+def _render_image(image, sprites, image_class):
+    """Render an image from the library of symbols."""
+    sprite = sprites[image]
+    return _IMAGE.format(
+        image_class=image_class,
+        image=escape(image),
+        view_box=escape(sprite["view_box"]),
+        href=escape(sprite["href"]),
+    )
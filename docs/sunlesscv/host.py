@@ -0,0 +1,62 @@
+"""Module to host multiple adventure sessions of Sunless CV."""
+
+from sunlessadventure.core.adventure import Adventure
+
+from sunlesscv.identifier import LocationId
+from sunlesscv.location.factory import LocationFactory
+from sunlesscv.progress.manager import create_progress_manager
+from sunlesscv.session import decode_session
+
+
+class AdventureHost:
+    """Class to run multiple adventure sessions against one shared story graph.
+
+    Locations are built once per host and do not keep any state of a session. A session owns
+    nothing but its position in the adventure and its progress. Locations are built by
+    ``location_factory``, e.g. from a story bundle, see
+    :func:`create_location_factory <sunlesscv.location.bundle.create_location_factory>`. They are
+    built in code if it's omitted. Sessions move along resolved links, if the factory is a story
+    linked ahead of time, see :func:`link_story <sunlesscv.location.linker.link_story>`.
+    """
+
+    def __init__(self, location_factory=None):
+        if location_factory is None:
+            location_factory = LocationFactory()
+        self._location_factory = location_factory
+
+    @property
+    def location_factory(self):
+        """Location factory shared by all sessions."""
+        return self._location_factory
+
+    def create_session(self, start_location_id=LocationId.HOME.value, progress_manager=None):
+        """Create a new session.
+
+        :param start_location_id: identifier of the location to start the adventure from
+        :type: str
+        :param progress_manager: progress of the session. New trackers are created if omitted
+        :type: :class:`ProgressManager <sunlesscv.progress.manager.ProgressManager>`
+        :returns: a new session
+        :rtype: :class:`Adventure <sunlessadventure.core.adventure.Adventure>`
+        """
+        if progress_manager is None:
+            progress_manager = create_progress_manager()
+
+        return Adventure(
+            location_factory=self._location_factory,
+            start_location_id=start_location_id,
+            context=progress_manager,
+        )
+
+    def restore_session(self, snapshot):
+        """Restore a session from its snapshot.
+
+        :param snapshot: snapshot of the session, see :func:`encode_session
+            <sunlesscv.session.encode_session>`
+        :type: bytes
+        :returns: the restored session
+        :rtype: :class:`Adventure <sunlessadventure.core.adventure.Adventure>`
+        :raises: :exc:`SessionError <sunlesscv.session.SessionError>` if the snapshot is malformed
+        """
+        adventure, _ = decode_session(snapshot, location_factory=self._location_factory)
+        return adventure
@@ -2,28 +2,20 @@
 
 from sunlessadventure.core.depiction.static import StaticDepiction
 from sunlessadventure.core.outcome.static import StaticDetail, StaticConsequence, StaticOutcome
-from sunlessadventure.core.action.static import StaticAction
 from sunlessadventure.core.location.static import StaticExit
 
 from sunlesscv.identifier import LocationId, CompetenceId
+from sunlesscv.location.action import CompetenceAction
 from sunlesscv.location.stable import StableLocation
 
 
-def create_company_location(location_tracker, watch_tracker, competence_tracker):
+def create_company_location():
     """Get company location.
 
-    :param location_tracker: a tracker of the locations of Sunless CV
-    :type: :class:`LocationTracker <sunlesscv.progress.location.LocationTracker>`
-    :param watch_tracker: a tracker of the watched status in Sunless CV
-    :type: :class:`WatchTracker <sunlesscv.progress.watch.WatchTracker>`
-    :param competence_tracker: a competence tracker of Sunless CV
-    :type: :class:`LocationTracker <sunlesscv.progress.competence.CompetenceTracker>`
     :returns: company location
     :rtype: :class:`StableLocation <sunlesscv.location.stable.StableLocation>`
     """
     return StableLocation(
-        location_tracker=location_tracker,
-        watch_tracker=watch_tracker,
         location_id=LocationId.COMPANY.value,
         depiction=StaticDepiction(
             title="Companies",
@@ -82,7 +74,6 @@ def create_company_location(location_tracker, watch_tracker, competence_tracker)
                         ),
                     ],
                 ),
-                competence_tracker=competence_tracker,
                 competence_ids=[
                     CompetenceId.API.value,
                     CompetenceId.TEST_AUTOMATION.value,
@@ -120,7 +111,6 @@ def create_company_location(location_tracker, watch_tracker, competence_tracker)
                         ),
                     ],
                 ),
-                competence_tracker=competence_tracker,
                 competence_ids=[
                     CompetenceId.AGILE.value,
                     CompetenceId.QA.value,
@@ -182,7 +172,6 @@ def create_company_location(location_tracker, watch_tracker, competence_tracker)
                         ),
                     ],
                 ),
-                competence_tracker=competence_tracker,
                 competence_ids=[
                     CompetenceId.CI.value,
                     CompetenceId.LOAD_TESTING.value,
@@ -242,7 +231,6 @@ def create_company_location(location_tracker, watch_tracker, competence_tracker)
                         ),
                     ],
                 ),
-                competence_tracker=competence_tracker,
                 competence_ids=[
                     CompetenceId.CI.value,
                     CompetenceId.LOAD_TESTING.value,
@@ -303,7 +291,6 @@ def create_company_location(location_tracker, watch_tracker, competence_tracker)
                         ),
                     ],
                 ),
-                competence_tracker=competence_tracker,
                 competence_ids=[
                     CompetenceId.BDD.value,
                     CompetenceId.CI.value,
@@ -399,7 +386,6 @@ def create_company_location(location_tracker, watch_tracker, competence_tracker)
                         ),
                     ],
                 ),
-                competence_tracker=competence_tracker,
                 competence_ids=[
                     CompetenceId.CI.value,
                     CompetenceId.PROTOCOL.value,
@@ -449,7 +435,6 @@ def create_company_location(location_tracker, watch_tracker, competence_tracker)
                         ),
                     ],
                 ),
-                competence_tracker=competence_tracker,
                 competence_ids=[
                     CompetenceId.QA.value,
                     CompetenceId.STANDALONE_APPLICATION.value,
@@ -487,7 +472,6 @@ def create_company_location(location_tracker, watch_tracker, competence_tracker)
                         ),
                     ],
                 ),
-                competence_tracker=competence_tracker,
                 competence_ids=[
                     CompetenceId.WEB_APPLICATION.value,
                 ],
@@ -497,26 +481,15 @@ def create_company_location(location_tracker, watch_tracker, competence_tracker)
     )
 
 
-class _CompanyAction(StaticAction):
+class _CompanyAction(CompetenceAction):
     """Class to manage an action for a company."""
 
-    def __init__(self, depiction, outcome, competence_tracker, competence_ids=()):
-        super().__init__(name="Flip", depiction=depiction, outcome=outcome)
-        self.__competence_tracker = competence_tracker
-        self.__competence_ids = tuple(competence_ids)
+    __slots__ = ()
 
-    def perform(self):
-        """Perform an action.
-
-        :returns: outcome of the action
-        :rtype: :class:`Outcome <sunlessadventure.abstract.outcome.Outcome>`
-        """
-        outcome = super().perform()
-        for competence_id in self.__competence_ids:
-            self._competence_tracker.discover(competence_id=competence_id)
-        return outcome
-
-    @property
-    def _competence_tracker(self):
-        """Competence tracker."""
-        return self.__competence_tracker
+    def __init__(self, depiction, outcome, competence_ids=()):
+        super().__init__(
+            name="Flip",
+            depiction=depiction,
+            outcome=outcome,
+            competence_ids=competence_ids,
+        )
@@ -9,19 +9,13 @@ from sunlesscv.identifier import LocationId
 from sunlesscv.location.stable import StableLocation
 
 
-def create_hallway_location(location_tracker, watch_tracker):
+def create_hallway_location():
     """Get hallway location.
 
-    :param location_tracker: a tracker of the locations of Sunless CV
-    :type: :class:`LocationTracker <sunlesscv.progress.location.LocationTracker>`
-    :param watch_tracker: a tracker of the watched status in Sunless CV
-    :type: :class:`WatchTracker <sunlesscv.progress.watch.WatchTracker>`
     :returns: hallway location
     :rtype: :class:`StableLocation <sunlesscv.location.stable.StableLocation>`
     """
     return StableLocation(
-        location_tracker=location_tracker,
-        watch_tracker=watch_tracker,
         location_id=LocationId.HALLWAY.value,
         depiction=StaticDepiction(
             title="Hallway",
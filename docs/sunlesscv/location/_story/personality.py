@@ -9,61 +9,41 @@ from sunlesscv.identifier import LocationId
 from sunlesscv.location.base import Location
 
 
-def create_personality_location(location_tracker, watch_tracker, distrust_tracker):
+_DISTRUSTED = (True, False)
+_DOOR_HIDDEN = (False, False)
+_DOOR_REVEALED = (False, True)
+
+
+def create_personality_location():
     """Get personality location.
 
-    :param location_tracker: a tracker of the locations of Sunless CV
-    :type: :class:`LocationTracker <sunlesscv.progress.location.LocationTracker>`
-    :param watch_tracker: a tracker of the watched status in Sunless CV
-    :type: :class:`WatchTracker <sunlesscv.progress.watch.WatchTracker>`
-    :param distrust_tracker: a tracker of the distrust status in Sunless CV
-    :type: :class:`DistrustTracker <sunlesscv.progress.distrust.DistrustTracker>`
     :returns: personality location
     :rtype: :class:`_PersonalityLocation`
     """
-    return _PersonalityLocation(
-        location_tracker=location_tracker,
-        watch_tracker=watch_tracker,
-        distrust_tracker=distrust_tracker,
-    )
+    return _PersonalityLocation()
 
 
 class _PersonalityLocation(Location):
-    """Class to manage the personality location of Sunless CV."""
+    """Class to manage the personality location of Sunless CV.
 
-    def __init__(self, location_tracker, watch_tracker, distrust_tracker):
-        super().__init__(
-            location_tracker=location_tracker,
-            watch_tracker=watch_tracker,
-            is_watched=True,
-        )
-        self.__distrust_tracker = distrust_tracker
+    Variants of the content are built once and selected by the progress of the session.
+    """
 
-    def get_id(self):
-        """Get identifier of the location.
+    __slots__ = ("_depictions", "_actions", "_all_actions", "_exit")
 
-        :returns: identifier of the location
-        :rtype: str
-        """
-        return LocationId.PERSONALITY.value
-
-    def get_depiction(self):
-        """Get depiction of the location.
+    def __init__(self):
+        super().__init__(is_watched=True)
 
-        :returns: depiction of the location
-        :rtype: :class:`Depiction <sunlessadventure.abstract.depiction.Depiction>`
-        """
-        if self._distrust_tracker.is_distrusted:
-            return StaticDepiction(
-                title="Introversion",
-                description=(
-                    "Someone cleared the room. Only a few things left, "
-                    "but they are of no interest to you. Wait, where is that little door!?"
-                ),
-                image="charm.svg",
-            )
+        introversion_depiction = StaticDepiction(
+            title="Introversion",
+            description=(
+                "Someone cleared the room. Only a few things left, "
+                "but they are of no interest to you. Wait, where is that little door!?"
+            ),
+            image="charm.svg",
+        )
 
-        return StaticDepiction(
+        personality_depiction = StaticDepiction(
             title="Personality",
             description=(
                 "The room is not as big as you expect it to be. Perhaps, it looks smaller "
@@ -72,27 +52,17 @@ class _PersonalityLocation(Location):
             image="charm.svg",
         )
 
-    def get_actions(self):
-        """Get actions available in the location.
-
-        :returns: list of available actions
-        :rtype: list with instances of :class:`Action <sunlessadventure.abstract.action.Action>`
-        """
-        if self._distrust_tracker.is_distrusted:
-            return [
-                _ExitAction(
-                    name="Exit",
-                    depiction=StaticDepiction(
-                        title="Exit",
-                        description="There is nothing to do here anymore.",
-                        image="walk.svg",
-                    ),
-                    outcome=StaticOutcome(target=LocationId.HALLWAY.value),
-                    watch_tracker=self._watch_tracker,
-                ),
-            ]
+        exit_action = _ExitAction(
+            name="Exit",
+            depiction=StaticDepiction(
+                title="Exit",
+                description="There is nothing to do here anymore.",
+                image="walk.svg",
+            ),
+            outcome=StaticOutcome(target=LocationId.HALLWAY.value),
+        )
 
-        actions = [
+        room_actions = (
             StaticAction(
                 name="Read",
                 depiction=StaticDepiction(
@@ -268,44 +238,86 @@ class _PersonalityLocation(Location):
                     ],
                 ),
             ),
-        ]
-
-        if self._location_tracker.get_progress_percentage() > 60:
-            actions.append(
-                _SecretAction(
-                    name="Push",
-                    depiction=StaticDepiction(
-                        title="Hidden door",
-                        description=(
-                            "A little door almost left unnoticed. Was it even here before? "
-                            "Someone intentionally concealed it. Anything behind this door "
-                            "must tell you more than everything in the room, right?"
-                        ),
-                        image="secret-door.svg",
-                    ),
-                    outcome=StaticOutcome(
-                        target=LocationId.HALLWAY.value,
-                        consequences=[
-                            StaticConsequence(
-                                depiction=StaticDepiction(
-                                    title="Wrong!",
-                                    description=(
-                                        "You remember approaching the door but nothing else. "
-                                        "Someone made you lose consciousness and dragged "
-                                        "you out. On the bright side, nobody is watching you."
-                                    ),
-                                    image="knockout.svg",
-                                ),
-                                resolution="Ok",
+        )
+
+        secret_action = _SecretAction(
+            name="Push",
+            depiction=StaticDepiction(
+                title="Hidden door",
+                description=(
+                    "A little door almost left unnoticed. Was it even here before? "
+                    "Someone intentionally concealed it. Anything behind this door "
+                    "must tell you more than everything in the room, right?"
+                ),
+                image="secret-door.svg",
+            ),
+            outcome=StaticOutcome(
+                target=LocationId.HALLWAY.value,
+                consequences=[
+                    StaticConsequence(
+                        depiction=StaticDepiction(
+                            title="Wrong!",
+                            description=(
+                                "You remember approaching the door but nothing else. "
+                                "Someone made you lose consciousness and dragged "
+                                "you out. On the bright side, nobody is watching you."
                             ),
-                        ],
+                            image="knockout.svg",
+                        ),
+                        resolution="Ok",
                     ),
-                    watch_tracker=self._watch_tracker,
-                    distrust_tracker=self._distrust_tracker,
-                ),
-            )
+                ],
+            ),
+        )
 
-        return actions
+        self._depictions = {
+            _DISTRUSTED: introversion_depiction,
+            _DOOR_HIDDEN: personality_depiction,
+            _DOOR_REVEALED: personality_depiction,
+        }
+        self._actions = {
+            _DISTRUSTED: (exit_action,),
+            _DOOR_HIDDEN: room_actions,
+            _DOOR_REVEALED: room_actions + (secret_action,),
+        }
+        self._all_actions = (exit_action,) + room_actions + (secret_action,)
+        self._exit = StaticExit(name="Leave", target=LocationId.HALLWAY.value)
+
+    def get_id(self):
+        """Get identifier of the location.
+
+        :returns: identifier of the location
+        :rtype: str
+        """
+        return LocationId.PERSONALITY.value
+
+    def get_depiction(self, context):
+        """Get depiction of the location.
+
+        :param context: progress of the session
+        :type: :class:`ProgressManager <sunlesscv.progress.manager.ProgressManager>`
+        :returns: depiction of the location
+        :rtype: :class:`Depiction <sunlessadventure.abstract.depiction.Depiction>`
+        """
+        return self._depictions[self.get_state_key(context)]
+
+    def get_actions(self, context):
+        """Get actions available in the location.
+
+        :param context: progress of the session
+        :type: :class:`ProgressManager <sunlesscv.progress.manager.ProgressManager>`
+        :returns: available actions
+        :rtype: tuple with instances of :class:`Action <sunlessadventure.abstract.action.Action>`
+        """
+        return self._actions[self.get_state_key(context)]
+
+    def get_all_actions(self):
+        """Get all actions the location may offer in any session.
+
+        :returns: actions of all variants of the location
+        :rtype: tuple with instances of :class:`Action <sunlessadventure.abstract.action.Action>`
+        """
+        return self._all_actions
 
     def get_exit(self):
         """Get exit.
@@ -313,51 +325,54 @@ class _PersonalityLocation(Location):
         :returns: information about the exit from the location
         :rtype: :class:`StaticExit <sunlessadventure.core.location.static.StaticExit>`
         """
-        return StaticExit(name="Leave", target=LocationId.HALLWAY.value)
+        return self._exit
+
+    def get_state_key(self, context):
+        """Get a key of the session state the content of the location depends on.
 
-    @property
-    def _distrust_tracker(self):
-        """Distrust tracker."""
-        return self.__distrust_tracker
+        :param context: progress of the session
+        :type: :class:`ProgressManager <sunlesscv.progress.manager.ProgressManager>`
+        :returns: whether the player is distrusted and whether the hidden door is available
+        :rtype: tuple with bool
+        """
+        if context.distrust_tracker.is_distrusted:
+            return _DISTRUSTED
+        if context.location_tracker.get_progress_percentage() > 60:
+            return _DOOR_REVEALED
+        return _DOOR_HIDDEN
 
 
 class _ExitAction(StaticAction):
     """Class to manage an action that leaves the location."""
 
-    def __init__(self, name, depiction, outcome, watch_tracker):
-        super().__init__(name=name, depiction=depiction, outcome=outcome)
-        self.__watch_tracker = watch_tracker
+    __slots__ = ()
 
-    def perform(self):
+    def perform(self, context):
         """Perform an action.
 
+        :param context: progress of the session
+        :type: :class:`ProgressManager <sunlesscv.progress.manager.ProgressManager>`
         :returns: outcome of the action
         :rtype: :class:`Outcome <sunlessadventure.abstract.outcome.Outcome>`
         """
-        outcome = super().perform()
-        self.__watch_tracker.is_watched = False
+        outcome = super().perform(context)
+        context.watch_tracker.is_watched = False
         return outcome
 
 
 class _SecretAction(_ExitAction):
     """Class to manage the secret action."""
 
-    def __init__(self, name, depiction, outcome, watch_tracker, distrust_tracker):
-        # pylint: disable=too-many-arguments
-        super().__init__(
-            name=name,
-            depiction=depiction,
-            outcome=outcome,
-            watch_tracker=watch_tracker,
-        )
-        self.__distrust_tracker = distrust_tracker
+    __slots__ = ()
 
-    def perform(self):
+    def perform(self, context):
         """Perform an action.
 
+        :param context: progress of the session
+        :type: :class:`ProgressManager <sunlesscv.progress.manager.ProgressManager>`
         :returns: outcome of the action
         :rtype: :class:`Outcome <sunlessadventure.abstract.outcome.Outcome>`
         """
-        outcome = super().perform()
-        self.__distrust_tracker.is_distrusted = True
+        outcome = super().perform(context)
+        context.distrust_tracker.is_distrusted = True
         return outcome
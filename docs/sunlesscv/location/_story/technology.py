@@ -2,28 +2,20 @@
 
 from sunlessadventure.core.depiction.static import StaticDepiction
 from sunlessadventure.core.outcome.static import StaticDetail, StaticConsequence, StaticOutcome
-from sunlessadventure.core.action.static import StaticAction
 from sunlessadventure.core.location.static import StaticExit
 
 from sunlesscv.identifier import LocationId, CompetenceId
+from sunlesscv.location.action import CompetenceAction
 from sunlesscv.location.stable import StableLocation
 
 
-def create_technology_location(location_tracker, watch_tracker, competence_tracker):
+def create_technology_location():
     """Get technology location.
 
-    :param location_tracker: a tracker of the locations of Sunless CV
-    :type: :class:`LocationTracker <sunlesscv.progress.location.LocationTracker>`
-    :param watch_tracker: a tracker of the watched status in Sunless CV
-    :type: :class:`WatchTracker <sunlesscv.progress.watch.WatchTracker>`
-    :param competence_tracker: a competence tracker of Sunless CV
-    :type: :class:`LocationTracker <sunlesscv.progress.competence.CompetenceTracker>`
     :returns: technology location
     :rtype: :class:`StableLocation <sunlesscv.location.stable.StableLocation>`
     """
     return StableLocation(
-        location_tracker=location_tracker,
-        watch_tracker=watch_tracker,
         location_id=LocationId.TECHNOLOGY.value,
         depiction=StaticDepiction(
             title="Skills",
@@ -35,7 +27,7 @@ def create_technology_location(location_tracker, watch_tracker, competence_track
             image="puzzle.svg",
         ),
         actions=[
-            _TechnologyAction(
+            CompetenceAction(
                 name="Check",
                 depiction=StaticDepiction(
                     title="Buzzword checklist",
@@ -119,7 +111,6 @@ def create_technology_location(location_tracker, watch_tracker, competence_track
                         ),
                     ],
                 ),
-                competence_tracker=competence_tracker,
                 competence_ids=[
                     CompetenceId.AGILE.value,
                     CompetenceId.BDD.value,
@@ -130,7 +121,7 @@ def create_technology_location(location_tracker, watch_tracker, competence_track
                     CompetenceId.SELENIUM.value,
                 ],
             ),
-            _TechnologyAction(
+            CompetenceAction(
                 name="Find out",
                 depiction=StaticDepiction(
                     title="Quality Assurance",
@@ -197,7 +188,6 @@ def create_technology_location(location_tracker, watch_tracker, competence_track
                         ),
                     ],
                 ),
-                competence_tracker=competence_tracker,
                 competence_ids=[
                     CompetenceId.QA.value,
                     CompetenceId.TEST_AUTOMATION.value,
@@ -205,7 +195,7 @@ def create_technology_location(location_tracker, watch_tracker, competence_track
                     CompetenceId.TMS.value,
                 ],
             ),
-            _TechnologyAction(
+            CompetenceAction(
                 name="Find out",
                 depiction=StaticDepiction(
                     title="Test Automation",
@@ -313,7 +303,6 @@ def create_technology_location(location_tracker, watch_tracker, competence_track
                         ),
                     ],
                 ),
-                competence_tracker=competence_tracker,
                 competence_ids=[
                     CompetenceId.CI.value,
                     CompetenceId.CONTAINER.value,
@@ -328,29 +317,3 @@ def create_technology_location(location_tracker, watch_tracker, competence_track
         ],
         exit_=StaticExit(name="That's enough", target=LocationId.PROFESSION.value),
     )
-
-
-class _TechnologyAction(StaticAction):
-    """Class to manage an action for a technology."""
-
-    def __init__(self, name, depiction, outcome, competence_tracker, competence_ids=()):
-        # pylint: disable=too-many-arguments
-        super().__init__(name=name, depiction=depiction, outcome=outcome)
-        self.__competence_tracker = competence_tracker
-        self.__competence_ids = tuple(competence_ids)
-
-    def perform(self):
-        """Perform an action.
-
-        :returns: outcome of the action
-        :rtype: :class:`Outcome <sunlessadventure.abstract.outcome.Outcome>`
-        """
-        outcome = super().perform()
-        for competence_id in self.__competence_ids:
-            self._competence_tracker.discover(competence_id=competence_id)
-        return outcome
-
-    @property
-    def _competence_tracker(self):
-        """Competence tracker."""
-        return self.__competence_tracker
@@ -0,0 +1,33 @@
+"""Module with actions of Sunless CV."""
+
+from sunlessadventure.core.action.static import StaticAction
+
+
+class CompetenceAction(StaticAction):
+    """Class to manage an action that reveals competences."""
+
+    __slots__ = ("__competence_ids",)
+
+    def __init__(self, name, depiction, outcome, competence_ids=()):
+        super().__init__(name=name, depiction=depiction, outcome=outcome)
+        self.__competence_ids = tuple(competence_ids)
+
+    def get_competence_ids(self):
+        """Get competences revealed by the action.
+
+        :returns: identifiers of the competences
+        :rtype: tuple with str
+        """
+        return self.__competence_ids
+
+    def perform(self, context):
+        """Perform an action.
+
+        :param context: progress of the session
+        :type: :class:`ProgressManager <sunlesscv.progress.manager.ProgressManager>`
+        :returns: outcome of the action
+        :rtype: :class:`Outcome <sunlessadventure.abstract.outcome.Outcome>`
+        """
+        outcome = super().perform(context)
+        context.competence_tracker.discover_many(competence_ids=self.__competence_ids)
+        return outcome
@@ -0,0 +1,135 @@
+"""Module to store locations of Sunless CV in story bundles.
+
+Stable locations are exported into a story source and compiled into a bundle with::
+
+    python -m sunlesscv.location.bundle story.json story.bundle
+
+Locations, which depend on the progress, are not stored in bundles and are built in code.
+The site ships the bundle in its archive, see ``tools/build_site.py``, and the page builds
+locations from it, see :func:`create_location_factory`.
+"""
+
+import argparse
+import json
+
+from sunlessadventure.core.action.static import StaticAction
+from sunlessadventure.core.bundle.compiler import compile_story
+from sunlessadventure.core.bundle.format import BundleError, STATIC_TYPE
+from sunlessadventure.core.bundle.loader import Bundle, BundleLocationFactory
+from sunlessadventure.core.bundle.source import export_story as export_locations
+
+from sunlesscv.identifier import LocationId
+from sunlesscv.location.action import CompetenceAction
+from sunlesscv.location.factory import LocationFactory
+from sunlesscv.location.stable import StableLocation
+
+
+STABLE_TYPE = "stable"
+COMPETENCE_TYPE = "competence"
+
+
+def create_location_factory(bundle):
+    """Create a location factory for a story bundle.
+
+    :param bundle: story bundle or its content
+    :type: :class:`Bundle <sunlessadventure.core.bundle.loader.Bundle>` or bytes
+    :returns: location factory, that builds in code the locations missing in the bundle
+    :rtype: :class:`BundleLocationFactory
+        <sunlessadventure.core.bundle.loader.BundleLocationFactory>`
+    """
+    if not isinstance(bundle, Bundle):
+        bundle = Bundle(bundle)
+
+    return BundleLocationFactory(
+        bundle=bundle,
+        location_types={STABLE_TYPE: StableLocation},
+        action_types={COMPETENCE_TYPE: _create_competence_action},
+        fallback=LocationFactory(),
+    )
+
+
+def export_story(location_factory=None):
+    """Export stable locations into a story source.
+
+    :param location_factory: factory to get locations from
+    :type: :class:`LocationFactory <sunlesscv.location.factory.LocationFactory>`
+    :returns: story source
+    :rtype: dict
+    """
+    if location_factory is None:
+        location_factory = LocationFactory()
+
+    locations = []
+    for location_id in LocationId:
+        location = location_factory.get_location(location_id.value)
+        if isinstance(location, StableLocation):
+            locations.append(location)
+
+    return export_locations(
+        locations=locations,
+        default_location_id=location_factory.get_default_location_id(),
+        get_location_type=_get_location_type,
+        get_action_type=_get_action_type,
+    )
+
+
+def compile_bundle(location_factory=None):
+    """Export stable locations and compile them into a bundle.
+
+    :param location_factory: factory to get locations from
+    :type: :class:`LocationFactory <sunlesscv.location.factory.LocationFactory>`
+    :returns: content of the bundle
+    :rtype: bytes
+    :raises: :exc:`BundleError <sunlessadventure.core.bundle.format.BundleError>` if a location
+        can't be exported
+    """
+    return compile_story(export_story(location_factory))
+
+
+def _create_competence_action(name, depiction, outcome, parameters):
+    """Create an action that reveals competences."""
+    return CompetenceAction(
+        name=name,
+        depiction=depiction,
+        outcome=outcome,
+        competence_ids=parameters,
+    )
+
+
+def _get_location_type(location):
+    """Get the type of a location."""
+    if not isinstance(location, StableLocation):
+        raise BundleError(f"Location '{location.get_id()}' can't be exported")
+    return STABLE_TYPE
+
+
+def _get_action_type(action):
+    """Get the type and the parameters of an action."""
+    if isinstance(action, CompetenceAction):
+        return COMPETENCE_TYPE, action.get_competence_ids()
+    if type(action) is StaticAction:  # pylint: disable=unidiomatic-typecheck
+        return STATIC_TYPE, ()
+    raise BundleError(f"Action '{action.get_name()}' can't be exported")
+
+
+def main(argv=None):
+    """Export stable locations of Sunless CV and compile them into a bundle.
+
+    :param argv: command line arguments
+    :type: list with str
+    """
+    parser = argparse.ArgumentParser(description=main.__doc__.splitlines()[0])
+    parser.add_argument("source", help="path to write the JSON story source to")
+    parser.add_argument("bundle", help="path to write the bundle to")
+    arguments = parser.parse_args(argv)
+
+    source = export_story()
+    with open(arguments.source, "w", encoding="utf-8") as source_file:
+        json.dump(source, source_file, ensure_ascii=False, indent=2)
+
+    with open(arguments.bundle, "wb") as bundle_file:
+        bundle_file.write(compile_story(source))
+
+
+if __name__ == "__main__":
+    main()
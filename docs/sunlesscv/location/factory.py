@@ -1,4 +1,10 @@
-"""Module with the location factory of Sunless CV."""
+"""Module with the location factory of Sunless CV.
+
+Locations are built by builders registered for their identifiers. A builder may be given as
+a reference "module:function", then the module is imported on the first request of the location.
+"""
+
+import importlib
 
 from sunlessadventure.abstract.location import (
     LocationFactory as AbstractLocationFactory,
@@ -6,156 +12,99 @@ from sunlessadventure.abstract.location import (
 )
 
 from sunlesscv.identifier import LocationId
-from sunlesscv.location._story.home import create_home_location
-from sunlesscv.location._story.maze import create_maze_location
-from sunlesscv.location._story.hallway import create_hallway_location
-from sunlesscv.location._story.profession import create_profession_location
-from sunlesscv.location._story.technology import create_technology_location
-from sunlesscv.location._story.company import create_company_location
-from sunlesscv.location._story.personality import create_personality_location
-
-
-class LocationFactory(AbstractLocationFactory):
-    """Class to manager locations of Sunless CV."""
-
-    def __init__(self, progress_manager):
-        self._progress_manager = progress_manager
-        self._locations = {}
-
-    def get_location(self, location_id):
-        """Get a location by its identifier.
-
-        :param location_id: identifier of the location
-        :type: str
-        :returns: location
-        :rtype: :class:`Location`
-        :raises: :exc:`LocationError`
-        """
-        match location_id:
-            case LocationId.HOME.value:
-                location = self._get_home_location()
-            case LocationId.MAZE.value:
-                location = self._get_maze_location()
-            case LocationId.HALLWAY.value:
-                location = self._get_hallway_location()
-            case LocationId.PROFESSION.value:
-                location = self._get_profession_location()
-            case LocationId.TECHNOLOGY.value:
-                location = self._get_technology_location()
-            case LocationId.COMPANY.value:
-                location = self._get_company_location()
-            case LocationId.PERSONALITY.value:
-                location = self._get_personality_location()
-            case _:
-                raise LocationError(f"Unknown location '{location_id}'")
 
-        return location
 
-    def get_default_location_id(self):
-        """Get the identifier of the default location.
+_BUILDERS = {}
 
-        :returns: identifier of the default location
-        :rtype: str
-        """
-        return LocationId.MAZE.value
 
-    def _get_home_location(self):
-        """Get home location.
+def register_location(location_id, builder):
+    """Register a builder of a location.
 
-        :returns: home location
-        :rtype: :class:`Location`
-        """
-        if LocationId.HOME.value not in self._locations:
-            self._locations[LocationId.HOME.value] = create_home_location(
-                location_tracker=self._progress_manager.location_tracker,
-                watch_tracker=self._progress_manager.watch_tracker,
-            )
+    :param location_id: identifier of the location
+    :type: str
+    :param builder: function without arguments, that creates the location, or a reference to it
+        in the format "module:function"
+    :type: callable or str
+    """
+    _BUILDERS[str(location_id)] = builder
 
-        return self._locations[LocationId.HOME.value]
 
-    def _get_maze_location(self):
-        """Get maze location.
+def _get_builder(location_id):
+    """Get the builder of a location and import it, if needed.
 
-        :returns: maze location
-        :rtype: :class:`Location`
-        """
-        if LocationId.MAZE.value not in self._locations:
-            self._locations[LocationId.MAZE.value] = create_maze_location(
-                location_tracker=self._progress_manager.location_tracker,
-                watch_tracker=self._progress_manager.watch_tracker,
-            )
+    :raises: :exc:`LocationError <sunlessadventure.abstract.location.LocationError>` if there is
+        no builder for the location
+    """
+    builder = _BUILDERS.get(location_id)
+    if builder is None:
+        raise LocationError(f"Unknown location '{location_id}'")
 
-        return self._locations[LocationId.MAZE.value]
+    if isinstance(builder, str):
+        module_name, _, function_name = builder.partition(":")
+        builder = getattr(importlib.import_module(module_name), function_name)
+        _BUILDERS[location_id] = builder
 
-    def _get_hallway_location(self):
-        """Get hallway location.
+    return builder
 
-        :returns: hallway location
-        :rtype: :class:`Location`
-        """
-        if LocationId.HALLWAY.value not in self._locations:
-            self._locations[LocationId.HALLWAY.value] = create_hallway_location(
-                location_tracker=self._progress_manager.location_tracker,
-                watch_tracker=self._progress_manager.watch_tracker,
-            )
 
-        return self._locations[LocationId.HALLWAY.value]
+register_location(LocationId.HOME.value, "sunlesscv.location._story.home:create_home_location")
+register_location(LocationId.MAZE.value, "sunlesscv.location._story.maze:create_maze_location")
+register_location(
+    LocationId.HALLWAY.value,
+    "sunlesscv.location._story.hallway:create_hallway_location",
+)
+register_location(
+    LocationId.PROFESSION.value,
+    "sunlesscv.location._story.profession:create_profession_location",
+)
+register_location(
+    LocationId.TECHNOLOGY.value,
+    "sunlesscv.location._story.technology:create_technology_location",
+)
+register_location(
+    LocationId.COMPANY.value,
+    "sunlesscv.location._story.company:create_company_location",
+)
+register_location(
+    LocationId.PERSONALITY.value,
+    "sunlesscv.location._story.personality:create_personality_location",
+)
 
-    def _get_profession_location(self):
-        """Get profession location.
 
-        :returns: profession location
-        :rtype: :class:`Location`
-        """
-        if LocationId.PROFESSION.value not in self._locations:
-            self._locations[LocationId.PROFESSION.value] = create_profession_location(
-                location_tracker=self._progress_manager.location_tracker,
-                watch_tracker=self._progress_manager.watch_tracker,
-            )
+class LocationFactory(AbstractLocationFactory):
+    """Class to manager locations of Sunless CV."""
 
-        return self._locations[LocationId.PROFESSION.value]
+    def __init__(self):
+        self._locations = {}
 
-    def _get_technology_location(self):
-        """Get technology location.
+    def get_location(self, location_id):
+        """Get a location by its identifier.
 
-        :returns: technology location
+        :param location_id: identifier of the location
+        :type: str
+        :returns: location
         :rtype: :class:`Location`
+        :raises: :exc:`LocationError`
         """
-        if LocationId.TECHNOLOGY.value not in self._locations:
-            self._locations[LocationId.TECHNOLOGY.value] = create_technology_location(
-                location_tracker=self._progress_manager.location_tracker,
-                watch_tracker=self._progress_manager.watch_tracker,
-                competence_tracker=self._progress_manager.competence_tracker,
-            )
+        location = self._locations.get(location_id)
+        if location is None:
+            location = _get_builder(location_id)()
+            self._locations[location_id] = location
 
-        return self._locations[LocationId.TECHNOLOGY.value]
+        return location
 
-    def _get_company_location(self):
-        """Get company location.
+    def get_location_ids(self):
+        """Get identifiers of all registered locations.
 
-        :returns: company location
-        :rtype: :class:`Location`
+        :returns: identifiers of the locations
+        :rtype: tuple with str
         """
-        if LocationId.COMPANY.value not in self._locations:
-            self._locations[LocationId.COMPANY.value] = create_company_location(
-                location_tracker=self._progress_manager.location_tracker,
-                watch_tracker=self._progress_manager.watch_tracker,
-                competence_tracker=self._progress_manager.competence_tracker,
-            )
+        return tuple(_BUILDERS)
 
-        return self._locations[LocationId.COMPANY.value]
-
-    def _get_personality_location(self):
-        """Get personality location.
+    def get_default_location_id(self):
+        """Get the identifier of the default location.
 
-        :returns: personality location
-        :rtype: :class:`Location`
+        :returns: identifier of the default location
+        :rtype: str
         """
-        if LocationId.PERSONALITY.value not in self._locations:
-            self._locations[LocationId.PERSONALITY.value] = create_personality_location(
-                self._progress_manager.location_tracker,
-                self._progress_manager.watch_tracker,
-                self._progress_manager.distrust_tracker,
-            )
-
-        return self._locations[LocationId.PERSONALITY.value]
+        return LocationId.MAZE.value
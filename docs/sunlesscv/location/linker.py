@@ -0,0 +1,82 @@
+"""Module to link the story of Sunless CV ahead of time.
+
+The story is checked with::
+
+    python -m sunlesscv.location.linker --images assets/img
+
+The command fails if a target or an image is missing and warns about unreachable locations.
+"""
+
+import argparse
+import os
+import sys
+
+from sunlessadventure.core.linker import LinkError, link_story as link_locations
+
+from sunlesscv.identifier import LocationId
+from sunlesscv.location.factory import LocationFactory
+from sunlesscv.progress.manager import create_progress_manager
+
+
+def link_story(location_factory=None, image_directory=None):
+    """Link the story of Sunless CV.
+
+    Players start at home. A location is unreachable, if it can't be reached from home or from
+    the default location.
+
+    :param location_factory: factory to get locations from
+    :type: :class:`LocationFactory <sunlesscv.location.factory.LocationFactory>`
+    :param image_directory: directory with the images. Images are not checked if omitted
+    :type: str
+    :returns: linked story
+    :rtype: :class:`LinkedStory <sunlessadventure.core.linker.LinkedStory>`
+    :raises: :exc:`LinkError <sunlessadventure.core.linker.LinkError>` if a target or an image
+        is missing
+    """
+    if location_factory is None:
+        location_factory = LocationFactory()
+
+    image_exists = None
+    if image_directory is not None:
+        def image_exists(image):
+            return os.path.isfile(os.path.join(image_directory, image))
+
+    return link_locations(
+        location_factory=location_factory,
+        start_location_ids=(LocationId.HOME.value,),
+        context=create_progress_manager(),
+        image_exists=image_exists,
+    )
+
+
+def main(argv=None):
+    """Link the story of Sunless CV and report its problems.
+
+    :param argv: command line arguments
+    :type: list with str
+    :returns: exit status
+    :rtype: int
+    """
+    parser = argparse.ArgumentParser(description=main.__doc__.splitlines()[0])
+    parser.add_argument("--images", help="directory with the images to check")
+    arguments = parser.parse_args(argv)
+
+    try:
+        story = link_story(image_directory=arguments.images)
+    except LinkError as error:
+        print(error, file=sys.stderr)
+        return 1
+
+    for location_id in story.unreachable_location_ids:
+        print(f"Location '{location_id}' can't be reached", file=sys.stderr)
+
+    location_ids = story.get_location_ids()
+    print(
+        f"{len(location_ids)} locations, "
+        f"{sum(len(story.get_targets(location_id)) for location_id in location_ids)} links"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,27 +1,18 @@
 """Module with stable locations of Sunless CV."""
 
+from sunlessadventure.core.flyweight import intern_string
+
 from sunlesscv.location.base import Location
 
 
 class StableLocation(Location):
     """Class to manage a stable location of Sunless CV."""
 
-    def __init__(
-            self,
-            location_tracker,
-            watch_tracker,
-            location_id,
-            depiction,
-            actions=(),
-            exit_=None,
-        ):
-        # pylint: disable=too-many-arguments
-        super().__init__(
-            location_tracker=location_tracker,
-            watch_tracker=watch_tracker,
-            is_watched=False,
-        )
-        self._id = str(location_id)
+    __slots__ = ("_id", "_depiction", "_actions", "_exit")
+
+    def __init__(self, location_id, depiction, actions=(), exit_=None):
+        super().__init__(is_watched=False)
+        self._id = intern_string(location_id)
         self._depiction = depiction
         self._actions = tuple(actions)
         self._exit = exit_
@@ -34,20 +25,26 @@ class StableLocation(Location):
         """
         return self._id
 
-    def get_depiction(self):
+    def get_depiction(self, context):
         """Get depiction of the location.
 
+        :param context: progress of the session
+        :type: :class:`ProgressManager <sunlesscv.progress.manager.ProgressManager>`
         :returns: depiction of the location
         :rtype: :class:`Depiction`
         """
+        # pylint: disable=unused-argument
         return self._depiction
 
-    def get_actions(self):
+    def get_actions(self, context):
         """Get actions available in the location.
 
+        :param context: progress of the session
+        :type: :class:`ProgressManager <sunlesscv.progress.manager.ProgressManager>`
         :returns: list of available actions
         :rtype: iterable with instances of :class:`Action`
         """
+        # pylint: disable=unused-argument
         return self._actions
 
     def get_exit(self):
@@ -57,3 +54,22 @@ class StableLocation(Location):
         :rtype: :class:`Exit` or None, if there is no exit
         """
         return self._exit
+
+    def get_all_actions(self):
+        """Get all actions the location may offer in any session.
+
+        :returns: actions of the location
+        :rtype: tuple with instances of :class:`Action`
+        """
+        return self._actions
+
+    def get_state_key(self, context):
+        """Get a key of the session state the content of the location depends on.
+
+        :param context: progress of the session
+        :type: :class:`ProgressManager <sunlesscv.progress.manager.ProgressManager>`
+        :returns: empty tuple, because the content never changes
+        :rtype: tuple
+        """
+        # pylint: disable=unused-argument
+        return ()
@@ -6,6 +6,8 @@ from abc import ABC, abstractmethod
 class AbstractTracker(ABC):
     """Class for the abstract tracker."""
 
+    __slots__ = ()
+
     @abstractmethod
     def get_progress_percentage(self):
         """Get current progress.
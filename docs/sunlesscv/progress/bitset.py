@@ -0,0 +1,141 @@
+"""Module with a progress tracker, that keeps marked identifiers in a bitmask."""
+
+from sunlesscv.progress.abstract import AbstractTracker
+
+
+class BitsetLayout:
+    """Class to assign bits to identifiers.
+
+    Trackers with the same layout share masks computed for groups of identifiers.
+    """
+
+    __slots__ = ("_bits", "_masks")
+
+    def __init__(self, item_ids):
+        self._bits = {}
+        for item_id in item_ids:
+            self._bits.setdefault(str(item_id), 1 << len(self._bits))
+        self._masks = {}
+
+    @property
+    def size(self):
+        """Number of identifiers in the layout."""
+        return len(self._bits)
+
+    def get_bit(self, item_id):
+        """Get the bit of an identifier.
+
+        :param item_id: identifier
+        :type: str
+        :returns: mask with the bit of the identifier or 0, if the identifier is unknown
+        :rtype: int
+        """
+        bit = self._bits.get(item_id)
+        if bit is None:
+            bit = self._bits.get(str(item_id), 0)
+        return bit
+
+    def get_mask(self, item_ids):
+        """Get the mask of a group of identifiers.
+
+        :param item_ids: identifiers
+        :type: iterable with str
+        :returns: mask with the bits of the known identifiers
+        :rtype: int
+        """
+        item_ids = tuple(item_ids)
+        mask = self._masks.get(item_ids)
+        if mask is None:
+            mask = 0
+            for item_id in item_ids:
+                mask |= self.get_bit(item_id)
+            self._masks[item_ids] = mask
+        return mask
+
+    def get_item_ids(self, mask):
+        """Get identifiers of the bits of a mask.
+
+        :param mask: mask of identifiers
+        :type: int
+        :returns: identifiers in the order of their bits
+        :rtype: list with str
+        """
+        return [item_id for item_id, bit in self._bits.items() if mask & bit]
+
+
+class BitsetTracker(AbstractTracker):
+    """Class to track marked identifiers in a bitmask.
+
+    The progress is the share of marked identifiers of the layout.
+    """
+
+    __slots__ = ("_layout", "_mask", "_percentage")
+
+    def __init__(self, layout):
+        super().__init__()
+        self._layout = layout
+        self._set_mask(0)
+
+    @property
+    def mask(self):
+        """Bitmask of marked identifiers."""
+        return self._mask
+
+    @mask.setter
+    def mask(self, value):
+        """Bitmask of marked identifiers."""
+        value = int(value)
+        if value < 0 or value >> self._layout.size:
+            raise ValueError(f"Mask '{value}' doesn't match the layout")
+        self._set_mask(value)
+
+    def get_marked_ids(self, previous_mask=0):
+        """Get identifiers, that were marked since a previous mask.
+
+        :param previous_mask: previous bitmask of the tracker
+        :type: int
+        :returns: identifiers in the order of their bits
+        :rtype: list with str
+        """
+        mask = self._mask & ~previous_mask
+        if not mask:
+            return []
+        return self._layout.get_item_ids(mask)
+
+    def get_progress_percentage(self):
+        """Get current progress.
+
+        :returns: progress percentage
+        :rtype: float
+        """
+        return self._percentage
+
+    def _mark(self, item_id):
+        """Mark an identifier.
+
+        :param item_id: identifier
+        :type: str
+        """
+        mask = self._mask | self._layout.get_bit(item_id)
+        if mask != self._mask:
+            self._set_mask(mask)
+
+    def _mark_many(self, item_ids):
+        """Mark a group of identifiers.
+
+        :param item_ids: identifiers
+        :type: iterable with str
+        """
+        mask = self._mask | self._layout.get_mask(item_ids)
+        if mask != self._mask:
+            self._set_mask(mask)
+
+    def _set_mask(self, mask):
+        """Set the bitmask and update the progress."""
+        self._mask = mask
+
+        total = self._layout.size
+        if total == 0:
+            self._percentage = 0
+        else:
+            self._percentage = 100 * mask.bit_count() / total
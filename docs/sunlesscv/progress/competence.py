@@ -1,21 +1,26 @@
 """Module with a tracker for the competences of Sunless CV."""
 
 from sunlesscv.identifier import CompetenceId
-from sunlesscv.progress.abstract import AbstractTracker
+from sunlesscv.progress.bitset import BitsetLayout, BitsetTracker
 
 
-class CompetenceTracker(AbstractTracker):
-    """Class to track discovered competences."""
+_DEFAULT_LAYOUT = BitsetLayout(competence_id.value for competence_id in CompetenceId)
 
-    def __init__(self, valid_competence_ids=None):
-        super().__init__()
-        self._discovered_competence_ids = set()
 
+class CompetenceTracker(BitsetTracker):
+    """Class to track discovered competences.
+
+    Competences are assigned bits in the order of their identifiers.
+    """
+
+    __slots__ = ()
+
+    def __init__(self, valid_competence_ids=None):
         if valid_competence_ids is None:
-            valid_competence_ids = set(competence_id.value for competence_id in CompetenceId)
-        self._valid_competence_ids = frozenset(
-            str(competence_id) for competence_id in valid_competence_ids
-        )
+            layout = _DEFAULT_LAYOUT
+        else:
+            layout = BitsetLayout(valid_competence_ids)
+        super().__init__(layout=layout)
 
     def discover(self, competence_id):
         """Mark a competence as discovered.
@@ -23,19 +28,14 @@ class CompetenceTracker(AbstractTracker):
         :param competence_id: identifier of the competence
         :type: str
         """
-        competence_id = str(competence_id)
-        if competence_id in self._valid_competence_ids:
-            self._discovered_competence_ids.add(competence_id)
-
-    def get_progress_percentage(self):
-        """Get current progress.
+        self._mark(competence_id)
 
-        :returns: progress percentage
-        :rtype: float
-        """
-        total = len(self._valid_competence_ids)
+    def discover_many(self, competence_ids):
+        """Mark several competences as discovered.
 
-        if total == 0:
-            return 0
+        The mask of the group is computed once per layout.
 
-        return 100 * len(self._discovered_competence_ids) / total
+        :param competence_ids: identifiers of the competences
+        :type: iterable with str
+        """
+        self._mark_many(competence_ids)
@@ -6,6 +6,8 @@ from sunlesscv.progress.abstract import AbstractTracker
 class DistrustTracker(AbstractTracker):
     """Class to track the distrust tracker."""
 
+    __slots__ = ("__is_distrusted",)
+
     def __init__(self):
         super().__init__()
         self.__is_distrusted = False
@@ -1,19 +1,26 @@
 """Module with a progress tracker for the locations of Sunless CV."""
 
 from sunlesscv.identifier import LocationId
-from sunlesscv.progress.abstract import AbstractTracker
+from sunlesscv.progress.bitset import BitsetLayout, BitsetTracker
 
 
-class LocationTracker(AbstractTracker):
-    """Class to track visited locations."""
+_DEFAULT_LAYOUT = BitsetLayout(location_id.value for location_id in LocationId)
 
-    def __init__(self, valid_location_ids=None):
-        super().__init__()
-        self._visited_location_ids = set()
 
+class LocationTracker(BitsetTracker):
+    """Class to track visited locations.
+
+    Locations are assigned bits in the order of their identifiers.
+    """
+
+    __slots__ = ()
+
+    def __init__(self, valid_location_ids=None):
         if valid_location_ids is None:
-            valid_location_ids = set(location_id.value for location_id in LocationId)
-        self._valid_location_ids = frozenset(str(location_id) for location_id in valid_location_ids)
+            layout = _DEFAULT_LAYOUT
+        else:
+            layout = BitsetLayout(valid_location_ids)
+        super().__init__(layout=layout)
 
     def visit(self, location_id):
         """Mark a location as visited.
@@ -21,19 +28,12 @@ class LocationTracker(AbstractTracker):
         :param location_id: identifier of the location
         :type: str
         """
-        location_id = str(location_id)
-        if location_id in self._valid_location_ids:
-            self._visited_location_ids.add(location_id)
+        self._mark(location_id)
 
-    def get_progress_percentage(self):
-        """Get current progress.
+    def visit_many(self, location_ids):
+        """Mark several locations as visited.
 
-        :returns: progress percentage
-        :rtype: float
+        :param location_ids: identifiers of the locations
+        :type: iterable with str
         """
-        total = len(self._valid_location_ids)
-
-        if total == 0:
-            return 0
-
-        return 100 * len(self._visited_location_ids) / total
+        self._mark_many(location_ids)
@@ -1,10 +1,32 @@
 """Module to manage multiple trackers."""
 
+from sunlessadventure.abstract.context import TrackedContext
 
-class ProgressManager:
-    """Class to manage different types of progress in the adventure."""
+from sunlesscv.progress.location import LocationTracker
+from sunlesscv.progress.competence import CompetenceTracker
+from sunlesscv.progress.distrust import DistrustTracker
+from sunlesscv.progress.watch import WatchTracker
+
+
+class ProgressManager(TrackedContext):
+    """Class to manage different types of progress in the adventure.
+
+    Changes since a checkpoint are reported by the names:
+
+    ======================== ==================================================
+    Name                     Value
+    ======================== ==================================================
+    visited_locations        identifiers of the newly visited locations
+    discovered_competences   identifiers of the newly discovered competences
+    watched                  whether there is somebody watching, if it changed
+    distrusted               whether distrust has emerged, if it changed
+    ======================== ==================================================
+    """
+
+    __slots__ = ("_location_tracker", "_competence_tracker", "_distrust_tracker", "_watch_tracker")
 
     def __init__(self, location_tracker, competence_tracker, distrust_tracker, watch_tracker):
+        super().__init__()
         self._location_tracker = location_tracker
         self._competence_tracker = competence_tracker
         self._distrust_tracker = distrust_tracker
@@ -29,3 +51,56 @@ class ProgressManager:
     def watch_tracker(self):
         """Watch tracker."""
         return self._watch_tracker
+
+    def get_checkpoint(self):
+        """Get a checkpoint of the current progress.
+
+        :returns: masks of the location and the competence trackers and the flags of the watch and
+            the distrust trackers
+        :rtype: tuple
+        """
+        return (
+            self._location_tracker.mask,
+            self._competence_tracker.mask,
+            self._watch_tracker.is_watched,
+            self._distrust_tracker.is_distrusted,
+        )
+
+    def get_changes(self, checkpoint):
+        """Get changes of the progress since a checkpoint.
+
+        :param checkpoint: checkpoint from :meth:`get_checkpoint`
+        :type: tuple
+        :returns: changes by their names, empty if nothing changed
+        :rtype: dict
+        """
+        if self.get_checkpoint() == checkpoint:
+            return {}
+
+        location_mask, competence_mask, is_watched, is_distrusted = checkpoint
+        changes = {}
+        if self._location_tracker.mask != location_mask:
+            changes["visited_locations"] = self._location_tracker.get_marked_ids(location_mask)
+        if self._competence_tracker.mask != competence_mask:
+            changes["discovered_competences"] = self._competence_tracker.get_marked_ids(
+                competence_mask,
+            )
+        if self._watch_tracker.is_watched != is_watched:
+            changes["watched"] = self._watch_tracker.is_watched
+        if self._distrust_tracker.is_distrusted != is_distrusted:
+            changes["distrusted"] = self._distrust_tracker.is_distrusted
+        return changes
+
+
+def create_progress_manager():
+    """Create a progress manager with fresh trackers.
+
+    :returns: progress manager
+    :rtype: :class:`ProgressManager`
+    """
+    return ProgressManager(
+        location_tracker=LocationTracker(),
+        competence_tracker=CompetenceTracker(),
+        distrust_tracker=DistrustTracker(),
+        watch_tracker=WatchTracker(),
+    )
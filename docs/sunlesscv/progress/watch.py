@@ -6,6 +6,8 @@ from sunlesscv.progress.abstract import AbstractTracker
 class WatchTracker(AbstractTracker):
     """Class to track the watched tracker."""
 
+    __slots__ = ("__is_watched",)
+
     def __init__(self):
         super().__init__()
         self.__is_watched = False
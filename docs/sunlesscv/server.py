@@ -0,0 +1,309 @@
+"""Module to serve sessions of Sunless CV over HTTP.
+
+The server is a WSGI application, so it runs under any WSGI server. A standalone server from
+the standard library is started with::
+
+    python -m sunlesscv.server --port 8000
+
+Locations are built in code, or from a story bundle given with ``--bundle``, see
+:mod:`sunlesscv.location.bundle`. With ``--link`` the story is linked at startup, so sessions
+move along resolved links, see :mod:`sunlesscv.location.linker`.
+
+========================================== ==================================================
+Request                                    Response
+========================================== ==================================================
+``POST /sessions``                         a new session, its identifier is in ``Location``
+``GET /sessions/<id>/location``            description of the current location
+``GET /sessions/<id>/consequence``         description of the current consequence
+``POST /sessions/<id>/actions/<index>``    the screen after the action is performed
+``POST /sessions/<id>/resolve``            the screen after the consequence is resolved
+``POST /sessions/<id>/leave``              the screen after the location is left
+``DELETE /sessions/<id>``                  the session is closed
+========================================== ==================================================
+
+A screen is a JSON object with the type of the screen, ``location`` or ``consequence``, and its
+description. The ETag of a response is the snapshot of the session, see :mod:`sunlesscv.session`,
+so equal states of different sessions share ETags and encoded responses. Descriptions are served
+with ``304 Not Modified`` if ``If-None-Match`` matches the ETag.
+"""
+
+import argparse
+import json
+import re
+import secrets
+import sys
+from wsgiref.simple_server import make_server
+
+from sunlessadventure.abstract.location import LocationError
+from sunlessadventure.core.adventure import AdventureError, AdventureStateError
+
+from sunlesscv.host import AdventureHost
+from sunlesscv.location.bundle import create_location_factory
+from sunlesscv.location.linker import link_story
+from sunlesscv.session import encode_session
+
+
+DEFAULT_CACHE_SIZE = 4096
+
+LOCATION = "location"
+"""Screen of a location."""
+
+CONSEQUENCE = "consequence"
+"""Screen of a consequence."""
+
+_SCREEN = "screen"
+_ENTITY_TAG = re.compile(r'(?:W/)?("[^"]*")')
+_JSON_TYPE = "application/json"
+_REASONS = {
+    200: "OK",
+    201: "Created",
+    204: "No Content",
+    304: "Not Modified",
+    400: "Bad Request",
+    404: "Not Found",
+    405: "Method Not Allowed",
+    409: "Conflict",
+    500: "Internal Server Error",
+}
+
+
+class AdventureServer:
+    """WSGI application to serve sessions of Sunless CV.
+
+    Sessions run on a shared :class:`AdventureHost <sunlesscv.host.AdventureHost>`, a new host is
+    created if ``host`` is omitted. Requests, that the story fails to handle, e.g. because of
+    a missing location, are answered with ``500 Internal Server Error``. Encoded responses are
+    cached per state, the cache is cleared when it holds ``cache_size`` responses. Sessions are
+    not locked, so the application expects a server, that handles one request at a time.
+    """
+
+    __slots__ = ("_host", "_sessions", "_responses", "_cache_size")
+
+    def __init__(self, host=None, cache_size=DEFAULT_CACHE_SIZE):
+        self._host = host if host is not None else AdventureHost()
+        self._sessions = {}
+        self._responses = {}
+        self._cache_size = cache_size
+
+    def __call__(self, environ, start_response):
+        """Handle a request.
+
+        :param environ: WSGI environment
+        :type: dict
+        :param start_response: function to start the response
+        :type: callable
+        :returns: body of the response
+        :rtype: list with bytes
+        """
+        status, headers, body = self.handle(
+            method=environ["REQUEST_METHOD"],
+            path=environ.get("PATH_INFO", ""),
+            etag=environ.get("HTTP_IF_NONE_MATCH"),
+        )
+        start_response(f"{status} {_REASONS[status]}", headers)
+        return [body]
+
+    def handle(self, method, path, etag=None):
+        """Handle a request without WSGI.
+
+        :param method: HTTP method
+        :type: str
+        :param path: path of the request
+        :type: str
+        :param etag: value of ``If-None-Match``, a list of ETags or ``*``
+        :type: str
+        :returns: status, headers and body of the response
+        :rtype: tuple with int, list of tuple and bytes
+        """
+        parts = path.strip("/").split("/")
+        if parts[0] != "sessions":
+            return _create_error(404, f"Unknown path '{path}'")
+
+        if len(parts) == 1:
+            if method != "POST":
+                return _create_error(405, f"Method '{method}' is not allowed")
+            try:
+                return self._create_session()
+            except (AdventureError, LocationError) as error:
+                return _create_error(500, str(error))
+
+        adventure = self._sessions.get(parts[1])
+        if adventure is None:
+            return _create_error(404, f"Unknown session '{parts[1]}'")
+
+        try:
+            return self._handle_session(method, parts[1], adventure, parts[2:], etag)
+        except AdventureStateError as error:
+            return _create_error(409, str(error))
+        except (AdventureError, LocationError) as error:
+            return _create_error(500, str(error))
+
+    @property
+    def host(self):
+        """Host of the sessions."""
+        return self._host
+
+    @property
+    def session_count(self):
+        """Number of open sessions."""
+        return len(self._sessions)
+
+    def _create_session(self):
+        """Create a session and respond with its screen."""
+        session_id = secrets.token_hex(8)
+        adventure = self._host.create_session()
+        self._sessions[session_id] = adventure
+
+        status, headers, body = self._get_screen(adventure)
+        headers.append(("Location", f"/sessions/{session_id}"))
+        return 201, headers, body
+
+    def _handle_session(self, method, session_id, adventure, parts, etag):
+        """Handle a request to a session.
+
+        :raises: :exc:`AdventureStateError <sunlessadventure.core.adventure.AdventureStateError>`
+            if the request can't be applied to the session. :exc:`AdventureError
+            <sunlessadventure.core.adventure.AdventureError>` or :exc:`LocationError
+            <sunlessadventure.abstract.location.LocationError>` if the story fails
+        """
+        if not parts:
+            if method != "DELETE":
+                return _create_error(405, f"Method '{method}' is not allowed")
+            del self._sessions[session_id]
+            return 204, [], b""
+
+        if len(parts) == 1 and parts[0] in (LOCATION, CONSEQUENCE):
+            if method != "GET":
+                return _create_error(405, f"Method '{method}' is not allowed")
+            return self._get_description(adventure, parts[0], etag)
+
+        if method != "POST":
+            return _create_error(405, f"Method '{method}' is not allowed")
+
+        if parts == ["resolve"]:
+            adventure.resolve_consequence()
+        elif parts == ["leave"]:
+            adventure.leave_location()
+        elif len(parts) == 2 and parts[0] == "actions":
+            if not (parts[1].isascii() and parts[1].isdigit()):
+                return _create_error(400, f"Malformed index of an action '{parts[1]}'")
+            adventure.perform_action(int(parts[1]))
+        else:
+            return _create_error(404, f"Unknown command '{'/'.join(parts)}'")
+        return self._get_screen(adventure)
+
+    def _get_description(self, adventure, screen, etag):
+        """Respond with the description of a location or a consequence.
+
+        :raises: :exc:`AdventureStateError <sunlessadventure.core.adventure.AdventureStateError>`
+            if the screen isn't shown
+        """
+        if (adventure.outcome is None) != (screen == LOCATION):
+            raise AdventureStateError(f"There is no {screen} at the moment")
+
+        response_etag, body = self._get_response(adventure, screen)
+        if _matches_etag(etag, response_etag):
+            return 304, [("ETag", response_etag)], b""
+        return 200, _create_headers(response_etag, body), body
+
+    def _get_screen(self, adventure):
+        """Respond with the current screen."""
+        etag, body = self._get_response(adventure, _SCREEN)
+        return 200, _create_headers(etag, body), body
+
+    def _get_response(self, adventure, kind):
+        """Get the ETag and the body of a response from the cache or encode them.
+
+        :param adventure: session to respond about
+        :type: :class:`Adventure <sunlessadventure.core.adventure.Adventure>`
+        :param kind: :data:`LOCATION`, :data:`CONSEQUENCE` or a screen
+        :type: str
+        :returns: ETag and body
+        :rtype: tuple with str and bytes
+        """
+        snapshot = encode_session(adventure)
+        response = self._responses.get((kind, snapshot))
+        if response is not None:
+            return response
+
+        if kind == LOCATION:
+            body = adventure.describe_location_json()
+        elif kind == CONSEQUENCE:
+            body = adventure.describe_consequence_json()
+        elif adventure.outcome is None:
+            body = b'{"screen":"location","description":%s}' % adventure.describe_location_json()
+        else:
+            body = (
+                b'{"screen":"consequence","description":%s}'
+                % adventure.describe_consequence_json()
+            )
+
+        if len(self._responses) >= self._cache_size:
+            self._responses.clear()
+        response = (f'"{snapshot.hex()}"', body)
+        self._responses[kind, snapshot] = response
+        return response
+
+
+def _create_headers(etag, body):
+    """Create headers of a JSON response."""
+    return [
+        ("Content-Type", _JSON_TYPE),
+        ("Content-Length", str(len(body))),
+        ("ETag", etag),
+    ]
+
+
+def _matches_etag(if_none_match, etag):
+    """Check whether ``If-None-Match`` matches an ETag.
+
+    ETags are compared weakly and ``*`` matches any ETag, see RFC 9110, section 13.1.2.
+    """
+    if if_none_match is None:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    return etag in _ENTITY_TAG.findall(if_none_match)
+
+
+def _create_error(status, message):
+    """Create a JSON response with an error."""
+    body = json.dumps({"error": message}).encode("utf-8")
+    return status, [("Content-Type", _JSON_TYPE), ("Content-Length", str(len(body)))], body
+
+
+def main(argv=None):
+    """Serve sessions of Sunless CV over HTTP.
+
+    :param argv: command line arguments
+    :type: list with str
+    """
+    parser = argparse.ArgumentParser(description=main.__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1", help="address to listen on")
+    parser.add_argument("--port", type=int, default=8000, help="port to listen on")
+    parser.add_argument("--bundle", help="path to a story bundle to build locations from")
+    parser.add_argument(
+        "--link",
+        action="store_true",
+        help="link the story at startup, so sessions move along resolved links",
+    )
+    arguments = parser.parse_args(argv)
+
+    location_factory = None
+    if arguments.bundle is not None:
+        with open(arguments.bundle, "rb") as bundle_file:
+            location_factory = create_location_factory(bundle_file.read())
+    if arguments.link:
+        location_factory = link_story(location_factory)
+    application = AdventureServer(host=AdventureHost(location_factory=location_factory))
+
+    with make_server(arguments.host, arguments.port, application) as server:
+        print(f"Serving on http://{arguments.host}:{arguments.port}", file=sys.stderr)
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+
+
+if __name__ == "__main__":
+    main()
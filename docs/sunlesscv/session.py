@@ -0,0 +1,186 @@
+"""Module to encode the state of sessions of Sunless CV.
+
+A snapshot is a little-endian record of 10 bytes:
+
+====== ===== ==============================================================================
+Offset Size  Field
+====== ===== ==============================================================================
+0      1     version of the format
+1      1     position of the current location in :class:`LocationId`
+2      1     position of the action with an unresolved consequence among all actions of
+             the location, 255 if there is no such consequence
+3      1     index of the unresolved consequence
+4      1     flags: 1 if somebody is watching, 2 if distrust has emerged
+5      1     bitmask of visited locations
+6      4     bitmask of discovered competences
+====== ===== ==============================================================================
+
+Bitmasks follow the default layouts of the trackers. Snapshots are the base of session journals,
+see :func:`create_journal`.
+"""
+
+import functools
+import struct
+
+from sunlessadventure.core.adventure import Adventure, AdventureError
+from sunlessadventure.core.journal import DEFAULT_COMPACTION_SIZE, Journal
+
+from sunlesscv.identifier import LocationId
+from sunlesscv.location.factory import LocationFactory
+from sunlesscv.progress.manager import create_progress_manager
+
+
+VERSION = 1
+
+_SNAPSHOT = struct.Struct("<BBBBBBI")
+_NO_ACTION = 0xFF
+_WATCHED = 1
+_DISTRUSTED = 2
+
+_LOCATION_IDS = tuple(location_id.value for location_id in LocationId)
+_LOCATION_INDICES = {location_id: index for index, location_id in enumerate(_LOCATION_IDS)}
+
+
+class SessionError(Exception):
+    """Exception raised when a session can't be encoded or decoded."""
+
+
+def encode_session(adventure):
+    """Encode the state of a session.
+
+    :param adventure: session with the progress as its context
+    :type: :class:`Adventure <sunlessadventure.core.adventure.Adventure>`
+    :returns: snapshot of the session
+    :rtype: bytes
+    :raises: :exc:`SessionError` if the state can't be encoded
+    """
+    location = adventure.location
+    location_index = _LOCATION_INDICES.get(location.get_id())
+    if location_index is None:
+        raise SessionError(f"Unknown location '{location.get_id()}'")
+
+    action_index = _NO_ACTION
+    outcome = adventure.outcome
+    if outcome is not None:
+        action_index = _find_action(location, outcome)
+
+    progress_manager = adventure.context
+    flags = 0
+    if progress_manager.watch_tracker.is_watched:
+        flags |= _WATCHED
+    if progress_manager.distrust_tracker.is_distrusted:
+        flags |= _DISTRUSTED
+
+    try:
+        return _SNAPSHOT.pack(
+            VERSION,
+            location_index,
+            action_index,
+            adventure.consequence_index if outcome is not None else 0,
+            flags,
+            progress_manager.location_tracker.mask,
+            progress_manager.competence_tracker.mask,
+        )
+    except struct.error as error:
+        raise SessionError(f"The state can't be encoded: {error}") from error
+
+
+def decode_session(snapshot, location_factory=None):
+    """Decode a session from its snapshot.
+
+    :param snapshot: snapshot of the session
+    :type: bytes
+    :param location_factory: factory to get locations from. A new factory is created if omitted
+    :type: :class:`LocationFactory <sunlesscv.location.factory.LocationFactory>`
+    :returns: the session and its progress
+    :rtype: tuple with :class:`Adventure <sunlessadventure.core.adventure.Adventure>` and
+        :class:`ProgressManager <sunlesscv.progress.manager.ProgressManager>`
+    :raises: :exc:`SessionError` if the snapshot is malformed
+    """
+    try:
+        (
+            version,
+            location_index,
+            action_index,
+            consequence_index,
+            flags,
+            location_mask,
+            competence_mask,
+        ) = _SNAPSHOT.unpack(snapshot)
+    except struct.error as error:
+        raise SessionError(f"Malformed snapshot: {error}") from error
+
+    if version != VERSION:
+        raise SessionError(f"Unsupported version of the snapshot '{version}'")
+    if location_index >= len(_LOCATION_IDS):
+        raise SessionError(f"Unknown location at the position '{location_index}'")
+
+    if location_factory is None:
+        location_factory = LocationFactory()
+
+    progress_manager = create_progress_manager()
+    adventure = Adventure(
+        location_factory=location_factory,
+        start_location_id=_LOCATION_IDS[location_index],
+        context=progress_manager,
+    )
+
+    try:
+        progress_manager.location_tracker.mask = location_mask
+        progress_manager.competence_tracker.mask = competence_mask
+    except ValueError as error:
+        raise SessionError(f"Malformed snapshot: {error}") from error
+    progress_manager.watch_tracker.is_watched = flags & _WATCHED
+    progress_manager.distrust_tracker.is_distrusted = flags & _DISTRUSTED
+
+    if action_index != _NO_ACTION:
+        actions = adventure.location.get_all_actions()
+        if action_index >= len(actions) or actions[action_index].get_outcome() is None:
+            raise SessionError(f"Unknown action at the position '{action_index}'")
+
+        try:
+            adventure.restore_consequence(
+                outcome=actions[action_index].get_outcome(),
+                consequence_index=consequence_index,
+            )
+        except AdventureError as error:
+            raise SessionError(f"Malformed snapshot: {error}") from error
+
+    return adventure, progress_manager
+
+
+def create_journal(location_factory=None, compaction_size=DEFAULT_COMPACTION_SIZE):
+    """Create a journal of a session of Sunless CV.
+
+    :param location_factory: factory to get locations from while replaying. A new factory is
+        created if omitted
+    :type: :class:`LocationFactory <sunlesscv.location.factory.LocationFactory>`
+    :param compaction_size: number of bytes of events, that triggers a new snapshot
+    :type: int
+    :returns: journal to pass to :class:`Adventure <sunlessadventure.core.adventure.Adventure>`
+    :rtype: :class:`Journal <sunlessadventure.core.journal.Journal>`
+    """
+    if location_factory is None:
+        location_factory = LocationFactory()
+
+    return Journal(
+        encode_snapshot=encode_session,
+        decode_snapshot=functools.partial(_decode_adventure, location_factory=location_factory),
+        compaction_size=compaction_size,
+    )
+
+
+def _decode_adventure(snapshot, location_factory):
+    """Decode an adventure from a snapshot of its session."""
+    return decode_session(snapshot, location_factory=location_factory)[0]
+
+
+def _find_action(location, outcome):
+    """Find the position of the action with the outcome among all actions of the location.
+
+    :raises: :exc:`SessionError` if there is no such action
+    """
+    for action_index, action in enumerate(location.get_all_actions()[:_NO_ACTION]):
+        if action.get_outcome() is outcome:
+            return action_index
+    raise SessionError(f"The outcome can't be addressed in the location '{location.get_id()}'")
@@ -0,0 +1,243 @@
+"""Module to run a session of Sunless CV for the page from a web worker.
+
+The page and the worker exchange JSON messages. The page sends commands::
+
+    ["start", <snapshot in hex or null>, <identifier of the requested location or "">,
+     <key of the fragment in the panel or null>]
+    ["command", "leave" | "resolve" | "<index of an action>", <token of the screen>]
+
+A command is applied only if its token is the token of the current screen, so a command sent
+from a screen, which the page doesn't show anymore, e.g. the second click of a double click, is
+dropped with an error. Every applied command gives the screen a new token, even if it shows
+the same content. The page starts with the token 0. The worker answers every command with
+the changes of the page. Keys are left out, if there is nothing to change:
+
+=========== ==========================================================================
+Key         Value
+=========== ==========================================================================
+screen      ``["fragment", <key>]`` of a static screen, see :mod:`sunlesscv.fragment`,
+            ``["location", <description>]`` or ``["consequence", <description>]``
+token       token of the new screen, sent with every applied command
+progress    percentages of the trackers, that changed, by the names of the progress bars
+location    identifier of the current location, if a location is shown
+session     snapshot of the session in hex, see :mod:`sunlesscv.session`
+prefetch    files, which the page may prefetch, see :meth:`AdventureShell.prefetch`
+error       description of a command, that can't be applied
+=========== ==========================================================================
+"""
+
+import json
+
+from sunlessadventure.core.adventure import LEAVE, RESOLVE, Adventure, AdventureStateError
+
+from sunlesscv.fragment import get_fragment_key
+from sunlesscv.identifier import LocationId
+from sunlesscv.location.factory import LocationFactory
+from sunlesscv.progress.manager import create_progress_manager
+from sunlesscv.session import SessionError, decode_session, encode_session
+
+
+DEFAULT_PREFETCH_STEPS = 1
+
+_COMMANDS = {"leave": LEAVE, "resolve": RESOLVE}
+_INITIAL_PROGRESS = {"explorer": 0, "geek": 0, "watched": 0, "distrust": 0}
+
+
+class AdventureShell:
+    """Class to run a session for the page and report the changes of the page.
+
+    ``fragment_keys`` are keys of the fragments, that the page has, ``sprites`` map the names of
+    the images to their symbols. Locations are built by ``location_factory``, they are built in
+    code if it's omitted. The session moves along resolved links, if the factory is a story linked
+    ahead of time, see :func:`link_story <sunlesscv.location.linker.link_story>`. The shell
+    remembers what the page shows, so a message holds only what changed since the previous
+    message.
+    """
+
+    __slots__ = (
+        "_fragment_keys",
+        "_sprites",
+        "_prefetch_steps",
+        "_location_factory",
+        "_adventure",
+        "_screen",
+        "_screen_token",
+        "_progress",
+        "_prefetched_files",
+    )
+
+    def __init__(
+        self,
+        fragment_keys,
+        sprites,
+        prefetch_steps=DEFAULT_PREFETCH_STEPS,
+        location_factory=None,
+    ):
+        self._fragment_keys = frozenset(fragment_keys)
+        self._sprites = sprites
+        self._prefetch_steps = prefetch_steps
+        if location_factory is None:
+            location_factory = LocationFactory()
+        self._location_factory = location_factory
+        self._adventure = None
+        self._screen = None
+        self._screen_token = 0
+        self._progress = dict(_INITIAL_PROGRESS)
+        self._prefetched_files = set()
+
+    def handle(self, message):
+        """Handle a message of the page.
+
+        :param message: JSON message of the page
+        :type: str
+        :returns: JSON message with the changes of the page
+        :rtype: str
+        """
+        try:
+            name, *arguments = json.loads(message)
+            step = None
+            if name == "start":
+                self.start(*arguments)
+            elif name == "command":
+                step = self.apply(*arguments)
+            else:
+                return json.dumps({"error": f"Unknown message '{name}'"})
+        except (AdventureStateError, ValueError, TypeError) as error:
+            return json.dumps({"error": str(error)})
+        return self._create_message(step)
+
+    def start(self, snapshot=None, location_id="", fragment_key=None):
+        """Start the session.
+
+        The saved session is resumed, if it is at the requested location or no location is
+        requested.
+
+        :param snapshot: snapshot of the saved session in hex
+        :type: str
+        :param location_id: identifier of the requested location
+        :type: str
+        :param fragment_key: key of the fragment, which the page shows before the session starts
+        :type: str
+        """
+        adventure = None
+        if snapshot:
+            try:
+                adventure, _ = decode_session(
+                    bytes.fromhex(snapshot),
+                    location_factory=self._location_factory,
+                )
+            except (SessionError, ValueError):
+                adventure = None
+
+            if adventure is not None and location_id and adventure.location.get_id() != location_id:
+                adventure = None
+
+        if adventure is None:
+            adventure = Adventure(
+                location_factory=self._location_factory,
+                start_location_id=location_id or LocationId.HOME.value,
+                context=create_progress_manager(),
+            )
+        self._adventure = adventure
+        self._screen = fragment_key
+        self._screen_token = 0
+
+    def apply(self, command, screen_token=None):
+        """Apply a command of the page.
+
+        :param command: ``leave``, ``resolve`` or the index of an action
+        :type: str
+        :param screen_token: token of the screen, which the command was sent from. The token isn't
+            checked if omitted
+        :type: int
+        :returns: changes of the session
+        :rtype: :class:`Step <sunlessadventure.core.adventure.Step>`
+        :raises: :exc:`AdventureStateError <sunlessadventure.core.adventure.AdventureStateError>`
+            if the command can't be applied or was sent from another screen. :exc:`ValueError`
+            if the command is malformed
+        """
+        if self._adventure is None:
+            raise AdventureStateError("The session isn't started")
+
+        if screen_token is not None and screen_token != self._screen_token:
+            raise AdventureStateError(f"The command '{command}' was sent from another screen")
+
+        if command in _COMMANDS:
+            command = _COMMANDS[command]
+        elif isinstance(command, str) and command.isascii() and command.isdigit():
+            command = int(command)
+        else:
+            raise ValueError(f"Unknown command '{command}'")
+        return self._adventure.step(command)
+
+    def prefetch(self):
+        """Get files of the images, that may be shown next.
+
+        :returns: JSON message with the files, which the page hasn't prefetched yet, or None,
+            if there are no such files
+        :rtype: str
+        """
+        if self._adventure is None:
+            return None
+
+        _, images = self._adventure.prefetch(steps=self._prefetch_steps)
+        files = {self._sprites[image]["href"].partition("#")[0] for image in images}
+        files -= self._prefetched_files
+        if not files:
+            return None
+
+        self._prefetched_files |= files
+        return json.dumps({"prefetch": sorted(files)})
+
+    def _create_message(self, step=None):
+        """Create a message with the changes of the page since the previous message.
+
+        The progress is checked only if the step changed it or there is no step.
+        """
+        adventure = self._adventure
+        parts = []
+
+        fragment_key = get_fragment_key(adventure)
+        if fragment_key not in self._fragment_keys:
+            fragment_key = None
+
+        if fragment_key is not None:
+            if fragment_key != self._screen:
+                parts.append(f'"screen":["fragment",{json.dumps(fragment_key)}]')
+                self._screen = fragment_key
+        elif adventure.outcome is None:
+            description = adventure.describe_location_json()
+            if description != self._screen:
+                parts.append(f'"screen":["location",{description.decode("utf-8")}]')
+                self._screen = description
+        else:
+            description = adventure.describe_consequence_json()
+            if description != self._screen:
+                parts.append(f'"screen":["consequence",{description.decode("utf-8")}]')
+                self._screen = description
+
+        # Every applied command gets a new token, even if the screen didn't change, so a command
+        # sent twice from an equal screen is applied once
+        if parts or step is not None:
+            self._screen_token += 1
+            parts.append(f'"token":{self._screen_token}')
+
+        if step is None or step.changes:
+            progress_manager = adventure.context
+            progress = {
+                "explorer": progress_manager.location_tracker.get_progress_percentage(),
+                "geek": progress_manager.competence_tracker.get_progress_percentage(),
+                "watched": progress_manager.watch_tracker.get_progress_percentage(),
+                "distrust": progress_manager.distrust_tracker.get_progress_percentage(),
+            }
+            changes = {
+                name: value for name, value in progress.items() if self._progress[name] != value
+            }
+            if changes:
+                parts.append(f'"progress":{json.dumps(changes, separators=(",", ":"))}')
+                self._progress = progress
+
+        if adventure.outcome is None:
+            parts.append(f'"location":{json.dumps(adventure.location.get_id())}')
+        parts.append(f'"session":"{encode_session(adventure).hex()}"')
+        return "{" + ",".join(parts) + "}"
@@ -0,0 +1,43 @@
+"""Web worker of the page, which runs the adventure.
+
+The worker announces itself with the assets of the page, the symbols of the images and
+the fragments of static screens, and then handles the messages of the page, see
+:mod:`sunlesscv.shell`. Locations are built from the story bundle in the archive.
+"""
+
+import json
+import sys
+import zipfile
+
+from pyscript import xworker
+
+# The packages are fetched as one archive, see tools/build_site.py
+sys.path.insert(0, "sunless.zip")
+with zipfile.ZipFile("sunless.zip") as archive:
+    SPRITES_JSON = archive.read("sprites.json").decode("utf-8")
+    FRAGMENTS_JSON = archive.read("fragments.json").decode("utf-8")
+    STORY_BUNDLE = archive.read("story.bundle")
+
+# pylint: disable=wrong-import-position
+from sunlesscv.location.bundle import create_location_factory
+from sunlesscv.shell import AdventureShell
+
+
+shell = AdventureShell(
+    fragment_keys=json.loads(FRAGMENTS_JSON),
+    sprites=json.loads(SPRITES_JSON),
+    location_factory=create_location_factory(STORY_BUNDLE),
+)
+
+
+def handle_message(event):
+    """Handle a message of the page and prefetch, while the page paints the answer."""
+    xworker.postMessage(shell.handle(event.data))
+
+    prefetch_message = shell.prefetch()
+    if prefetch_message is not None:
+        xworker.postMessage(prefetch_message)
+
+
+xworker.onmessage = handle_message
+xworker.postMessage(f'{{"sprites":{SPRITES_JSON},"fragments":{FRAGMENTS_JSON}}}')
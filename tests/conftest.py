@@ -0,0 +1,28 @@
+"""Configuration of the tests.
+
+The packages are not installed, they are imported from the root directory of the site.
+"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, "docs"))
+
+# pylint: disable=wrong-import-position
+from sunlessadventure.core.adventure import LEAVE, RESOLVE
+
+
+@pytest.fixture(name="choose_command")
+def fixture_choose_command():
+    """Function to choose a random command, that the current screen of an adventure offers."""
+    def choose_command(adventure, randomizer):
+        if adventure.outcome is not None:
+            return RESOLVE
+
+        description = adventure.describe_location()
+        command_count = len(description["actions"]) + (description["exit"] is not None)
+        command = randomizer.randrange(command_count)
+        return LEAVE if command == len(description["actions"]) else command
+    return choose_command
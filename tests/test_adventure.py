@@ -0,0 +1,198 @@
+"""Tests of adventures."""
+
+import json
+import random
+
+import pytest
+
+from sunlessadventure.core.adventure import (
+    CONSEQUENCE,
+    LEAVE,
+    LOCATION,
+    MOVED,
+    RESOLVE,
+    RESOLVE_ALL,
+    Adventure,
+    AdventureStateError,
+)
+
+from sunlesscv.identifier import LocationId
+from sunlesscv.location.factory import LocationFactory
+from sunlesscv.progress.manager import create_progress_manager
+
+
+@pytest.fixture(name="location_factory", scope="module")
+def fixture_location_factory():
+    """Factory of the story of Sunless CV."""
+    return LocationFactory()
+
+
+def _create_adventure(location_factory):
+    """Create an adventure starting at home."""
+    return Adventure(location_factory, LocationId.HOME.value, context=create_progress_manager())
+
+
+def _apply_command(adventure, command):
+    """Apply a command by the method of the command."""
+    if command == RESOLVE:
+        adventure.resolve_consequence()
+    elif command == RESOLVE_ALL:
+        adventure.resolve_all()
+    elif command == LEAVE:
+        adventure.leave_location()
+    else:
+        adventure.perform_action(command)
+
+
+def _describe(adventure):
+    """Describe the current screen of an adventure."""
+    if adventure.outcome is not None:
+        return adventure.describe_consequence()
+    return adventure.describe_location()
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_apply_matches_single_commands(location_factory, choose_command, seed):
+    """A batch of commands ends on the same screen as the commands one by one."""
+    single = _create_adventure(location_factory)
+    randomizer = random.Random(seed)
+    commands = []
+    expected_events = []
+    for _ in range(200):
+        command = choose_command(single, randomizer)
+        _apply_command(single, command)
+        commands.append(command)
+        if single.outcome is None:
+            expected_events.append((MOVED, single.location.get_id()))
+        else:
+            expected_events.append((CONSEQUENCE, single.consequence_index))
+
+    batch = _create_adventure(location_factory)
+    description, events = batch.apply(commands)
+
+    assert description == _describe(single)
+    assert events == expected_events
+    assert batch.context.location_tracker.mask == single.context.location_tracker.mask
+
+
+def test_apply_resolves_all_consequences(location_factory):
+    """All consequences of an outcome are resolved by one command."""
+    adventure = _create_adventure(location_factory)
+    action_index = _find_action_with_consequences(adventure)
+
+    description, events = adventure.apply((action_index, RESOLVE_ALL))
+
+    assert events == [(CONSEQUENCE, 0), (MOVED, adventure.location.get_id())]
+    assert description == adventure.describe_location()
+
+
+def test_apply_keeps_commands_before_failure(location_factory):
+    """Commands before a failed command stay applied."""
+    adventure = _create_adventure(location_factory)
+    action_index = _find_action_with_consequences(adventure)
+
+    with pytest.raises(AdventureStateError, match="at the position '1'"):
+        adventure.apply((action_index, LEAVE))
+
+    assert adventure.outcome is not None
+    assert adventure.consequence_index == 0
+
+
+@pytest.mark.parametrize("command", [-4, LEAVE - 10])
+def test_negative_action_index_is_rejected(location_factory, command):
+    """Negative indices address no action, they aren't counted from the end."""
+    adventure = _create_adventure(location_factory)
+
+    with pytest.raises(AdventureStateError):
+        adventure.perform_action(-1)
+    with pytest.raises(AdventureStateError):
+        adventure.step(command)
+
+    assert adventure.location.get_id() == LocationId.HOME.value
+    assert adventure.outcome is None
+
+
+def _find_action_with_consequences(adventure):
+    """Find the index of an action of the current location, that shows consequences."""
+    actions = adventure.location.get_actions(adventure.context)
+    for action_index, action in enumerate(actions):
+        if action.get_outcome().get_consequences():
+            return action_index
+    raise AssertionError("There is no action with consequences")
+
+
+def _get_progress(progress_manager):
+    """Get the progress of a session as sets and flags."""
+    return (
+        set(progress_manager.location_tracker.get_marked_ids()),
+        set(progress_manager.competence_tracker.get_marked_ids()),
+        progress_manager.watch_tracker.is_watched,
+        progress_manager.distrust_tracker.is_distrusted,
+    )
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_step_reports_changes(location_factory, choose_command, seed):
+    """A step reports the screen after the command and the progress made by it."""
+    adventure = _create_adventure(location_factory)
+    randomizer = random.Random(seed)
+    shared_steps = {}
+
+    for _ in range(300):
+        outcome = adventure.outcome
+        visited, discovered, is_watched, is_distrusted = _get_progress(adventure.context)
+
+        step = adventure.step(choose_command(adventure, randomizer))
+
+        if adventure.outcome is None:
+            assert step.screen == LOCATION
+            assert step.location_id == adventure.location.get_id()
+            assert step.consequence_index is None
+            assert step.consequence_count is None
+        else:
+            assert step.screen == CONSEQUENCE
+            assert step.location_id is None
+            assert step.consequence_index == adventure.consequence_index
+            if adventure.outcome is outcome:
+                assert step.consequence_count is None
+            else:
+                assert step.consequence_count == len(adventure.outcome.get_consequences())
+
+        now_visited, now_discovered, now_watched, now_distrusted = _get_progress(adventure.context)
+        expected_changes = {}
+        if now_visited != visited:
+            expected_changes["visited_locations"] = now_visited - visited
+        if now_discovered != discovered:
+            expected_changes["discovered_competences"] = now_discovered - discovered
+        if now_watched != is_watched:
+            expected_changes["watched"] = now_watched
+        if now_distrusted != is_distrusted:
+            expected_changes["distrusted"] = now_distrusted
+        changes = {
+            name: set(value) if isinstance(value, list) else value
+            for name, value in step.changes.items()
+        }
+        assert changes == expected_changes
+
+        if not step.changes:
+            key = (step.screen, step.location_id, step.consequence_index, step.consequence_count)
+            assert shared_steps.setdefault(key, step) is step
+            with pytest.raises(TypeError):
+                step.changes["watched"] = True
+
+
+def test_step_json(location_factory):
+    """A step is encoded without empty values."""
+    adventure = _create_adventure(location_factory)
+    action_index = _find_action_with_consequences(adventure)
+
+    step = adventure.step(action_index)
+
+    assert json.loads(step.to_json()) == {
+        "screen": CONSEQUENCE,
+        "consequence": 0,
+        "consequences": len(adventure.outcome.get_consequences()),
+        **({"changes": dict(step.changes)} if step.changes else {}),
+    }
+    assert step.to_json() is step.to_json()
+
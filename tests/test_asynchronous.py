@@ -0,0 +1,131 @@
+"""Tests of adventures with asynchronous locations."""
+
+import asyncio
+import random
+
+import pytest
+
+from sunlessadventure.abstract.location import AsyncLocationFactory
+from sunlessadventure.core.adventure import LEAVE, RESOLVE, Adventure, AdventureStateError
+from sunlessadventure.core.asynchronous import AsyncAdventure
+from sunlessadventure.core.location.adapter import (
+    SyncLocationAdapter,
+    SyncLocationFactoryAdapter,
+)
+
+from sunlesscv.identifier import LocationId
+from sunlesscv.location.factory import LocationFactory
+from sunlesscv.progress.manager import create_progress_manager
+
+
+class _SlowLocationFactory(AsyncLocationFactory):
+    """Factory, that suspends before it returns a location."""
+
+    def __init__(self, location_factory):
+        self._location_factory = SyncLocationFactoryAdapter(location_factory)
+
+    async def get_location(self, location_id):
+        """Get a location by its identifier."""
+        await asyncio.sleep(0)
+        return await self._location_factory.get_location(location_id)
+
+    def get_default_location_id(self):
+        """Get the identifier of the default location."""
+        return self._location_factory.get_default_location_id()
+
+
+async def _apply_command(adventure, command):
+    """Apply a command to an asynchronous adventure."""
+    if command == RESOLVE:
+        await adventure.resolve_consequence()
+    elif command == LEAVE:
+        await adventure.leave_location()
+    else:
+        await adventure.perform_action(command)
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_async_adventure_matches_adventure(choose_command, seed):
+    """Both adventures show the same screens and predict the same next steps."""
+    location_factory = LocationFactory()
+
+    async def play():
+        actual = await AsyncAdventure.create(
+            _SlowLocationFactory(location_factory),
+            LocationId.HOME.value,
+            context=create_progress_manager(),
+        )
+        expected = Adventure(
+            location_factory,
+            LocationId.HOME.value,
+            context=create_progress_manager(),
+        )
+        randomizer = random.Random(seed)
+
+        for _ in range(200):
+            if expected.outcome is None:
+                assert await actual.describe_location() == expected.describe_location()
+                assert await actual.prefetch(2) == expected.prefetch(2)
+            else:
+                assert actual.describe_consequence() == expected.describe_consequence()
+
+            command = choose_command(expected, randomizer)
+            await _apply_command(actual, command)
+            expected.step(command)
+
+        assert actual.context.location_tracker.mask == expected.context.location_tracker.mask
+
+    asyncio.run(play())
+
+
+def test_unknown_start_is_default_location():
+    """An adventure starts at the default location, if the start location is unknown."""
+    location_factory = _SlowLocationFactory(LocationFactory())
+
+    async def create():
+        return await AsyncAdventure.create(
+            location_factory,
+            "unknown",
+            context=create_progress_manager(),
+        )
+
+    adventure = asyncio.run(create())
+
+    assert adventure.location.get_id() == location_factory.get_default_location_id()
+
+
+def test_negative_action_index_is_rejected():
+    """Negative indices address no action, they aren't counted from the end."""
+    async def perform():
+        adventure = await AsyncAdventure.create(
+            _SlowLocationFactory(LocationFactory()),
+            LocationId.HOME.value,
+            context=create_progress_manager(),
+        )
+        with pytest.raises(AdventureStateError):
+            await adventure.perform_action(-1)
+        return adventure
+
+    adventure = asyncio.run(perform())
+
+    assert adventure.location.get_id() == LocationId.HOME.value
+
+
+def test_variants_of_actions_are_adapted_once():
+    """Actions of a location, that alternates between variants, are adapted once per variant."""
+    adapter = SyncLocationAdapter(LocationFactory().get_location(LocationId.PERSONALITY.value))
+    explorer = create_progress_manager()
+    for location_id in LocationId:
+        explorer.location_tracker.visit(location_id=location_id.value)
+
+    async def get_actions():
+        return [
+            await adapter.get_actions(context)
+            for context in (create_progress_manager(), explorer, create_progress_manager())
+        ]
+
+    newcomer_actions, explorer_actions, other_newcomer_actions = asyncio.run(get_actions())
+
+    assert len(newcomer_actions) != len(explorer_actions)
+    assert other_newcomer_actions is newcomer_actions
+    assert asyncio.run(adapter.get_actions(explorer)) is explorer_actions
@@ -0,0 +1,95 @@
+"""Tests of story bundles."""
+
+import random
+
+import pytest
+
+from sunlessadventure.core.adventure import LEAVE, RESOLVE, Adventure
+from sunlessadventure.core.bundle.format import HEADER, BundleError
+from sunlessadventure.core.bundle.loader import Bundle
+
+from sunlesscv.identifier import LocationId
+from sunlesscv.location.bundle import compile_bundle, create_location_factory
+from sunlesscv.location.factory import LocationFactory
+from sunlesscv.location.stable import StableLocation
+from sunlesscv.progress.manager import create_progress_manager
+
+
+@pytest.fixture(name="bundle_factory", scope="module")
+def fixture_bundle_factory():
+    """Factory of the compiled story."""
+    return create_location_factory(compile_bundle())
+
+
+def test_bundle_lists_stable_locations(bundle_factory):
+    """Stable locations are compiled, the personality location stays in code."""
+    python_factory = LocationFactory()
+    for location_id in LocationId:
+        is_stable = isinstance(python_factory.get_location(location_id.value), StableLocation)
+        assert (bundle_factory.bundle.find_location(location_id.value) is not None) == is_stable
+
+    assert set(bundle_factory.get_location_ids()) == set(python_factory.get_location_ids())
+    assert bundle_factory.get_default_location_id() == python_factory.get_default_location_id()
+
+
+@pytest.mark.parametrize("location_id", [location_id.value for location_id in LocationId])
+def test_bundle_describes_locations(bundle_factory, location_id):
+    """Locations of the bundle are described as the locations built in code."""
+    expected = Adventure(LocationFactory(), location_id, context=create_progress_manager())
+    actual = Adventure(bundle_factory, location_id, context=create_progress_manager())
+
+    assert actual.describe_location() == expected.describe_location()
+    assert actual.describe_location_json() == expected.describe_location_json()
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_bundle_walk(bundle_factory, seed):
+    """A walk over the bundle shows the same screens as a walk over the story in code."""
+    start_location_id = LocationId.HOME.value
+    expected = Adventure(LocationFactory(), start_location_id, context=create_progress_manager())
+    actual = Adventure(bundle_factory, start_location_id, context=create_progress_manager())
+    randomizer = random.Random(seed)
+
+    for _ in range(300):
+        if expected.outcome is not None:
+            assert actual.describe_consequence() == expected.describe_consequence()
+            command = RESOLVE
+        else:
+            description = expected.describe_location()
+            assert actual.describe_location() == description
+            command = randomizer.randrange(len(description["actions"]) + 1)
+            if command == len(description["actions"]):
+                if description["exit"] is None:
+                    continue
+                command = LEAVE
+
+        expected.apply((command,))
+        actual.apply((command,))
+
+
+def test_bundle_rejects_malformed_data():
+    """Data, which is not a bundle, is rejected."""
+    with pytest.raises(BundleError):
+        Bundle(b"not a bundle")
+
+    with pytest.raises(BundleError):
+        Bundle(compile_bundle()[:8])
+
+
+def test_bundle_rejects_out_of_range_indices():
+    """Indices of strings and records must refer to the content of the bundle."""
+    data = compile_bundle()
+    fields = HEADER.unpack_from(data)
+    string_count, blob_size, *table_sizes = fields[4:]
+    # The last uint32 before the reference table is the exit target of the last location
+    position = HEADER.size + (string_count + 1) * 4 + blob_size + sum(table_sizes[:-1]) * 4 - 4
+    for index in (string_count, 0xFFFFFFFE):
+        corrupted = bytearray(data)
+        corrupted[position:position + 4] = index.to_bytes(4, "little")
+        with pytest.raises(BundleError):
+            Bundle(bytes(corrupted))
+
+    corrupted = bytearray(data)
+    corrupted[8:12] = string_count.to_bytes(4, "little")
+    with pytest.raises(BundleError):
+        Bundle(bytes(corrupted))
@@ -0,0 +1,106 @@
+"""Tests of shared descriptions."""
+
+import gc
+import json
+
+import pytest
+
+from sunlessadventure.core.cache import DescriptionCache
+from sunlessadventure.core.depiction.static import StaticDepiction
+from sunlessadventure.core.location.static import StaticLocation
+from sunlessadventure.core.outcome.static import StaticConsequence
+
+from sunlesscv.identifier import LocationId
+from sunlesscv.location.factory import LocationFactory
+from sunlesscv.progress.manager import create_progress_manager
+
+
+class _VolatileLocation(StaticLocation):
+    """Location, which content may change at any moment."""
+
+    __slots__ = ()
+
+    def get_state_key(self, context):
+        """Get no state key, so the location is never cached."""
+        return None
+
+
+def _create_depiction():
+    """Create a depiction of a test location."""
+    return StaticDepiction(title="Title", description="Description", image="image.svg")
+
+
+def test_location_is_described_once_for_all_sessions():
+    """Sessions share the description of a static location."""
+    cache = DescriptionCache()
+    location = LocationFactory().get_location(LocationId.HOME.value)
+
+    description = cache.describe_location(location, create_progress_manager())
+
+    assert cache.describe_location(location, create_progress_manager()) is description
+    assert cache.encode_location(location, create_progress_manager()) is (
+        cache.encode_location(location, create_progress_manager())
+    )
+
+
+def test_location_is_described_per_state_key():
+    """A location, that depends on the progress, is described once per state key."""
+    cache = DescriptionCache()
+    location = LocationFactory().get_location(LocationId.PERSONALITY.value)
+    trusted = create_progress_manager()
+    distrusted = create_progress_manager()
+    distrusted.distrust_tracker.is_distrusted = True
+
+    trusted_description = cache.describe_location(location, trusted)
+    distrusted_description = cache.describe_location(location, distrusted)
+
+    assert trusted_description != distrusted_description
+    assert cache.describe_location(location, create_progress_manager()) is trusted_description
+    assert cache.describe_location(location, distrusted) is distrusted_description
+
+
+def test_location_without_state_key_is_not_cached():
+    """A location without a state key is described on every call."""
+    cache = DescriptionCache()
+    location = _VolatileLocation(location_id="volatile", depiction=_create_depiction())
+
+    description = cache.describe_location(location, None)
+
+    assert cache.describe_location(location, None) == description
+    assert cache.describe_location(location, None) is not description
+
+
+def test_consequence_is_described_once():
+    """Sessions share the description of a consequence."""
+    cache = DescriptionCache()
+    consequence = StaticConsequence(depiction=_create_depiction(), resolution="Resolve")
+
+    description = cache.describe_consequence(consequence)
+
+    assert cache.describe_consequence(consequence) is description
+    encoded_description = cache.encode_consequence(consequence)
+    assert cache.encode_consequence(consequence) is encoded_description
+    assert json.loads(encoded_description) == json.loads(json.dumps(description, default=dict))
+
+
+def test_descriptions_are_immutable():
+    """Descriptions can't be changed by a session."""
+    cache = DescriptionCache()
+    location = LocationFactory().get_location(LocationId.HOME.value)
+    description = cache.describe_location(location, create_progress_manager())
+
+    assert isinstance(description["actions"], tuple)
+    with pytest.raises(TypeError):
+        description["exit"] = "changed"
+
+
+def test_entries_die_with_described_objects():
+    """Entries don't keep described objects alive."""
+    cache = DescriptionCache()
+    location = StaticLocation(location_id="temporary", depiction=_create_depiction())
+    cache.describe_location(location, None)
+
+    del location
+    gc.collect()
+
+    assert not cache._descriptions  # pylint: disable=protected-access
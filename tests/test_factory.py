@@ -0,0 +1,85 @@
+"""Tests of the location factory of Sunless CV."""
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+from sunlessadventure.abstract.location import LocationError
+from sunlessadventure.core.location.static import StaticLocation
+
+from sunlesscv.identifier import LocationId
+from sunlesscv.location import factory
+from sunlesscv.location.factory import LocationFactory, register_location
+
+
+_LAZY_MODULE = '''
+from sunlessadventure.core.depiction.static import StaticDepiction
+from sunlessadventure.core.location.static import StaticLocation
+
+
+def create_location():
+    return StaticLocation(
+        location_id="lazy",
+        depiction=StaticDepiction(title="Lazy", description="Lazy", image="lazy.svg"),
+    )
+'''
+
+
+@pytest.fixture(name="lazy_module_name")
+def fixture_lazy_module_name(tmp_path, monkeypatch):
+    """Name of a module with a location, that is registered by reference."""
+    (tmp_path / "lazy_story.py").write_text(_LAZY_MODULE)
+    monkeypatch.syspath_prepend(str(tmp_path))
+    # pylint: disable=protected-access
+    monkeypatch.setattr(factory, "_BUILDERS", dict(factory._BUILDERS))
+    monkeypatch.delitem(sys.modules, "lazy_story", raising=False)
+    register_location("lazy", "lazy_story:create_location")
+    return "lazy_story"
+
+
+def test_location_is_imported_on_request(lazy_module_name):
+    """The module of a location is imported, when the location is requested first."""
+    location_factory = LocationFactory()
+    assert "lazy" in location_factory.get_location_ids()
+    assert lazy_module_name not in sys.modules
+
+    location = location_factory.get_location("lazy")
+
+    assert lazy_module_name in sys.modules
+    assert isinstance(location, StaticLocation)
+    assert location_factory.get_location("lazy") is location
+
+
+def test_unknown_location():
+    """Unknown locations can't be built."""
+    with pytest.raises(LocationError):
+        LocationFactory().get_location("unknown")
+
+
+def test_default_location():
+    """Players, who got lost, end up in the maze."""
+    assert LocationFactory().get_default_location().get_id() == LocationId.MAZE.value
+
+
+def test_story_is_imported_lazily():
+    """Creating a factory and listing the locations doesn't import the story."""
+    code = (
+        "import sys\n"
+        "from sunlesscv.location.factory import LocationFactory\n"
+        "LocationFactory().get_location_ids()\n"
+        "LocationFactory().get_location('home')\n"
+        "print(sorted(name for name in sys.modules if '._story.' in name))\n"
+    )
+    docs_directory = os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, "docs")
+
+    output = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=docs_directory,
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+
+    assert output.strip() == "['sunlesscv.location._story.home']"
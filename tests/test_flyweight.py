@@ -0,0 +1,67 @@
+"""Tests of shared content objects."""
+
+import pytest
+
+from sunlessadventure.core.depiction.static import StaticDepiction
+from sunlessadventure.core.flyweight import intern_string
+from sunlessadventure.core.outcome.static import StaticDetail
+
+from sunlesscv.location.factory import LocationFactory
+from sunlesscv.progress.manager import create_progress_manager
+
+
+def test_equal_depictions_are_shared():
+    """Depictions with the same content are the same object."""
+    depiction = StaticDepiction(title="Title", description="Description", image="image.svg")
+
+    assert StaticDepiction("Title", "Description", "image.svg") is depiction
+    assert StaticDepiction("Title", "Other description", "image.svg") is not depiction
+    assert depiction.get_title() == "Title"
+    assert depiction.get_description() == "Description"
+    assert depiction.get_image() == "image.svg"
+
+
+def test_equal_details_are_shared():
+    """Details with the same content are the same object."""
+    detail = StaticDetail(description="Description", image="image.svg")
+
+    assert StaticDetail("Description", "image.svg") is detail
+    assert StaticDetail("Description", "other.svg") is not detail
+
+
+@pytest.mark.parametrize("cls, arguments", [
+    (StaticDepiction, ("Title", "Description", "image.svg")),
+    (StaticDetail, ("Description", "image.svg")),
+])
+def test_content_has_no_dict(cls, arguments):
+    """Content objects keep their attributes in slots."""
+    instance = cls(*arguments)
+
+    assert not hasattr(instance, "__dict__")
+    with pytest.raises(AttributeError):
+        instance.extra = None
+
+
+def test_images_are_interned():
+    """Images of the story are interned strings."""
+    image = "".join(["cast", "le.svg"])
+
+    assert intern_string(image) is intern_string("castle.svg")
+
+
+def test_story_shares_depictions():
+    """Locations built by different factories share their depictions."""
+    location_factory = LocationFactory()
+    other_location_factory = LocationFactory()
+    context = create_progress_manager()
+
+    for location_id in location_factory.get_location_ids():
+        location = location_factory.get_location(location_id)
+        other_location = other_location_factory.get_location(location_id)
+        assert location.get_depiction(context) is other_location.get_depiction(context)
+
+        actions = location.get_actions(context)
+        other_actions = other_location.get_actions(context)
+        assert len(actions) == len(other_actions)
+        for action, other_action in zip(actions, other_actions):
+            assert action.get_depiction() is other_action.get_depiction()
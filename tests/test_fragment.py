@@ -0,0 +1,133 @@
+"""Tests of pre-rendered fragments of static screens."""
+
+import random
+from html.parser import HTMLParser
+from types import MappingProxyType
+
+import pytest
+
+from sunlessadventure.core.adventure import Adventure
+
+from sunlesscv.fragment import (
+    STATIC_STATE_KEY,
+    get_fragment_key,
+    render_fragments,
+    render_location,
+)
+from sunlesscv.identifier import LocationId
+from sunlesscv.location.factory import LocationFactory
+from sunlesscv.progress.manager import create_progress_manager
+
+
+class _Sprites(dict):
+    """Symbols of all images in one sprite."""
+
+    def __missing__(self, image):
+        return {"href": f"sprite.svg#{image}", "view_box": "0 0 1 1"}
+
+
+class _SlotParser(HTMLParser):
+    """Parser of the texts of the slots of a fragment and the attributes of its elements.
+
+    Texts of the slots are listed in the order of the slots by their names.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.slots = {}
+        self.attributes = []
+        self._slot = None
+
+    def handle_starttag(self, tag, attrs):
+        attributes = dict(attrs)
+        self.attributes.append(attributes)
+        if "data-sunless-slot" in attributes:
+            self._slot = self.slots.setdefault(attributes["data-sunless-slot"], [])
+            self._slot.append("")
+
+    def handle_endtag(self, tag):
+        self._slot = None
+
+    def handle_data(self, data):
+        if self._slot is not None:
+            self._slot[-1] += data
+
+
+def _parse(fragment):
+    """Parse a fragment."""
+    parser = _SlotParser()
+    parser.feed(fragment)
+    parser.close()
+    return parser
+
+
+@pytest.fixture(name="fragments", scope="module")
+def fixture_fragments():
+    """Fragments of the story of Sunless CV."""
+    return render_fragments(_Sprites())
+
+
+def test_texts_are_escaped():
+    """Texts and attributes survive markup characters."""
+    text = '<script>alert("&")</script>'
+    description = MappingProxyType({
+        "depiction": {"title": text, "description": text, "image": 'image".svg'},
+        "actions": [{"name": text, "depiction": {"title": "", "description": "", "image": ""}}],
+        "exit": text,
+    })
+
+    parser = _parse(render_location(description, _Sprites()))
+
+    assert parser.slots["title"] == [text, ""]
+    assert parser.slots["description"] == [text, ""]
+    assert parser.slots["name"] == [text]
+    assert parser.slots["exit"] == [f"← {text}"]
+    assert any(
+        attributes.get("data-sunless-image") == 'image".svg' for attributes in parser.attributes
+    )
+
+
+def test_fragments_have_slots_of_renderer(fragments):
+    """Every fragment has the slots, that the renderer patches."""
+    expected_slots = {
+        "image",
+        "title",
+        "description",
+        "actions",
+        "exit",
+        "consequence",
+        "details",
+        "resolution",
+    }
+    for fragment in fragments.values():
+        assert expected_slots <= set(_parse(fragment).slots)
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_static_screens_have_fragments(fragments, choose_command, seed):
+    """A static screen has a fragment with its texts, other screens have no fragment."""
+    adventure = Adventure(
+        LocationFactory(),
+        LocationId.HOME.value,
+        context=create_progress_manager(),
+    )
+    randomizer = random.Random(seed)
+
+    for _ in range(200):
+        fragment_key = get_fragment_key(adventure)
+        if adventure.outcome is None:
+            description = adventure.describe_location()
+            is_static = adventure.location.get_state_key(adventure.context) == STATIC_STATE_KEY
+        else:
+            description = adventure.describe_consequence()
+            consequence = adventure.outcome.get_consequences()[adventure.consequence_index]
+            is_static = consequence.get_state_key() == STATIC_STATE_KEY
+
+        if is_static:
+            slots = _parse(fragments[fragment_key]).slots
+            assert slots["title"][0] == description["depiction"]["title"]
+            assert slots["description"][0] == description["depiction"]["description"]
+        else:
+            assert fragment_key is None
+
+        adventure.step(choose_command(adventure, randomizer))
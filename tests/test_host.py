@@ -0,0 +1,69 @@
+"""Tests of the host of adventure sessions."""
+
+import random
+
+import pytest
+
+from sunlesscv.host import AdventureHost
+from sunlesscv.identifier import LocationId
+from sunlesscv.location.factory import LocationFactory
+from sunlesscv.session import SessionError, encode_session
+
+
+@pytest.fixture(name="host", scope="module")
+def fixture_host():
+    """Host of sessions."""
+    return AdventureHost()
+
+
+def test_sessions_share_locations(host):
+    """Sessions get their locations from the shared story."""
+    first = host.create_session()
+    second = host.create_session()
+
+    assert first.location is second.location
+    assert first.context is not second.context
+
+
+def test_session_starts_at_location(host):
+    """A session starts at the requested location or at the default one."""
+    assert host.create_session(LocationId.MAZE.value).location.get_id() == LocationId.MAZE.value
+    assert host.create_session("unknown").location.get_id() == (
+        host.location_factory.get_default_location_id()
+    )
+
+
+def test_session_is_restored(host):
+    """A restored session continues from its snapshot."""
+    adventure = host.create_session()
+    adventure.perform_action(0)
+    snapshot = encode_session(adventure)
+
+    restored = host.restore_session(snapshot)
+
+    assert encode_session(restored) == snapshot
+    assert restored.location is adventure.location
+
+
+def test_malformed_snapshot_is_rejected(host):
+    """A malformed snapshot can't be restored."""
+    with pytest.raises(SessionError):
+        host.restore_session(b"\x00")
+
+
+def test_interleaved_sessions_are_independent(host, choose_command):
+    """Sessions, that take turns on shared locations, play as they would alone."""
+    seeds = range(4)
+    shared_sessions = [host.create_session() for _ in seeds]
+    shared_randomizers = [random.Random(seed) for seed in seeds]
+    for _ in range(200):
+        for adventure, randomizer in zip(shared_sessions, shared_randomizers):
+            adventure.step(choose_command(adventure, randomizer))
+
+    for seed, shared_adventure in zip(seeds, shared_sessions):
+        adventure = AdventureHost(LocationFactory()).create_session()
+        randomizer = random.Random(seed)
+        for _ in range(200):
+            adventure.step(choose_command(adventure, randomizer))
+
+        assert encode_session(shared_adventure) == encode_session(adventure)
@@ -0,0 +1,110 @@
+"""Tests of session journals."""
+
+import random
+import struct
+
+import pytest
+
+from sunlessadventure.core.adventure import Adventure
+from sunlessadventure.core.journal import Journal, JournalError
+
+from sunlesscv.identifier import LocationId
+from sunlesscv.location.factory import LocationFactory
+from sunlesscv.progress.manager import create_progress_manager
+from sunlesscv.session import create_journal, decode_session, encode_session
+
+
+@pytest.fixture(name="location_factory", scope="module")
+def fixture_location_factory():
+    """Factory of the story of Sunless CV."""
+    return LocationFactory()
+
+
+def _play(location_factory, journal, choose_command, seed, steps):
+    """Play a journaled session along a random walk."""
+    adventure = Adventure(
+        location_factory,
+        LocationId.HOME.value,
+        context=create_progress_manager(),
+        journal=journal,
+    )
+    randomizer = random.Random(seed)
+    for _ in range(steps):
+        adventure.step(choose_command(adventure, randomizer))
+    return adventure
+
+
+def _restore_journal(data, location_factory):
+    """Restore a journal of a session of Sunless CV from its bytes."""
+    return Journal.from_bytes(
+        data,
+        encode_snapshot=encode_session,
+        decode_snapshot=lambda snapshot: decode_session(snapshot, location_factory)[0],
+    )
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_replay_repeats_session(location_factory, choose_command, seed):
+    """A replay ends in the state of the session."""
+    journal = create_journal(location_factory)
+    adventure = _play(location_factory, journal, choose_command, seed, 200)
+
+    assert encode_session(journal.replay()) == encode_session(adventure)
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_replay_after_compaction(location_factory, choose_command, seed):
+    """A compacted journal keeps few events and still replays the session."""
+    journal = create_journal(location_factory, compaction_size=16)
+    adventure = _play(location_factory, journal, choose_command, seed, 500)
+
+    assert len(journal.events) <= 16 + 2
+    assert journal.snapshot != encode_session(
+        Adventure(location_factory, LocationId.HOME.value, context=create_progress_manager()),
+    )
+    assert encode_session(journal.replay()) == encode_session(adventure)
+
+
+def test_partial_replay(location_factory, choose_command):
+    """A replay stops after the given number of commands."""
+    journal = create_journal(location_factory)
+    _play(location_factory, journal, choose_command, 0, 10)
+    commands = journal.get_commands()
+
+    expected, _ = decode_session(journal.snapshot, location_factory=location_factory)
+    expected.apply(commands[:4])
+
+    assert encode_session(journal.replay(4)) == encode_session(expected)
+
+
+def test_serialized_journal_replays(location_factory, choose_command):
+    """A journal restored from its bytes replays the session."""
+    journal = create_journal(location_factory)
+    adventure = _play(location_factory, journal, choose_command, 1, 100)
+    restored = _restore_journal(journal.to_bytes(), location_factory)
+
+    assert restored.get_commands() == journal.get_commands()
+    assert encode_session(restored.replay()) == encode_session(adventure)
+
+
+def test_diverging_replay_fails(location_factory, choose_command):
+    """A replay, that moves elsewhere than the session, fails."""
+    journal = create_journal(location_factory)
+    _play(location_factory, journal, choose_command, 2, 50)
+    data = bytearray(journal.to_bytes())
+    snapshot_size, location_table_size = struct.unpack_from("<HH", data)
+    location_table_start = 4 + snapshot_size
+    location_table = data[location_table_start:location_table_start + location_table_size]
+    location_count = location_table.count(b"\n") + 1
+    move_position = data.rindex(0xFF)
+    data[move_position + 1] = (data[move_position + 1] + 1) % location_count
+    restored = _restore_journal(bytes(data), location_factory)
+
+    with pytest.raises(JournalError):
+        restored.replay()
+
+
+def test_unstarted_journal_fails():
+    """A journal without a snapshot can't be replayed."""
+    with pytest.raises(JournalError):
+        create_journal().replay()
@@ -0,0 +1,158 @@
+"""Tests of linked stories."""
+
+import os
+import random
+import subprocess
+import sys
+
+import pytest
+
+from sunlessadventure.abstract.location import LocationError
+from sunlessadventure.abstract.location import LocationFactory as AbstractLocationFactory
+from sunlessadventure.core.action.static import StaticAction
+from sunlessadventure.core.adventure import Adventure
+from sunlessadventure.core.depiction.static import StaticDepiction
+from sunlessadventure.core.linker import LinkError, LinkedStory
+from sunlessadventure.core.location.static import StaticLocation
+from sunlessadventure.core.outcome.static import StaticOutcome
+
+from sunlesscv.host import AdventureHost
+from sunlesscv.identifier import LocationId
+from sunlesscv.location.factory import LocationFactory
+from sunlesscv.location.linker import link_story
+from sunlesscv.progress.manager import create_progress_manager
+
+
+class _CountingStory(LinkedStory):
+    """Linked story, that counts requested locations."""
+
+    __slots__ = ("requested_location_ids",)
+
+    def __init__(self, story):
+        super().__init__(
+            locations={
+                location_id: story.get_location(location_id)
+                for location_id in story.get_location_ids()
+            },
+            default_location_id=story.get_default_location_id(),
+            targets={
+                location_id: story.get_targets(location_id)
+                for location_id in story.get_location_ids()
+            },
+            links=dict(story.links),
+        )
+        self.requested_location_ids = []
+
+    def get_location(self, location_id):
+        """Get a location by its identifier and count the request."""
+        self.requested_location_ids.append(location_id)
+        return super().get_location(location_id)
+
+
+class _BrokenFactory(AbstractLocationFactory):
+    """Factory of a story, which start leads to an unknown location."""
+
+    def __init__(self):
+        depiction = StaticDepiction(title="Title", description="Description", image="image.svg")
+        self._locations = {
+            "start": StaticLocation(
+                location_id="start",
+                depiction=depiction,
+                actions=(StaticAction("Go", depiction, StaticOutcome(target="nowhere")),),
+            ),
+        }
+
+    def get_location(self, location_id):
+        """Get a location by its identifier."""
+        try:
+            return self._locations[location_id]
+        except KeyError as error:
+            raise LocationError(f"Unknown location '{location_id}'") from error
+
+    def get_default_location_id(self):
+        """Get the identifier of the default location."""
+        return "start"
+
+    def get_location_ids(self):
+        """Get identifiers of the locations."""
+        return tuple(self._locations)
+
+
+@pytest.fixture(name="story", scope="module")
+def fixture_story():
+    """Linked story of Sunless CV."""
+    return link_story()
+
+
+def test_links_cover_targets(story):
+    """Every target of the story is reached through a link."""
+    linked_locations = set(map(id, story.links.values()))
+    for location_id in story.get_location_ids():
+        for location in story.get_targets(location_id):
+            assert id(location) in linked_locations
+    assert not story.unreachable_location_ids
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_linked_adventure_matches_adventure(story, choose_command, seed):
+    """An adventure over the linked story shows the same screens and never looks locations up."""
+    counting_story = _CountingStory(story)
+    actual = Adventure(counting_story, LocationId.HOME.value, context=create_progress_manager())
+    expected = Adventure(
+        LocationFactory(),
+        LocationId.HOME.value,
+        context=create_progress_manager(),
+    )
+    counting_story.requested_location_ids.clear()
+    randomizer = random.Random(seed)
+
+    for _ in range(300):
+        if expected.outcome is None:
+            assert actual.describe_location() == expected.describe_location()
+        else:
+            assert actual.describe_consequence() == expected.describe_consequence()
+
+        command = choose_command(expected, randomizer)
+        actual.step(command)
+        expected.step(command)
+
+    assert actual.location is not None
+    assert not counting_story.requested_location_ids
+
+
+def test_host_keeps_linked_story(story):
+    """A host moves along the links of a story, that was linked ahead of time."""
+    host = AdventureHost(story)
+    assert host.location_factory is story
+
+    session = host.create_session()
+    assert session.location is story.get_location(LocationId.HOME.value)
+
+
+def test_story_isnt_linked_on_startup():
+    """Creating a host or a shell doesn't link the story, so it's imported lazily."""
+    code = (
+        "import sys\n"
+        "from sunlesscv.host import AdventureHost\n"
+        "from sunlesscv.shell import AdventureShell\n"
+        "AdventureHost()\n"
+        "AdventureShell([], {})\n"
+        "print(sorted(name for name in sys.modules if '._story.' in name))\n"
+    )
+    docs_directory = os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, "docs")
+
+    output = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=docs_directory,
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+
+    assert output.strip() == "[]"
+
+
+def test_unknown_target_is_reported():
+    """A story, which target is unknown, can't be linked."""
+    with pytest.raises(LinkError, match="nowhere"):
+        link_story(_BrokenFactory())
@@ -0,0 +1,77 @@
+"""Tests of the personality location of Sunless CV."""
+
+import pytest
+
+from sunlesscv.identifier import LocationId
+from sunlesscv.location.factory import LocationFactory
+from sunlesscv.progress.manager import create_progress_manager
+
+
+@pytest.fixture(name="location", scope="module")
+def fixture_location():
+    """Personality location."""
+    return LocationFactory().get_location(LocationId.PERSONALITY.value)
+
+
+def _create_explorer():
+    """Create progress of a player, who visited all locations."""
+    progress_manager = create_progress_manager()
+    for location_id in LocationId:
+        progress_manager.location_tracker.visit(location_id=location_id.value)
+    return progress_manager
+
+
+def _get_action_names(location, context):
+    """Get names of the available actions."""
+    return [action.get_name() for action in location.get_actions(context)]
+
+
+def test_variants_are_built_once(location):
+    """Calls in the same state return the same objects."""
+    first_context = create_progress_manager()
+    second_context = create_progress_manager()
+
+    assert location.get_actions(first_context) is location.get_actions(second_context)
+    assert location.get_depiction(first_context) is location.get_depiction(second_context)
+
+
+def test_hidden_door(location):
+    """The hidden door is revealed to players, who explored the story."""
+    assert _get_action_names(location, create_progress_manager()) == [
+        "Read",
+        "Search",
+        "Look around",
+    ]
+    assert _get_action_names(location, _create_explorer()) == [
+        "Read",
+        "Search",
+        "Look around",
+        "Push",
+    ]
+
+
+def test_secret_action(location):
+    """Pushing the hidden door makes the player distrusted and unwatched."""
+    context = _create_explorer()
+    context.watch_tracker.is_watched = True
+    secret_action = location.get_actions(context)[-1]
+
+    outcome = secret_action.perform(context)
+
+    assert outcome is secret_action.get_outcome()
+    assert context.distrust_tracker.is_distrusted
+    assert not context.watch_tracker.is_watched
+    assert _get_action_names(location, context) == ["Exit"]
+    assert location.get_depiction(context).get_title() == "Introversion"
+
+
+def test_all_actions(location):
+    """All actions hold the actions of every variant in a stable order."""
+    distrusted_context = create_progress_manager()
+    distrusted_context.distrust_tracker.is_distrusted = True
+    all_actions = location.get_all_actions()
+
+    for context in (create_progress_manager(), _create_explorer(), distrusted_context):
+        for action in location.get_actions(context):
+            assert action in all_actions
+    assert location.get_all_actions() is all_actions
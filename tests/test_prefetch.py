@@ -0,0 +1,123 @@
+"""Tests of prefetching the next steps of adventures."""
+
+import random
+
+from sunlessadventure.abstract.location import LocationError, LocationFactory
+from sunlessadventure.core.action.static import StaticAction
+from sunlessadventure.core.adventure import RESOLVE_ALL, Adventure
+from sunlessadventure.core.depiction.static import StaticDepiction
+from sunlessadventure.core.location.static import StaticExit, StaticLocation
+from sunlessadventure.core.outcome.static import StaticConsequence, StaticDetail, StaticOutcome
+
+from sunlesscv.identifier import LocationId
+from sunlesscv.location.factory import LocationFactory as SunlessLocationFactory
+from sunlesscv.progress.manager import create_progress_manager
+
+
+def _create_depiction(image):
+    """Create a depiction with an image."""
+    return StaticDepiction(title=image, description=image, image=image)
+
+
+class _ChainFactory(LocationFactory):
+    """Factory of a story "start" -> "middle" -> "end", that counts built locations."""
+
+    def __init__(self):
+        self.requested_location_ids = []
+        self._locations = {
+            "start": StaticLocation(
+                location_id="start",
+                depiction=_create_depiction("start.svg"),
+                actions=(
+                    StaticAction(
+                        "Go",
+                        _create_depiction("go.svg"),
+                        StaticOutcome(
+                            target="middle",
+                            consequences=(
+                                StaticConsequence(
+                                    depiction=_create_depiction("consequence.svg"),
+                                    resolution="Ok",
+                                    details=(StaticDetail("Detail", "detail.svg"),),
+                                ),
+                            ),
+                        ),
+                    ),
+                ),
+                exit_=StaticExit(name="Leave", target="missing"),
+            ),
+            "middle": StaticLocation(
+                location_id="middle",
+                depiction=_create_depiction("middle.svg"),
+                exit_=StaticExit(name="Leave", target="end"),
+            ),
+            "end": StaticLocation(location_id="end", depiction=_create_depiction("end.svg")),
+        }
+
+    def get_location(self, location_id):
+        """Get a location by its identifier."""
+        self.requested_location_ids.append(location_id)
+        try:
+            return self._locations[location_id]
+        except KeyError as error:
+            raise LocationError(f"Unknown location '{location_id}'") from error
+
+    def get_default_location_id(self):
+        """Get the identifier of the default location."""
+        return "start"
+
+
+def test_prefetch_by_steps():
+    """Locations and images are collected step by step and unknown targets are skipped."""
+    location_factory = _ChainFactory()
+    adventure = Adventure(location_factory, "start")
+
+    assert adventure.prefetch() == (
+        frozenset({"middle"}),
+        frozenset({"consequence.svg", "detail.svg", "middle.svg"}),
+    )
+    assert adventure.prefetch(steps=2) == (
+        frozenset({"middle", "end"}),
+        frozenset({"consequence.svg", "detail.svg", "middle.svg", "end.svg"}),
+    )
+    assert adventure.prefetch(steps=0) == (frozenset(), frozenset())
+
+
+def test_prefetch_builds_locations_once():
+    """Every location is requested once per prefetch and the adventure stays where it is."""
+    location_factory = _ChainFactory()
+    adventure = Adventure(location_factory, "start")
+    location_factory.requested_location_ids.clear()
+
+    adventure.prefetch(steps=3)
+
+    assert sorted(location_factory.requested_location_ids) == ["end", "middle", "missing"]
+    assert adventure.location.get_id() == "start"
+    assert adventure.outcome is None
+
+
+def test_prefetch_predicts_next_screens(choose_command):
+    """The next location and its images are among the prefetched ones.
+
+    Images of the current location are shown already, so they aren't prefetched again.
+    """
+    adventure = Adventure(
+        SunlessLocationFactory(),
+        LocationId.HOME.value,
+        context=create_progress_manager(),
+    )
+    randomizer = random.Random(0)
+
+    for _ in range(200):
+        location_ids, images = adventure.prefetch()
+        previous_location = adventure.location
+        adventure.step(choose_command(adventure, randomizer))
+        if adventure.outcome is not None:
+            consequence = adventure.outcome.get_consequences()[adventure.consequence_index]
+            assert consequence.get_depiction().get_image() in images
+            adventure.step(RESOLVE_ALL)
+
+        location = adventure.location
+        assert location.get_id() in location_ids
+        if location is not previous_location:
+            assert location.get_depiction(adventure.context).get_image() in images
@@ -0,0 +1,88 @@
+"""Tests of progress trackers."""
+
+import pytest
+
+from sunlesscv.identifier import CompetenceId, LocationId
+from sunlesscv.progress.bitset import BitsetLayout, BitsetTracker
+from sunlesscv.progress.competence import CompetenceTracker
+from sunlesscv.progress.location import LocationTracker
+
+
+def test_layout_assigns_bits_in_order():
+    """Identifiers get bits in their order, repeated identifiers keep their first bit."""
+    layout = BitsetLayout(["a", "b", "a", "c"])
+
+    assert layout.size == 3
+    assert [layout.get_bit(item_id) for item_id in ("a", "b", "c")] == [1, 2, 4]
+    assert layout.get_bit("unknown") == 0
+
+
+@pytest.mark.parametrize("item_ids", [("a", "c"), ["a", "c"], iter(["c", "a"])])
+def test_layout_masks_any_iterable(item_ids):
+    """Masks of groups are computed for tuples, lists and other iterables."""
+    layout = BitsetLayout(["a", "b", "c"])
+
+    assert layout.get_mask(item_ids) == 0b101
+
+
+def test_layout_ignores_unknown_identifiers_in_groups():
+    """Unknown identifiers don't add bits to the mask of a group."""
+    layout = BitsetLayout(["a", "b"])
+
+    assert layout.get_mask(["b", "unknown"]) == 0b10
+    assert layout.get_mask([]) == 0
+
+
+def test_tracker_counts_marked_identifiers():
+    """The progress is the share of marked identifiers."""
+    tracker = LocationTracker(valid_location_ids=["a", "b", "c", "d"])
+
+    tracker.visit("a")
+    tracker.visit("a")
+    assert tracker.get_progress_percentage() == 25
+
+    tracker.visit_many(["b", "c", "unknown"])
+    assert tracker.mask == 0b0111
+    assert tracker.get_progress_percentage() == 75
+
+
+def test_tracker_with_empty_layout_has_no_progress():
+    """A tracker without identifiers never makes progress."""
+    tracker = BitsetTracker(BitsetLayout(()))
+
+    assert tracker.get_progress_percentage() == 0
+
+
+def test_tracker_restores_mask():
+    """A mask restores the progress and the marked identifiers."""
+    tracker = CompetenceTracker()
+    tracker.discover_many([CompetenceId.PYTHON.value, CompetenceId.JAVA.value])
+
+    restored_tracker = CompetenceTracker()
+    restored_tracker.mask = tracker.mask
+
+    assert restored_tracker.get_progress_percentage() == tracker.get_progress_percentage()
+    assert sorted(restored_tracker.get_marked_ids()) == sorted(
+        [CompetenceId.PYTHON.value, CompetenceId.JAVA.value],
+    )
+
+
+@pytest.mark.parametrize("mask", [-1, 1 << len(LocationId)])
+def test_tracker_rejects_mask_outside_layout(mask):
+    """Masks with bits, that the layout doesn't have, are rejected."""
+    tracker = LocationTracker()
+
+    with pytest.raises(ValueError):
+        tracker.mask = mask
+
+
+def test_default_layouts_cover_identifiers():
+    """Visiting every location and discovering every competence completes the progress."""
+    location_tracker = LocationTracker()
+    location_tracker.visit_many(location_id.value for location_id in LocationId)
+    competence_tracker = CompetenceTracker()
+    for competence_id in CompetenceId:
+        competence_tracker.discover(competence_id.value)
+
+    assert location_tracker.get_progress_percentage() == 100
+    assert competence_tracker.get_progress_percentage() == 100
@@ -0,0 +1,184 @@
+"""Tests of the HTTP server of Sunless CV."""
+
+import json
+
+import pytest
+
+from sunlessadventure.abstract.location import LocationError, LocationFactory
+from sunlessadventure.core.action.static import StaticAction
+from sunlessadventure.core.depiction.static import StaticDepiction
+from sunlessadventure.core.location.static import StaticLocation
+from sunlessadventure.core.outcome.static import StaticOutcome
+
+from sunlesscv.host import AdventureHost
+from sunlesscv.server import AdventureServer
+
+
+class _BrokenFactory(LocationFactory):
+    """Factory of a story, which only location leads to a location, that can't be built."""
+
+    def __init__(self, location_ids):
+        depiction = StaticDepiction(title="Title", description="Description", image="image.svg")
+        self._locations = {
+            location_id: StaticLocation(
+                location_id=location_id,
+                depiction=depiction,
+                actions=(StaticAction("Go", depiction, StaticOutcome(target="nowhere")),),
+            )
+            for location_id in location_ids
+        }
+
+    def get_location(self, location_id):
+        """Get a location by its identifier."""
+        try:
+            return self._locations[location_id]
+        except KeyError as error:
+            raise LocationError(f"Unknown location '{location_id}'") from error
+
+    def get_default_location_id(self):
+        """Get the identifier of the default location, that can't be built."""
+        return "nowhere"
+
+
+@pytest.fixture(name="server")
+def fixture_server():
+    """Server of sessions."""
+    return AdventureServer()
+
+
+@pytest.fixture(name="session_path")
+def fixture_session_path(server):
+    """Path of a new session."""
+    _, headers, _ = server.handle("POST", "/sessions")
+    return dict(headers)["Location"]
+
+
+def _get_etag(server, path):
+    """Get the ETag of a response."""
+    status, headers, _ = server.handle("GET", path)
+    assert status == 200
+    return dict(headers)["ETag"]
+
+
+def test_session_is_created(server):
+    """A new session responds with its screen."""
+    status, headers, body = server.handle("POST", "/sessions")
+
+    assert status == 201
+    assert dict(headers)["Location"].startswith("/sessions/")
+    assert json.loads(body)["screen"] == "location"
+    assert server.session_count == 1
+
+
+def test_unchanged_state_is_not_modified(server, session_path):
+    """A description of an unchanged state is answered with 304."""
+    etag = _get_etag(server, f"{session_path}/location")
+
+    status, headers, body = server.handle("GET", f"{session_path}/location", etag)
+
+    assert status == 304
+    assert dict(headers)["ETag"] == etag
+    assert body == b""
+
+
+@pytest.mark.parametrize("if_none_match", [
+    "{etag}",
+    "W/{etag}",
+    '"other", {etag}',
+    '"other",W/{etag} ',
+    "*",
+    " * ",
+])
+def test_matching_if_none_match(server, session_path, if_none_match):
+    """Lists, weak ETags and any ETag match."""
+    etag = _get_etag(server, f"{session_path}/location")
+
+    status, _, _ = server.handle(
+        "GET",
+        f"{session_path}/location",
+        if_none_match.format(etag=etag),
+    )
+
+    assert status == 304
+
+
+@pytest.mark.parametrize("if_none_match", ['"other"', 'W/"other", "another"', "", "**"])
+def test_other_if_none_match(server, session_path, if_none_match):
+    """ETags of other states don't match."""
+    status, _, _ = server.handle("GET", f"{session_path}/location", if_none_match)
+
+    assert status == 200
+
+
+def test_changed_state_is_modified(server, session_path):
+    """A description of a changed state isn't answered with 304."""
+    etag = _get_etag(server, f"{session_path}/location")
+    _, _, body = server.handle("POST", f"{session_path}/actions/0")
+    while json.loads(body)["screen"] == "consequence":
+        _, _, body = server.handle("POST", f"{session_path}/resolve")
+
+    status, headers, _ = server.handle("GET", f"{session_path}/location", etag)
+
+    assert status == 200
+    assert dict(headers)["ETag"] != etag
+
+
+def test_equal_states_share_responses(server):
+    """Sessions in the same state share ETags and bodies."""
+    _, first_headers, first_body = server.handle("POST", "/sessions")
+    _, second_headers, second_body = server.handle("POST", "/sessions")
+
+    assert dict(first_headers)["ETag"] == dict(second_headers)["ETag"]
+    assert first_body is second_body
+
+
+@pytest.mark.parametrize("path, method, expected_status", [
+    ("/unknown", "GET", 404),
+    ("/sessions/unknown/location", "GET", 404),
+    ("{session}/actions/²", "POST", 400),
+    ("{session}/actions/-1", "POST", 400),
+    ("{session}/commands", "POST", 404),
+    ("{session}/actions/999", "POST", 409),
+    ("{session}/consequence", "GET", 409),
+    ("{session}/location", "PUT", 405),
+    ("/sessions", "GET", 405),
+])
+def test_errors(server, session_path, path, method, expected_status):
+    """Requests, that can't be handled, are answered with an error."""
+    status, headers, body = server.handle(method, path.format(session=session_path))
+
+    assert status == expected_status
+    assert dict(headers)["Content-Type"] == "application/json"
+    assert "error" in json.loads(body)
+
+
+def test_session_is_deleted(server, session_path):
+    """A deleted session is unknown."""
+    status, _, _ = server.handle("DELETE", session_path)
+
+    assert status == 204
+    assert server.handle("GET", f"{session_path}/location")[0] == 404
+
+
+def test_story_failures_are_server_errors():
+    """Locations, that can't be built, are reported as errors of the server."""
+    server = AdventureServer(host=AdventureHost(_BrokenFactory(())))
+    responses = []
+
+    def start_response(status, headers):
+        responses.append((status, dict(headers)))
+
+    body = server({"REQUEST_METHOD": "POST", "PATH_INFO": "/sessions"}, start_response)
+
+    [(status, headers)] = responses
+    assert status == "500 Internal Server Error"
+    assert headers["Content-Type"] == "application/json"
+    assert "error" in json.loads(b"".join(body))
+    assert server.session_count == 0
+
+    server = AdventureServer(host=AdventureHost(_BrokenFactory(("home",))))
+    _, headers, _ = server.handle("POST", "/sessions")
+    status, _, body = server.handle("POST", f"{dict(headers)['Location']}/actions/0")
+
+    assert status == 500
+    assert "nowhere" in json.loads(body)["error"]
@@ -0,0 +1,80 @@
+"""Tests of snapshots of sessions."""
+
+import random
+
+import pytest
+
+from sunlessadventure.core.adventure import Adventure
+
+from sunlesscv.identifier import LocationId
+from sunlesscv.location.factory import LocationFactory
+from sunlesscv.progress.manager import create_progress_manager
+from sunlesscv.session import VERSION, SessionError, decode_session, encode_session
+
+
+def _get_progress(progress_manager):
+    """Get the state of the trackers."""
+    return (
+        progress_manager.location_tracker.mask,
+        progress_manager.competence_tracker.mask,
+        progress_manager.watch_tracker.is_watched,
+        progress_manager.distrust_tracker.is_distrusted,
+    )
+
+
+def _describe(adventure):
+    """Describe the current screen."""
+    if adventure.outcome is not None:
+        return adventure.describe_consequence()
+    return adventure.describe_location()
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_decoded_session_matches_encoded_session(choose_command, seed):
+    """Every state of a random walk survives encoding and decoding."""
+    location_factory = LocationFactory()
+    adventure = Adventure(location_factory, LocationId.HOME.value, create_progress_manager())
+    randomizer = random.Random(seed)
+
+    for _ in range(300):
+        snapshot = encode_session(adventure)
+        decoded_adventure, progress_manager = decode_session(snapshot, location_factory)
+
+        assert len(snapshot) == 10
+        assert encode_session(decoded_adventure) == snapshot
+        assert decoded_adventure.context is progress_manager
+        assert decoded_adventure.location is adventure.location
+        assert decoded_adventure.outcome is adventure.outcome
+        assert decoded_adventure.consequence_index == adventure.consequence_index
+        assert _get_progress(progress_manager) == _get_progress(adventure.context)
+        assert _describe(decoded_adventure) == _describe(adventure)
+
+        adventure.apply((choose_command(adventure, randomizer),))
+
+
+def test_decoded_session_continues_as_encoded_session(choose_command):
+    """A decoded session reacts to commands as the original session."""
+    adventure = Adventure(LocationFactory(), LocationId.HOME.value, create_progress_manager())
+    randomizer = random.Random(0)
+    for _ in range(50):
+        adventure.apply((choose_command(adventure, randomizer),))
+
+    decoded_adventure, _ = decode_session(encode_session(adventure), LocationFactory())
+    for _ in range(100):
+        command = choose_command(adventure, randomizer)
+        assert decoded_adventure.apply((command,))[0] == adventure.apply((command,))[0]
+        assert encode_session(decoded_adventure) == encode_session(adventure)
+
+
+@pytest.mark.parametrize("snapshot", [
+    b"",
+    bytes([VERSION]) * 9,
+    bytes([VERSION + 1, 0, 0xFF, 0, 0, 0, 0, 0, 0, 0]),
+    bytes([VERSION, len(LocationId), 0xFF, 0, 0, 0, 0, 0, 0, 0]),
+    bytes([VERSION, 0, 200, 0, 0, 0, 0, 0, 0, 0]),
+    bytes([VERSION, 0, 0xFF, 0, 0, 0xFF, 0, 0, 0, 0]),
+])
+def test_malformed_snapshot_is_rejected(snapshot):
+    """Snapshots, that don't describe a state of the story, are rejected."""
+    with pytest.raises(SessionError):
+        decode_session(snapshot)
@@ -0,0 +1,140 @@
+"""Tests of the shell, which runs a session for the page."""
+
+import json
+
+import pytest
+
+from sunlessadventure.abstract.location import LocationFactory
+from sunlessadventure.core.action.static import StaticAction
+from sunlessadventure.core.depiction.static import StaticDepiction
+from sunlessadventure.core.location.static import StaticLocation
+from sunlessadventure.core.outcome.static import StaticOutcome
+
+from sunlesscv.identifier import LocationId
+from sunlesscv.shell import AdventureShell
+
+
+class _Sprites(dict):
+    """Symbols of all images in one sprite."""
+
+    def __missing__(self, image):
+        return {"href": f"sprite.svg#{image}", "view_box": "0 0 1 1"}
+
+
+class _LoopFactory(LocationFactory):
+    """Factory of a story, which home has an action, that leads back home."""
+
+    def __init__(self):
+        depiction = StaticDepiction(title="Home", description="Home", image="home.svg")
+        self._location = StaticLocation(
+            location_id=LocationId.HOME.value,
+            depiction=depiction,
+            actions=(StaticAction("Stay", depiction, StaticOutcome(LocationId.HOME.value)),),
+        )
+
+    def get_location(self, location_id):
+        """Get the only location."""
+        return self._location
+
+    def get_default_location_id(self):
+        """Get the identifier of the default location."""
+        return LocationId.HOME.value
+
+
+@pytest.fixture(name="shell")
+def fixture_shell():
+    """Shell with a started session, which page shows the fragment of home."""
+    shell = AdventureShell(fragment_keys=(LocationId.HOME.value,), sprites=_Sprites())
+    shell.handle(json.dumps(["start", None, "", LocationId.HOME.value]))
+    return shell
+
+
+def _send(shell, *message):
+    """Send a message to the shell and decode the answer."""
+    return json.loads(shell.handle(json.dumps(message)))
+
+
+def test_start_without_changes(shell):
+    """The page, that shows the current screen, gets neither a screen nor a token."""
+    message = _send(shell, "start", None, "", LocationId.HOME.value)
+
+    assert "screen" not in message
+    assert "token" not in message
+    assert message["location"] == LocationId.HOME.value
+
+
+def test_new_screen_has_token(shell):
+    """Every applied command gets a new token."""
+    first = _send(shell, "command", "0", 0)
+    second = _send(shell, "command", "resolve" if "location" not in first else "0", first["token"])
+
+    assert first["token"] == 1
+    assert second["token"] == 2
+
+
+def test_command_from_stale_screen_is_dropped(shell):
+    """A command sent again from the screen, that the page left, isn't applied."""
+    message = _send(shell, "command", "0", 0)
+    session = message["session"]
+
+    stale_message = _send(shell, "command", "0", 0)
+
+    assert "another screen" in stale_message["error"]
+    assert _send(shell, "start", session, "", None)["session"] == session
+
+
+def test_command_from_equal_screen_is_dropped():
+    """A command sent twice from a screen, that the command leaves unchanged, is applied once."""
+    shell = AdventureShell(fragment_keys=(), sprites=_Sprites(), location_factory=_LoopFactory())
+    token = _send(shell, "start", None, "", None)["token"]
+
+    message = _send(shell, "command", "0", token)
+    stale_message = _send(shell, "command", "0", token)
+
+    assert "screen" not in message
+    assert message["token"] == token + 1
+    assert "another screen" in stale_message["error"]
+
+
+def test_command_without_token_is_applied(shell):
+    """Tokens are optional."""
+    message = _send(shell, "command", "0")
+
+    assert "screen" in message
+    assert "error" not in message
+
+
+def test_pending_command_after_restart(shell):
+    """A restarted session accepts commands from its first screen."""
+    _send(shell, "command", "0", 0)
+    _send(shell, "start", None, "", LocationId.HOME.value)
+
+    assert "error" not in _send(shell, "command", "0", 0)
+
+
+@pytest.mark.parametrize("message", [
+    ["unknown"],
+    ["command", "leave", 0],
+    ["command", "999", 0],
+    ["command", "nothing", 0],
+    ["command", "-1", 0],
+    ["command", "\u0661", 0],
+    ["command", 0, 0],
+    ["command"],
+])
+def test_errors(shell, message):
+    """Messages, that can't be handled, are answered with an error."""
+    assert "error" in _send(shell, *message)
+
+
+def test_command_before_start():
+    """Commands need a started session."""
+    shell = AdventureShell(fragment_keys=(), sprites=_Sprites())
+
+    assert "error" in _send(shell, "command", "0", 0)
+
+
+def test_prefetch_reports_new_files_once(shell):
+    """Files are prefetched once."""
+    assert json.loads(shell.prefetch()) == {"prefetch": ["sprite.svg"]}
+    assert shell.prefetch() is None
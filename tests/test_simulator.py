@@ -0,0 +1,88 @@
+"""Tests of the simulator."""
+
+import pytest
+
+from sunlessadventure.abstract.location import LocationError, LocationFactory
+from sunlessadventure.core.action.static import StaticAction
+from sunlessadventure.core.depiction.static import StaticDepiction
+from sunlessadventure.core.location.static import StaticLocation
+from sunlessadventure.core.outcome.static import StaticOutcome
+from sunlessadventure.simulator import (
+    CoveragePolicy,
+    DeadEndError,
+    Simulator,
+    UniformPolicy,
+    create_policy_by_name,
+    format_report,
+)
+
+from sunlesscv.location.factory import LocationFactory as SunlessLocationFactory
+from sunlesscv.progress.manager import create_progress_manager
+
+
+class _DeadEndFactory(LocationFactory):
+    """Factory of a story, which start leads to a location without commands."""
+
+    def __init__(self):
+        depiction = StaticDepiction(title="Title", description="Description", image="image.svg")
+        self._locations = {
+            "start": StaticLocation(
+                location_id="start",
+                depiction=depiction,
+                actions=(StaticAction("Go", depiction, StaticOutcome(target="end")),),
+            ),
+            "end": StaticLocation(location_id="end", depiction=depiction),
+        }
+
+    def get_location(self, location_id):
+        """Get a location by its identifier."""
+        try:
+            return self._locations[location_id]
+        except KeyError as error:
+            raise LocationError(f"Unknown location '{location_id}'") from error
+
+    def get_default_location_id(self):
+        """Get the identifier of the default location."""
+        return "start"
+
+    def get_location_ids(self):
+        """Get identifiers of the locations."""
+        return tuple(self._locations)
+
+
+@pytest.mark.parametrize("policy", ["uniform", "coverage", "script"])
+def test_simulation_stops_at_dead_end(policy):
+    """Sessions stop at a dead end and the dead end is reported."""
+    simulator = Simulator(_DeadEndFactory())
+
+    report = simulator.run(
+        sessions=3,
+        steps=10,
+        create_policy=lambda session: create_policy_by_name(policy, session, script=["0"]),
+    )
+
+    assert report["dead_ends"] == {"end": 3}
+    assert report["steps"] == 3
+    assert "dead end: end in 3 sessions" in format_report(report)
+
+
+@pytest.mark.parametrize("policy_class", [UniformPolicy, CoveragePolicy])
+def test_policy_rejects_location_without_commands(policy_class):
+    """Policies don't choose a command in a location without commands."""
+    with pytest.raises(DeadEndError):
+        policy_class(seed=0).choose({"id": "end", "actions": (), "exit": None})
+
+
+def test_simulation_of_sunless_cv_plays_every_step():
+    """Sessions of Sunless CV never get stuck."""
+    simulator = Simulator(SunlessLocationFactory(), create_context=create_progress_manager)
+
+    report = simulator.run(
+        sessions=2,
+        steps=200,
+        create_policy=lambda session: create_policy_by_name("coverage", session),
+    )
+
+    assert report["steps"] == 400
+    assert report["dead_ends"] == {}
+    assert report["rejected_commands"] == 0
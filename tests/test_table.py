@@ -0,0 +1,107 @@
+"""Tests of adventures over story tables."""
+
+import random
+
+import pytest
+
+from sunlessadventure.core.adventure import Adventure, AdventureStateError
+from sunlessadventure.core.table import StoryTable, TableAdventure
+
+from sunlesscv.identifier import LocationId
+from sunlesscv.location.bundle import compile_bundle, create_location_factory
+from sunlesscv.location.factory import LocationFactory
+from sunlesscv.progress.manager import create_progress_manager
+
+
+@pytest.fixture(name="story_table", scope="module")
+def fixture_story_table():
+    """Table of the compiled story."""
+    return StoryTable(create_location_factory(compile_bundle()))
+
+
+def _create_adventures(story_table, start_location_id):
+    """Create an adventure over the table and an adventure over the story in code."""
+    return (
+        TableAdventure(story_table, start_location_id, context=create_progress_manager()),
+        Adventure(LocationFactory(), start_location_id, context=create_progress_manager()),
+    )
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_table_adventure_matches_adventure(story_table, seed):
+    """Both engines show the same screens and make the same progress."""
+    actual, expected = _create_adventures(story_table, LocationId.HOME.value)
+    randomizer = random.Random(seed)
+
+    for _ in range(300):
+        if expected.outcome is not None:
+            assert actual.describe_consequence() == expected.describe_consequence()
+            assert actual.describe_consequence_json() == expected.describe_consequence_json()
+            actual.resolve_consequence()
+            expected.resolve_consequence()
+            continue
+
+        description = expected.describe_location()
+        assert actual.describe_location() == description
+        assert actual.describe_location_json() == expected.describe_location_json()
+
+        command = randomizer.randrange(len(description["actions"]) + 1)
+        if command < len(description["actions"]):
+            actual.perform_action(command)
+            expected.perform_action(command)
+        elif description["exit"] is not None:
+            actual.leave_location()
+            expected.leave_location()
+
+    for tracker_name in ("location_tracker", "competence_tracker"):
+        assert getattr(actual.context, tracker_name).mask == (
+            getattr(expected.context, tracker_name).mask
+        )
+    assert actual.context.watch_tracker.is_watched == expected.context.watch_tracker.is_watched
+    assert actual.context.distrust_tracker.is_distrusted == (
+        expected.context.distrust_tracker.is_distrusted
+    )
+
+
+def test_table_adventure_starts_at_default_location(story_table):
+    """An unknown start location is replaced with the default location."""
+    actual, expected = _create_adventures(story_table, "unknown")
+
+    assert actual.describe_location() == expected.describe_location()
+
+
+def test_table_adventure_rejects_blocked_commands(story_table):
+    """Commands, that the current screen doesn't offer, are rejected as by Adventure."""
+    adventure, _ = _create_adventures(story_table, LocationId.HOME.value)
+
+    with pytest.raises(AdventureStateError):
+        adventure.leave_location()
+    with pytest.raises(AdventureStateError):
+        adventure.resolve_consequence()
+    with pytest.raises(AdventureStateError):
+        adventure.describe_consequence()
+    with pytest.raises(AdventureStateError):
+        adventure.perform_action(len(adventure.describe_location()["actions"]))
+    with pytest.raises(AdventureStateError):
+        adventure.perform_action(-1)
+
+
+def test_outcomes_of_dynamic_actions_are_added_once(monkeypatch):
+    """Outcomes of actions of locations missing in the bundle are compiled on the first step."""
+    story_table = StoryTable(create_location_factory(compile_bundle()))
+    outcomes = []
+    add_outcome = story_table.add_outcome
+    monkeypatch.setattr(
+        story_table,
+        "add_outcome",
+        lambda outcome: outcomes.append(outcome) or add_outcome(outcome),
+    )
+
+    descriptions = []
+    for _ in range(2):
+        adventure, _ = _create_adventures(story_table, LocationId.PERSONALITY.value)
+        adventure.perform_action(0)
+        descriptions.append(adventure.describe_consequence())
+
+    assert len(outcomes) == 1
+    assert descriptions[0] is descriptions[1]
@@ -0,0 +1,445 @@
+"""Benchmarks of the hot paths of the adventure engine.
+
+Run the suite and store the results::
+
+    python tools/benchmark.py --output baseline.json
+
+Compare a later run against the stored baseline::
+
+    python tools/benchmark.py --compare baseline.json --threshold 0.1
+
+The comparison exits with the status 1 if any benchmark is slower or heavier than the baseline
+by more than the threshold. Timings are the best mean of several repeats in nanoseconds per call,
+memory is in bytes.
+
+The baseline of the repository is ``tools/benchmark_baseline.json``, ``--compare`` without a path
+compares against it. Results record the machine they were measured on, and timings only compare
+on the same machine, so a warning is printed if the machines differ. Record a new baseline on
+your machine before changing the engine and refresh the committed one, when a change makes
+the engine faster or slower on purpose::
+
+    python tools/benchmark.py --output tools/benchmark_baseline.json
+"""
+
+import argparse
+import gc
+import json
+import os
+import platform
+import random
+import sys
+import time
+import tracemalloc
+
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, "docs"))
+
+# pylint: disable=wrong-import-position
+from sunlessadventure.core.adventure import Adventure, LEAVE, RESOLVE
+
+from sunlesscv.identifier import LocationId
+from sunlesscv.location.factory import LocationFactory
+from sunlesscv.progress.manager import create_progress_manager
+from sunlesscv.server import AdventureServer
+from sunlesscv.session import create_journal
+
+
+NANOSECONDS = "ns"
+BYTES = "bytes"
+
+BASELINE_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "benchmark_baseline.json")
+
+_BENCHMARKS = {}
+
+
+class BenchmarkError(Exception):
+    """Exception raised when benchmark results can't be compared."""
+
+
+def benchmark(name, unit=NANOSECONDS):
+    """Register a benchmark.
+
+    A timing benchmark accepts the number of iterations and returns the time spent in the measured
+    calls in nanoseconds. A memory benchmark accepts the number of iterations and returns the
+    number of bytes per iteration.
+
+    :param name: name of the benchmark
+    :type: str
+    :param unit: unit of the result
+    :type: str
+    :returns: decorator registering the benchmark
+    :rtype: callable
+    """
+    def register(function):
+        _BENCHMARKS[name] = (function, unit)
+        return function
+    return register
+
+
+def _register_first_touch(location_id):
+    """Register a benchmark of building a location in a fresh factory."""
+    @benchmark(f"factory.first_touch.{location_id}")
+    def measure(number):
+        clock = time.perf_counter_ns
+        elapsed = 0
+        for _ in range(number):
+            location_factory = LocationFactory()
+            start = clock()
+            location_factory.get_location(location_id)
+            elapsed += clock() - start
+        return elapsed
+
+
+for _location_id in LocationId:
+    _register_first_touch(_location_id.value)
+
+
+@benchmark("adventure.init")
+def _measure_adventure_init(number):
+    location_factory = LocationFactory()
+    contexts = [create_progress_manager() for _ in range(number)]
+
+    start = time.perf_counter_ns()
+    for context in contexts:
+        Adventure(location_factory, LocationId.HOME.value, context=context)
+    return time.perf_counter_ns() - start
+
+
+def _register_describe_location(location_id):
+    """Register a benchmark of describing a location."""
+    @benchmark(f"adventure.describe_location.{location_id}")
+    def measure(number):
+        adventure = Adventure(LocationFactory(), location_id, context=create_progress_manager())
+        describe_location = adventure.describe_location
+
+        start = time.perf_counter_ns()
+        for _ in range(number):
+            describe_location()
+        return time.perf_counter_ns() - start
+
+
+for _location_id in (LocationId.HOME, LocationId.COMPANY, LocationId.PERSONALITY):
+    _register_describe_location(_location_id.value)
+
+
+def _create_adventure_with_consequence():
+    """Create an adventure in a location with an action, that has a consequence."""
+    location_id = LocationId.COMPANY.value
+    adventure = Adventure(LocationFactory(), location_id, context=create_progress_manager())
+    for action_index, action in enumerate(adventure.location.get_actions(adventure.context)):
+        outcome = action.get_outcome()
+        if len(outcome.get_consequences()) == 1 and outcome.get_target() == location_id:
+            return adventure, action_index
+    raise BenchmarkError(f"There is no action with a consequence in '{location_id}'")
+
+
+@benchmark("adventure.describe_consequence")
+def _measure_describe_consequence(number):
+    adventure, action_index = _create_adventure_with_consequence()
+    adventure.perform_action(action_index)
+    describe_consequence = adventure.describe_consequence
+
+    start = time.perf_counter_ns()
+    for _ in range(number):
+        describe_consequence()
+    return time.perf_counter_ns() - start
+
+
+@benchmark("adventure.perform_action")
+def _measure_perform_action(number):
+    adventure, action_index = _create_adventure_with_consequence()
+    clock = time.perf_counter_ns
+    elapsed = 0
+    for _ in range(number):
+        start = clock()
+        adventure.perform_action(action_index)
+        elapsed += clock() - start
+        adventure.resolve_consequence()
+    return elapsed
+
+
+@benchmark("adventure.resolve_consequence")
+def _measure_resolve_consequence(number):
+    adventure, action_index = _create_adventure_with_consequence()
+    clock = time.perf_counter_ns
+    elapsed = 0
+    for _ in range(number):
+        adventure.perform_action(action_index)
+        start = clock()
+        adventure.resolve_consequence()
+        elapsed += clock() - start
+    return elapsed
+
+
+@benchmark("adventure.step")
+def _measure_step(number):
+    adventure, action_index = _create_adventure_with_consequence()
+    step = adventure.step
+    clock = time.perf_counter_ns
+    elapsed = 0
+    for _ in range(number):
+        start = clock()
+        step(action_index)
+        step(RESOLVE)
+        elapsed += clock() - start
+    return elapsed // 2
+
+
+def _record_transcript(steps, seed=0):
+    """Record commands of a random walk from home."""
+    adventure = Adventure(
+        LocationFactory(),
+        LocationId.HOME.value,
+        context=create_progress_manager(),
+    )
+    randomizer = random.Random(seed)
+    commands = []
+    for _ in range(steps):
+        if adventure.outcome is not None:
+            command = RESOLVE
+        else:
+            location = adventure.describe_location()
+            command_count = len(location["actions"]) + (location["exit"] is not None)
+            command = randomizer.randrange(command_count)
+            if command == len(location["actions"]):
+                command = LEAVE
+        adventure.apply((command,))
+        commands.append(command)
+    return commands
+
+
+def _register_apply(name, is_journaled):
+    """Register a benchmark of replaying a transcript."""
+    @benchmark(name)
+    def measure(number):
+        commands = _record_transcript(number)
+        location_factory = LocationFactory()
+        adventure = Adventure(
+            location_factory,
+            LocationId.HOME.value,
+            context=create_progress_manager(),
+            journal=create_journal(location_factory) if is_journaled else None,
+        )
+
+        start = time.perf_counter_ns()
+        adventure.apply(commands)
+        return time.perf_counter_ns() - start
+
+
+_register_apply("adventure.apply", is_journaled=False)
+_register_apply("adventure.apply.journal", is_journaled=True)
+
+
+def _register_server_location(name, is_conditional):
+    """Register a benchmark of requesting the current location from the server."""
+    @benchmark(name)
+    def measure(number):
+        server = AdventureServer()
+        _, headers, _ = server.handle("POST", "/sessions")
+        path = f"{dict(headers)['Location']}/location"
+        _, headers, _ = server.handle("GET", path)
+        etag = dict(headers)["ETag"] if is_conditional else None
+        handle = server.handle
+
+        start = time.perf_counter_ns()
+        for _ in range(number):
+            handle("GET", path, etag)
+        return time.perf_counter_ns() - start
+
+
+_register_server_location("server.location", is_conditional=False)
+_register_server_location("server.location.not_modified", is_conditional=True)
+
+
+def _register_progress(tracker_name):
+    """Register a benchmark of getting the progress of a tracker."""
+    @benchmark(f"tracker.get_progress_percentage.{tracker_name}")
+    def measure(number):
+        get_progress_percentage = getattr(
+            create_progress_manager(),
+            f"{tracker_name}_tracker",
+        ).get_progress_percentage
+
+        start = time.perf_counter_ns()
+        for _ in range(number):
+            get_progress_percentage()
+        return time.perf_counter_ns() - start
+
+
+for _tracker_name in ("location", "competence", "distrust", "watch"):
+    _register_progress(_tracker_name)
+
+
+@benchmark("session.memory", unit=BYTES)
+def _measure_session_memory(number):
+    location_factory = LocationFactory()
+    for location_id in LocationId:
+        location_factory.get_location(location_id.value)
+
+    gc.collect()
+    tracemalloc.start()
+    try:
+        start = tracemalloc.get_traced_memory()[0]
+        sessions = [
+            Adventure(location_factory, LocationId.HOME.value, context=create_progress_manager())
+            for _ in range(number)
+        ]
+        size = tracemalloc.get_traced_memory()[0] - start
+    finally:
+        tracemalloc.stop()
+
+    del sessions
+    return size / number
+
+
+def run_benchmarks(number=2000, repeat=5, names=None):
+    """Run benchmarks.
+
+    :param number: number of iterations in a repeat
+    :type: int
+    :param repeat: number of repeats. The best repeat is reported
+    :type: int
+    :param names: prefixes of names of the benchmarks to run. All benchmarks run if omitted
+    :type: iterable with str
+    :returns: results of the benchmarks
+    :rtype: dict
+    """
+    results = {}
+    for name, (function, unit) in _BENCHMARKS.items():
+        if names and not any(name.startswith(prefix) for prefix in names):
+            continue
+
+        if unit == BYTES:
+            value = function(number)
+        else:
+            value = min(function(number) for _ in range(repeat)) / number
+        results[name] = {"value": value, "unit": unit}
+
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "machine": describe_machine(),
+        "number": number,
+        "repeat": repeat,
+        "benchmarks": results,
+    }
+
+
+def describe_machine():
+    """Describe the machine, which runs the benchmarks.
+
+    :returns: platform, architecture, processor and number of CPUs
+    :rtype: dict
+    """
+    return {
+        "platform": platform.platform(),
+        "architecture": platform.machine(),
+        "processor": _get_processor_name(),
+        "cpus": os.cpu_count(),
+    }
+
+
+def _get_processor_name():
+    """Get the name of the processor, if the system reports it."""
+    try:
+        with open("/proc/cpuinfo", encoding="utf-8") as cpu_info:
+            for line in cpu_info:
+                if line.startswith("model name"):
+                    return line.partition(":")[2].strip()
+    except OSError:
+        pass
+    return platform.processor()
+
+
+def compare_results(results, baseline, threshold):
+    """Compare results of benchmarks against a baseline.
+
+    :param results: current results
+    :type: dict
+    :param baseline: results to compare against
+    :type: dict
+    :param threshold: allowed relative increase, e.g. 0.1 for 10%
+    :type: float
+    :returns: rows with the name, the baseline value, the current value, the ratio and whether
+        it is a regression
+    :rtype: list with tuple
+    :raises: :exc:`BenchmarkError` if units of a benchmark differ
+    """
+    rows = []
+    for name, result in results["benchmarks"].items():
+        reference = baseline.get("benchmarks", {}).get(name)
+        if reference is None:
+            continue
+        if reference["unit"] != result["unit"]:
+            raise BenchmarkError(f"Units of the benchmark '{name}' differ")
+
+        ratio = result["value"] / reference["value"] if reference["value"] else 1
+        rows.append((name, reference["value"], result["value"], ratio, ratio > 1 + threshold))
+    return rows
+
+
+def main(argv=None):
+    """Run benchmarks of the adventure engine.
+
+    :param argv: command line arguments
+    :type: list with str
+    :returns: exit status
+    :rtype: int
+    """
+    parser = argparse.ArgumentParser(description=main.__doc__.splitlines()[0])
+    parser.add_argument("--output", help="path to write the results to")
+    parser.add_argument(
+        "--compare",
+        nargs="?",
+        const=BASELINE_FILE,
+        help="path to the baseline results to compare against, the committed baseline if omitted",
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.1,
+        help="allowed relative increase over the baseline",
+    )
+    parser.add_argument("--number", type=int, default=2000, help="iterations in a repeat")
+    parser.add_argument("--repeat", type=int, default=5, help="number of repeats")
+    parser.add_argument("names", nargs="*", help="prefixes of names of benchmarks to run")
+    arguments = parser.parse_args(argv)
+
+    results = run_benchmarks(
+        number=arguments.number,
+        repeat=arguments.repeat,
+        names=arguments.names,
+    )
+
+    if arguments.output:
+        with open(arguments.output, "w", encoding="utf-8") as output_file:
+            json.dump(results, output_file, indent=2)
+
+    if not arguments.compare:
+        for name, result in results["benchmarks"].items():
+            print(f"{name:<50} {result['value']:>12.1f} {result['unit']}")
+        return 0
+
+    with open(arguments.compare, encoding="utf-8") as baseline_file:
+        baseline = json.load(baseline_file)
+    if baseline.get("machine") != results["machine"]:
+        print(
+            f"The baseline was recorded on another machine: {baseline.get('machine')}",
+            file=sys.stderr,
+        )
+
+    regressions = 0
+    for name, reference, value, ratio, is_regression in compare_results(
+        results,
+        baseline,
+        arguments.threshold,
+    ):
+        regressions += is_regression
+        marker = "REGRESSION" if is_regression else ""
+        print(f"{name:<50} {reference:>12.1f} {value:>12.1f} {ratio:>7.2f}x {marker}")
+
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
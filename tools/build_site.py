@@ -0,0 +1,576 @@
+"""Build the Python packages and the images of the site into content-hashed files.
+
+The packages ``sunlessadventure`` and ``sunlesscv`` are packed into
+``docs/dist/sunless-<hash>.zip``. The configuration ``docs/pyscript.json`` fetches the archive
+in one request and stores it as ``sunless.zip``, which the page puts on ``sys.path``. The name
+of the archive changes with its content, so browsers may cache it forever. Run the build after
+changing the packages::
+
+    python tools/build_site.py
+
+Next to every source, the archive holds bytecode compiled for the Python of Pyodide. The bytecode
+is hash-based and unchecked, so it doesn't depend on timestamps and it is imported without reading
+the source. If the version of Python in the browser differs, the magic number of the bytecode
+doesn't match and the source is compiled instead. The build must run under the same version of
+Python as Pyodide, otherwise the bytecode is left out with ``--no-bytecode``.
+
+The images of the story are minified into a library of symbols ``docs/dist/sprites-<hash>.svg``.
+The archive holds ``sprites.json``, which maps the name of every image to its symbol, and the page
+draws images with ``<use>`` from the library. The story is linked before it is packed, so
+the build fails if the story refers to an unknown location or to an image, that is missing in
+``docs/assets/img``.
+
+Static screens of the story are pre-rendered into escaped HTML fragments, see
+:mod:`sunlesscv.fragment`. The archive holds them in ``fragments.json``, so the page paints those
+screens without describing them. The fragment named by ``data-sunless-fragment`` of the adventure
+panel is written into ``docs/index.html``, so the page shows it before the adventure starts.
+
+Stable locations of the story are compiled into ``story.bundle`` in the archive, see
+:mod:`sunlesscv.location.bundle`. The page builds those locations from the bundle instead of
+importing the modules of the story.
+
+Check that the built files are up to date::
+
+    python tools/build_site.py --check
+"""
+
+import argparse
+import gc
+import hashlib
+import importlib.util
+import io
+import json
+import marshal
+import os
+import re
+import sys
+import zipfile
+from xml.etree import ElementTree
+from xml.sax.saxutils import escape, quoteattr
+
+
+SITE_DIRECTORY = os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, "docs")
+PACKAGES = ("sunlessadventure", "sunlesscv")
+DIST_DIRECTORY = "dist"
+ARCHIVE_PREFIX = "sunless-"
+ARCHIVE_FILE = "sunless.zip"
+MANIFEST_FILE = "manifest.json"
+CONFIG_FILE = "pyscript.json"
+PAGE_FILE = "index.html"
+IMAGE_DIRECTORY = "assets/img"
+SPRITE_PREFIX = "sprites-"
+SPRITE_MANIFEST_FILE = "sprites.json"
+FRAGMENT_FILE = "fragments.json"
+STORY_BUNDLE_FILE = "story.bundle"
+
+# Version of Python in Pyodide 0.24, which the site loads
+BYTECODE_VERSION = (3, 11)
+
+# Flags of a hash-based bytecode, that is not checked against its source
+_UNCHECKED_HASH = (0b01).to_bytes(4, "little")
+
+_TIMESTAMP = (1980, 1, 1, 0, 0, 0)
+
+_SVG_NAMESPACE = "http://www.w3.org/2000/svg"
+
+# Attributes, that only repeat the defaults of SVG
+_DEFAULT_ATTRIBUTES = {
+    ("class", ""),
+    ("fill-opacity", "1"),
+    ("stroke-opacity", "1"),
+    ("style", "touch-action: none;"),
+    ("transform", "translate(0,0)"),
+}
+
+_PATH_TOKEN = re.compile(r"[A-Za-z]|[-+]?(?:\d*\.\d+|\d+\.?)(?:[eE][-+]?\d+)?")
+_PAGE_IMAGE = re.compile(rf"{IMAGE_DIRECTORY}/([\w.-]+)")
+_PAGE_FRAGMENT_KEY = re.compile(r'data-sunless-fragment="([^"]+)"')
+_PAGE_FRAGMENT = re.compile(
+    r"(?<=<!-- fragment -->\n)(.*?)(?=^\s*<!-- /fragment -->)",
+    re.MULTILINE | re.DOTALL,
+)
+
+
+class BuildError(Exception):
+    """Exception raised when the site can't be built."""
+
+
+def collect_sources(site_directory=SITE_DIRECTORY, packages=PACKAGES):
+    """Collect source files of packages.
+
+    :param site_directory: directory with the packages
+    :type: str
+    :param packages: names of the packages
+    :type: iterable with str
+    :returns: paths relative to the site directory and contents of the files, sorted by path
+    :rtype: list with tuple
+    """
+    sources = []
+    for package in packages:
+        package_directory = os.path.join(site_directory, package)
+        for directory, directory_names, file_names in os.walk(package_directory):
+            directory_names[:] = sorted(name for name in directory_names if name != "__pycache__")
+            for file_name in sorted(file_names):
+                if not file_name.endswith(".py"):
+                    continue
+                path = os.path.join(directory, file_name)
+                with open(path, "rb") as source_file:
+                    sources.append((
+                        os.path.relpath(path, site_directory).replace(os.sep, "/"),
+                        source_file.read(),
+                    ))
+    return sorted(sources)
+
+
+def compile_bytecode(files):
+    """Compile source files into unchecked hash-based bytecode.
+
+    The bytecode of a module is stored next to its source, e.g. ``sunlesscv/session.pyc``, where
+    :mod:`zipimport` looks for it.
+
+    :param files: paths and contents of the source files
+    :type: iterable with tuple
+    :returns: paths and contents of the bytecode files
+    :rtype: list with tuple
+    """
+    compiled = []
+    for path, source in files:
+        code = compile(source, path, "exec", dont_inherit=True)
+        compiled.append((
+            f"{path}c",
+            importlib.util.MAGIC_NUMBER
+            + _UNCHECKED_HASH
+            + importlib.util.source_hash(source)
+            + marshal.dumps(code),
+        ))
+    return compiled
+
+
+def collect_story_images(site_directory=SITE_DIRECTORY):
+    """Collect images, which locations of Sunless CV refer to.
+
+    Depictions and details are collected from the content of every location, so images of all
+    states of a location are found.
+
+    :param site_directory: root directory of the site
+    :type: str
+    :returns: names of the images and identifiers of the locations, that refer to them
+    :rtype: dict
+    """
+    # The story is imported only to build the images, the archive is built from files
+    # pylint: disable=import-outside-toplevel
+    _add_site_path(site_directory)
+    from sunlessadventure.abstract.depiction import Depiction
+    from sunlessadventure.abstract.outcome import Detail
+    from sunlesscv.identifier import LocationId
+    from sunlesscv.location.factory import LocationFactory
+
+    location_factory = LocationFactory()
+    images = {}
+    for location_id in LocationId:
+        stack = [location_factory.get_location(location_id.value)]
+        visited = set()
+        while stack:
+            value = stack.pop()
+            if id(value) in visited:
+                continue
+            visited.add(id(value))
+
+            if isinstance(value, (Depiction, Detail)):
+                images.setdefault(value.get_image(), []).append(location_id.value)
+            stack.extend(child for child in gc.get_referents(value) if _is_content(child))
+
+    return {image: sorted(set(location_ids)) for image, location_ids in sorted(images.items())}
+
+
+def link_story(site_directory=SITE_DIRECTORY):
+    """Link the story of Sunless CV to check its targets and images.
+
+    :param site_directory: root directory of the site
+    :type: str
+    :returns: identifiers of the locations, that can't be reached
+    :rtype: tuple with str
+    :raises: :exc:`BuildError` if a target or an image is missing
+    """
+    # pylint: disable=import-outside-toplevel
+    _add_site_path(site_directory)
+    from sunlessadventure.core.linker import LinkError
+    from sunlesscv.location.linker import link_story as link_locations
+
+    try:
+        story = link_locations(image_directory=os.path.join(site_directory, IMAGE_DIRECTORY))
+    except LinkError as error:
+        raise BuildError(f"The story can't be linked:\n{error}") from error
+    return story.unreachable_location_ids
+
+
+def render_story_fragments(sprite_manifest, site_directory=SITE_DIRECTORY):
+    """Pre-render static screens of Sunless CV.
+
+    :param sprite_manifest: symbols of the images by their names
+    :type: dict
+    :param site_directory: root directory of the site
+    :type: str
+    :returns: HTML fragments by their keys
+    :rtype: dict
+    """
+    # pylint: disable=import-outside-toplevel
+    _add_site_path(site_directory)
+    from sunlesscv.fragment import render_fragments
+
+    return render_fragments(sprite_manifest)
+
+
+def compile_story_bundle(site_directory=SITE_DIRECTORY):
+    """Compile stable locations of Sunless CV into a story bundle.
+
+    :param site_directory: root directory of the site
+    :type: str
+    :returns: content of the bundle
+    :rtype: bytes
+    :raises: :exc:`BuildError` if a location can't be compiled
+    """
+    # pylint: disable=import-outside-toplevel
+    _add_site_path(site_directory)
+    from sunlessadventure.core.bundle.format import BundleError
+    from sunlesscv.location.bundle import compile_bundle
+
+    try:
+        return compile_bundle()
+    except BundleError as error:
+        raise BuildError(f"The story can't be compiled: {error}") from error
+
+
+def _add_site_path(site_directory):
+    """Make the packages of the site importable."""
+    if site_directory not in sys.path:
+        sys.path.insert(0, site_directory)
+
+
+def _is_content(value):
+    """Check if a value may hold depictions of a story."""
+    if isinstance(value, (tuple, list, dict, frozenset, set)):
+        return True
+    return type(value).__module__.startswith(("sunlessadventure.", "sunlesscv."))
+
+
+def minify_svg(content):
+    """Minify an SVG image into the content of a symbol.
+
+    Attributes with default values are dropped, groups without attributes are unwrapped and
+    numbers of paths are written in the shortest form.
+
+    :param content: SVG image
+    :type: bytes
+    :returns: view box and markup of the children of the image
+    :rtype: tuple with str
+    :raises: :exc:`BuildError` if the image is malformed
+    """
+    try:
+        root = ElementTree.fromstring(content)
+    except ElementTree.ParseError as error:
+        raise BuildError(f"Malformed SVG: {error}") from error
+    if root.tag != f"{{{_SVG_NAMESPACE}}}svg":
+        raise BuildError(f"Unexpected root element '{root.tag}'")
+
+    return root.get("viewBox", ""), "".join(_minify_element(child) for child in root)
+
+
+def _minify_element(element):
+    """Minify an SVG element with its children."""
+    attributes = {
+        name: value for name, value in element.attrib.items()
+        if (name, value) not in _DEFAULT_ATTRIBUTES
+    }
+    if "d" in attributes:
+        attributes["d"] = _minify_path(attributes["d"])
+
+    markup = escape((element.text or "").strip())
+    markup += "".join(_minify_element(child) for child in element)
+    tag = element.tag.rpartition("}")[2]
+    if tag == "g" and not attributes:
+        return markup + escape((element.tail or "").strip())
+
+    start = tag + "".join(f" {name}={quoteattr(value)}" for name, value in attributes.items())
+    if markup:
+        element_markup = f"<{start}>{markup}</{tag}>"
+    else:
+        element_markup = f"<{start}/>"
+    return element_markup + escape((element.tail or "").strip())
+
+
+def _minify_path(data):
+    """Write the data of a path in the shortest form."""
+    tokens = []
+    previous_number = None
+    for token in _PATH_TOKEN.findall(data):
+        if token.isalpha():
+            tokens.append(token)
+            previous_number = None
+            continue
+
+        number = _minify_number(token)
+        if previous_number is not None and not (
+            number.startswith("-")
+            or number.startswith(".") and "." in previous_number and "e" not in previous_number
+        ):
+            tokens.append(" ")
+        tokens.append(number)
+        previous_number = number
+    return "".join(tokens)
+
+
+def _minify_number(token):
+    """Write a number of a path in the shortest form."""
+    sign = "-" if token.startswith("-") else ""
+    number = token.lstrip("+-").lower()
+    mantissa, exponent_mark, exponent = number.partition("e")
+    if "." in mantissa:
+        mantissa = mantissa.rstrip("0").rstrip(".") or "0"
+    if mantissa.startswith("0.") and len(mantissa) > 2:
+        mantissa = mantissa[1:]
+    return sign + mantissa + exponent_mark + exponent
+
+
+def build_sprite(site_directory, images):
+    """Build a library of symbols from images.
+
+    The identifier of the symbol is the name of the image without its extension.
+
+    :param site_directory: root directory of the site
+    :type: str
+    :param images: names of the images
+    :type: iterable with str
+    :returns: the library and the view boxes of the symbols by the names of the images
+    :rtype: tuple with bytes and dict
+    :raises: :exc:`BuildError` if an image is missing or malformed
+    """
+    symbols = []
+    view_boxes = {}
+    for image in images:
+        path = os.path.join(site_directory, IMAGE_DIRECTORY, image)
+        content = _read(path)
+        if content is None:
+            raise BuildError(f"Image '{image}' is missing")
+        try:
+            view_box, markup = minify_svg(content)
+        except BuildError as error:
+            raise BuildError(f"Image '{image}' can't be minified: {error}") from error
+
+        symbol_id = os.path.splitext(image)[0]
+        symbols.append(f"<symbol id={quoteattr(symbol_id)} viewBox={quoteattr(view_box)}>")
+        symbols.append(markup)
+        symbols.append("</symbol>")
+        view_boxes[image] = view_box
+
+    sprite = f'<svg xmlns="{_SVG_NAMESPACE}">' + "".join(symbols) + "</svg>\n"
+    return sprite.encode("utf-8"), view_boxes
+
+
+def check_page_images(site_directory=SITE_DIRECTORY):
+    """Check that images, which the page refers to, exist.
+
+    :param site_directory: root directory of the site
+    :type: str
+    :raises: :exc:`BuildError` if an image is missing
+    """
+    page = _read(os.path.join(site_directory, PAGE_FILE)).decode("utf-8")
+    for image in sorted(set(_PAGE_IMAGE.findall(page))):
+        if not os.path.isfile(os.path.join(site_directory, IMAGE_DIRECTORY, image)):
+            raise BuildError(f"Image '{image}' of the page is missing")
+
+
+def render_page(site_directory, fragments):
+    """Write the fragment of the initial screen into the page.
+
+    :param site_directory: root directory of the site
+    :type: str
+    :param fragments: HTML fragments by their keys
+    :type: dict
+    :returns: content of the page
+    :rtype: bytes
+    :raises: :exc:`BuildError` if the page has no place for the fragment or there is no such
+        fragment
+    """
+    page = _read(os.path.join(site_directory, PAGE_FILE)).decode("utf-8")
+    key = _PAGE_FRAGMENT_KEY.search(page)
+    if key is None or not _PAGE_FRAGMENT.search(page):
+        raise BuildError("The page has no place for a fragment")
+    if key.group(1) not in fragments:
+        raise BuildError(f"Fragment '{key.group(1)}' of the page is unknown")
+
+    indent = " " * 10
+    fragment = fragments[key.group(1)]
+    return _PAGE_FRAGMENT.sub(lambda _: f"{indent}{fragment}\n", page, count=1).encode("utf-8")
+
+
+def pack_archive(files):
+    """Pack files into a reproducible zip archive.
+
+    :param files: paths and contents of the files
+    :type: iterable with tuple
+    :returns: content of the archive
+    :rtype: bytes
+    """
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as archive:
+        for path, content in files:
+            info = zipfile.ZipInfo(path, date_time=_TIMESTAMP)
+            info.compress_type = zipfile.ZIP_DEFLATED
+            info.external_attr = 0o644 << 16
+            archive.writestr(info, content, compresslevel=9)
+    return buffer.getvalue()
+
+
+def build_site(site_directory=SITE_DIRECTORY, check=False, bytecode=True):
+    """Build the archive, its manifest and the PyScript configuration.
+
+    :param site_directory: root directory of the site
+    :type: str
+    :param check: whether to only check that the built files are up to date
+    :type: bool
+    :param bytecode: whether to add bytecode to the archive
+    :type: bool
+    :returns: manifest of the archive
+    :rtype: dict
+    :raises: :exc:`BuildError` if the check fails, the bytecode can't be compiled or an image
+        is missing
+    """
+    if bytecode and sys.version_info[:2] != BYTECODE_VERSION:
+        raise BuildError(
+            f"The bytecode must be compiled by Python {'.'.join(map(str, BYTECODE_VERSION))}, "
+            "build with --no-bytecode to leave it out"
+        )
+
+    check_page_images(site_directory)
+    unreachable_location_ids = link_story(site_directory)
+    images = collect_story_images(site_directory)
+    for image, location_ids in images.items():
+        if not os.path.isfile(os.path.join(site_directory, IMAGE_DIRECTORY, image)):
+            raise BuildError(f"Image '{image}' of locations {', '.join(location_ids)} is missing")
+
+    sprite, view_boxes = build_sprite(site_directory, images)
+    sprite_path = f"{DIST_DIRECTORY}/{SPRITE_PREFIX}{hashlib.sha256(sprite).hexdigest()[:16]}.svg"
+    sprite_manifest = {
+        image: {"href": f"{sprite_path}#{os.path.splitext(image)[0]}", "view_box": view_box}
+        for image, view_box in view_boxes.items()
+    }
+
+    files = collect_sources(site_directory)
+    entries = files
+    if bytecode:
+        entries = files + compile_bytecode(files)
+    fragments = render_story_fragments(sprite_manifest, site_directory)
+    story_bundle = compile_story_bundle(site_directory)
+    entries = sorted(entries + [
+        (SPRITE_MANIFEST_FILE, _dump_json(sprite_manifest)),
+        (FRAGMENT_FILE, _dump_json(fragments)),
+        (STORY_BUNDLE_FILE, story_bundle),
+    ])
+    archive = pack_archive(entries)
+    digest = hashlib.sha256(archive).hexdigest()
+    archive_path = f"{DIST_DIRECTORY}/{ARCHIVE_PREFIX}{digest[:16]}.zip"
+
+    manifest = {
+        "archive": archive_path,
+        "sha256": digest,
+        "bytes": len(archive),
+        "bytecode": ".".join(map(str, BYTECODE_VERSION)) if bytecode else None,
+        "files": [path for path, _ in entries],
+        "sources": len(files),
+        "source_bytes": sum(len(content) for _, content in files),
+        "sprite": sprite_path,
+        "sprite_bytes": len(sprite),
+        "unreachable_locations": list(unreachable_location_ids),
+        "fragments": len(fragments),
+        "story_bundle_bytes": len(story_bundle),
+        "images": len(images),
+        "image_bytes": sum(
+            os.path.getsize(os.path.join(site_directory, IMAGE_DIRECTORY, image))
+            for image in images
+        ),
+    }
+    outputs = {
+        archive_path: archive,
+        sprite_path: sprite,
+        f"{DIST_DIRECTORY}/{MANIFEST_FILE}": _dump_json(manifest),
+        CONFIG_FILE: _dump_json(_update_config(site_directory, archive_path)),
+        PAGE_FILE: render_page(site_directory, fragments),
+    }
+
+    if check:
+        for path, content in outputs.items():
+            if _read(os.path.join(site_directory, path)) != content:
+                raise BuildError(f"'{path}' is out of date, run the build")
+        return manifest
+
+    dist_directory = os.path.join(site_directory, DIST_DIRECTORY)
+    os.makedirs(dist_directory, exist_ok=True)
+    for file_name in os.listdir(dist_directory):
+        if f"{DIST_DIRECTORY}/{file_name}" not in outputs:
+            os.remove(os.path.join(dist_directory, file_name))
+
+    for path, content in outputs.items():
+        with open(os.path.join(site_directory, path), "wb") as output_file:
+            output_file.write(content)
+    return manifest
+
+
+def _update_config(site_directory, archive_path):
+    """Point the PyScript configuration at the archive."""
+    config = json.loads(_read(os.path.join(site_directory, CONFIG_FILE)))
+    config["fetch"] = [{"from": f"./{archive_path}", "to_file": f"./{ARCHIVE_FILE}"}]
+    return config
+
+
+def _dump_json(value):
+    """Dump a value into stable JSON."""
+    return (json.dumps(value, indent=2, ensure_ascii=False) + "\n").encode("utf-8")
+
+
+def _read(path):
+    """Read a file or return None, if there is no such file."""
+    try:
+        with open(path, "rb") as input_file:
+            return input_file.read()
+    except FileNotFoundError:
+        return None
+
+
+def main(argv=None):
+    """Build the Python packages of the site into a single archive.
+
+    :param argv: command line arguments
+    :type: list with str
+    :returns: exit status
+    :rtype: int
+    """
+    parser = argparse.ArgumentParser(description=main.__doc__.splitlines()[0])
+    parser.add_argument("--check", action="store_true", help="check that the build is up to date")
+    parser.add_argument(
+        "--no-bytecode",
+        dest="bytecode",
+        action="store_false",
+        help="leave the bytecode out of the archive",
+    )
+    arguments = parser.parse_args(argv)
+
+    try:
+        manifest = build_site(check=arguments.check, bytecode=arguments.bytecode)
+    except BuildError as error:
+        print(error, file=sys.stderr)
+        return 1
+
+    for location_id in manifest["unreachable_locations"]:
+        print(f"Location '{location_id}' can't be reached", file=sys.stderr)
+    print(
+        f"packages before: {manifest['sources']} requests, {manifest['source_bytes']} bytes\n"
+        f"packages after: 1 request, {manifest['bytes']} bytes ({manifest['archive']})\n"
+        f"images before: {manifest['images']} requests, {manifest['image_bytes']} bytes\n"
+        f"images after: 1 request, {manifest['sprite_bytes']} bytes ({manifest['sprite']})"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
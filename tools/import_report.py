@@ -0,0 +1,151 @@
+"""Report of the time spent importing the modules of the site.
+
+Run the report with::
+
+    python tools/import_report.py
+
+Every module packed by ``tools/build_site.py`` is imported in a fresh interpreter. For each module
+the report shows the time to compile its source, the time to load its bytecode instead and
+the time to execute it. The time to execute a module excludes the modules it imports. The report
+is measured under CPython, Pyodide is several times slower, but the proportions are close.
+"""
+
+import argparse
+import importlib.abc
+import importlib.util
+import json
+import marshal
+import sys
+import time
+
+from build_site import SITE_DIRECTORY, collect_sources
+
+
+class _TimingImporter(importlib.abc.MetaPathFinder, importlib.abc.Loader):
+    """Class to import modules from sources and measure the phases of the import."""
+
+    def __init__(self, files, repeat):
+        self._modules = {}
+        for path, source in files:
+            name = path[:-len(".py")].replace("/", ".")
+            is_package = name.endswith(".__init__")
+            if is_package:
+                name = name[:-len(".__init__")]
+            self._modules[name] = (path, source, is_package)
+
+        self._repeat = repeat
+        self._children_times = []
+        self.timings = {}
+
+    @property
+    def module_names(self):
+        """Names of the modules.
+
+        :getter: Returns the names of the modules, sorted
+        :type: list with str
+        """
+        return sorted(self._modules)
+
+    def find_spec(self, fullname, path=None, target=None):
+        # pylint: disable=unused-argument
+        module = self._modules.get(fullname)
+        if module is None:
+            return None
+
+        spec = importlib.util.spec_from_loader(
+            fullname,
+            self,
+            origin=f"{SITE_DIRECTORY}/{module[0]}",
+            is_package=module[2],
+        )
+        spec.has_location = True
+        return spec
+
+    def create_module(self, spec):
+        return None
+
+    def exec_module(self, module):
+        clock = time.perf_counter_ns
+        import_start = clock()
+        path, source, _ = self._modules[module.__name__]
+
+        compile_time = min(
+            _measure(compile, source, path, "exec", dont_inherit=True)
+            for _ in range(self._repeat)
+        )
+        bytecode = marshal.dumps(compile(source, path, "exec", dont_inherit=True))
+        unmarshal_time = min(_measure(marshal.loads, bytecode) for _ in range(self._repeat))
+
+        self._children_times.append(0)
+        start = clock()
+        try:
+            exec(marshal.loads(bytecode), module.__dict__)  # pylint: disable=exec-used
+        finally:
+            exec_time = clock() - start - self._children_times.pop()
+            if self._children_times:
+                self._children_times[-1] += clock() - import_start
+
+        self.timings[module.__name__] = {
+            "source_bytes": len(source),
+            "bytecode_bytes": len(bytecode),
+            "compile_ms": compile_time / 1e6,
+            "unmarshal_ms": unmarshal_time / 1e6,
+            "exec_ms": exec_time / 1e6,
+        }
+
+
+def _measure(function, *args, **kwargs):
+    """Measure a call of a function in nanoseconds."""
+    start = time.perf_counter_ns()
+    function(*args, **kwargs)
+    return time.perf_counter_ns() - start
+
+
+def create_report(repeat=5):
+    """Import all modules of the site and measure the imports.
+
+    :param repeat: number of repeats of compiling and loading. The best repeat is reported
+    :type: int
+    :returns: measurements of the modules and their total
+    :rtype: dict
+    """
+    importer = _TimingImporter(collect_sources(), repeat)
+    sys.meta_path.insert(0, importer)
+    try:
+        for name in importer.module_names:
+            importlib.import_module(name)
+    finally:
+        sys.meta_path.remove(importer)
+
+    modules = dict(sorted(importer.timings.items()))
+    total = {
+        column: sum(module[column] for module in modules.values())
+        for column in ("source_bytes", "bytecode_bytes", "compile_ms", "unmarshal_ms", "exec_ms")
+    }
+    return {"python": sys.version.split()[0], "modules": modules, "total": total}
+
+
+def main(argv=None):
+    """Print the time spent importing the modules of the site.
+
+    :param argv: command line arguments
+    :type: list with str
+    """
+    parser = argparse.ArgumentParser(description=main.__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5, help="number of repeats")
+    parser.add_argument("--json", action="store_true", help="print the report in JSON")
+    arguments = parser.parse_args(argv)
+
+    report = create_report(repeat=arguments.repeat)
+    if arguments.json:
+        print(json.dumps(report, indent=2))
+        return
+
+    columns = ("compile_ms", "unmarshal_ms", "exec_ms")
+    print(f"{'module':<50}" + "".join(f"{column:>14}" for column in columns))
+    for name, measurements in [*report["modules"].items(), ("total", report["total"])]:
+        print(f"{name:<50}" + "".join(f"{measurements[column]:>14.3f}" for column in columns))
+
+
+if __name__ == "__main__":
+    main()
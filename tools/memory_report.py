@@ -0,0 +1,151 @@
+"""Report of the memory taken by the locations of Sunless CV.
+
+Run the report with::
+
+    python tools/memory_report.py
+
+For each location the report walks the graph of its content objects and strings. The tree size
+counts an object every time it is referenced, as if nothing was shared. The shared size counts
+every object once. Their difference is the memory saved by sharing equal content. The total
+counts objects shared between locations once. The allocated size is measured with tracemalloc
+while the location is built.
+"""
+
+import argparse
+import gc
+import json
+import os
+import sys
+import tracemalloc
+
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, "docs"))
+
+# pylint: disable=wrong-import-position
+from sunlesscv.identifier import LocationId
+from sunlesscv.location.factory import LocationFactory
+
+
+_CONTAINER_TYPES = (tuple, list, dict, frozenset, set)
+
+
+def measure_content(*roots):
+    """Measure the content reachable from objects.
+
+    :param roots: objects to measure, e.g. locations
+    :type: tuple
+    :returns: number of objects and bytes with and without sharing
+    :rtype: dict
+    """
+    tree_sizes = {}
+    tree_counts = {}
+    sizes = {}
+    for root in roots:
+        _measure_tree(root, tree_sizes, tree_counts, sizes)
+
+    tree_size = sum(tree_sizes[id(root)] for root in roots)
+    return {
+        "tree_objects": sum(tree_counts[id(root)] for root in roots),
+        "shared_objects": len(sizes),
+        "tree_bytes": tree_size,
+        "shared_bytes": sum(sizes.values()),
+        "saved_bytes": tree_size - sum(sizes.values()),
+    }
+
+
+def _measure_tree(value, tree_sizes, tree_counts, sizes):
+    """Measure the tree of a content object.
+
+    :param value: content object
+    :type: object
+    :param tree_sizes: sizes of measured trees by the identity of their roots
+    :type: dict
+    :param tree_counts: numbers of objects of measured trees by the identity of their roots
+    :type: dict
+    :param sizes: sizes of unique objects by their identity
+    :type: dict
+    """
+    stack = [(value, False)]
+    while stack:
+        current, is_expanded = stack.pop()
+        key = id(current)
+        if key in tree_sizes:
+            continue
+
+        children = [child for child in gc.get_referents(current) if _is_content(child)]
+        if is_expanded:
+            tree_sizes[key] = sys.getsizeof(current) + sum(
+                tree_sizes[id(child)] for child in children
+            )
+            tree_counts[key] = 1 + sum(tree_counts[id(child)] for child in children)
+            sizes[key] = sys.getsizeof(current)
+        else:
+            stack.append((current, True))
+            stack.extend((child, False) for child in children if id(child) not in tree_sizes)
+
+
+def _is_content(value):
+    """Check if a value is a part of the content of a story."""
+    if isinstance(value, (str, *_CONTAINER_TYPES)):
+        return True
+    return type(value).__module__.startswith(("sunlessadventure.", "sunlesscv."))
+
+
+def create_report():
+    """Create a report for all locations of Sunless CV.
+
+    Objects shared between locations are counted once in the total.
+
+    :returns: measurements of the locations and of the whole story
+    :rtype: dict
+    """
+    location_factory = LocationFactory()
+    locations = {}
+    allocated_bytes = 0
+    for location_id in LocationId:
+        gc.collect()
+        tracemalloc.start()
+        try:
+            location = location_factory.get_location(location_id.value)
+            location_allocated_bytes = tracemalloc.get_traced_memory()[0]
+        finally:
+            tracemalloc.stop()
+
+        allocated_bytes += location_allocated_bytes
+        locations[location_id.value] = {
+            **measure_content(location),
+            "allocated_bytes": location_allocated_bytes,
+        }
+
+    total = {
+        **measure_content(*(
+            location_factory.get_location(location_id.value) for location_id in LocationId
+        )),
+        "allocated_bytes": allocated_bytes,
+    }
+    return {"locations": locations, "total": total}
+
+
+def main(argv=None):
+    """Print the memory taken by the locations of Sunless CV.
+
+    :param argv: command line arguments
+    :type: list with str
+    """
+    parser = argparse.ArgumentParser(description=main.__doc__.splitlines()[0])
+    parser.add_argument("--json", action="store_true", help="print the report in JSON")
+    arguments = parser.parse_args(argv)
+
+    report = create_report()
+    if arguments.json:
+        print(json.dumps(report, indent=2))
+        return
+
+    columns = ("tree_bytes", "shared_bytes", "saved_bytes", "allocated_bytes")
+    print(f"{'location':<12}" + "".join(f"{column:>17}" for column in columns))
+    for name, measurements in [*report["locations"].items(), ("total", report["total"])]:
+        print(f"{name:<12}" + "".join(f"{measurements[column]:>17}" for column in columns))
+
+
+if __name__ == "__main__":
+    main()